@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Änderungen zwischen zwei Läufen anhand stabiler Event-Fingerabdrücke.
+
+Ein Fingerabdruck (app.fingerabdruck) identifiziert eine Veranstaltung über
+normalisierten Namen, Datum, Quelle und kanonischen Link; dazu kommt ein
+Inhalts-Hash über alle Felder. fingerabdruecke.json hält pro Monatsdatei
+{fingerabdruck: [inhalts_hash, name, datum, geaendert]} des letzten Laufs. Neu,
+entfallen und geändert sind dann reine Mengenoperationen.
+
+Der letzte Bericht steht in aenderungen.json.
+
+Verwendung (für update.sh):
+    python3 aenderungen.py kurz   # z.B. "+12 neu, -3 entfallen, ~5 geändert"
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+from atomar import schreibe_atomar
+
+
+FINGERABDRUCK_DATEI = 'fingerabdruecke.json'
+BERICHT_DATEI = 'aenderungen.json'
+BERICHT_NAMEN_MAX = 50  # so viele Namen pro Kategorie und Monat landen im Bericht
+
+
+def lade_json(pfad: str) -> dict:
+    try:
+        with open(pfad, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def speichere_json(pfad: str, daten: dict) -> None:
+    schreibe_atomar(pfad, json.dumps(daten, ensure_ascii=False, separators=(',', ':')))
+
+
+def vergleiche(alt: dict[str, list], neu: dict[str, list]) -> dict[str, list[str]]:
+    """Fingerabdrücke, die neu sind, entfallen sind oder deren Inhalts-Hash sich geändert hat."""
+    alt_fp, neu_fp = alt.keys(), neu.keys()
+    return {
+        'neu': sorted(neu_fp - alt_fp),
+        'entfallen': sorted(alt_fp - neu_fp),
+        'geaendert': sorted(fp for fp in neu_fp & alt_fp if alt[fp][0] != neu[fp][0]),
+    }
+
+
+def kurzfassung(anzahl: dict[str, int]) -> str:
+    return f"+{anzahl['neu']} neu, -{anzahl['entfallen']} entfallen, ~{anzahl['geaendert']} geändert"
+
+
+def bericht_eintrag(alt: dict[str, list], neu: dict[str, list], diff: dict[str, list[str]]) -> dict:
+    """Anzahl und Beispiele (Datum + Name) pro Kategorie für aenderungen.json."""
+    def beispiele(fps, quelle):
+        return [f"{quelle[fp][2]} {quelle[fp][1]}" for fp in fps[:BERICHT_NAMEN_MAX]]
+    return {
+        'neu': len(diff['neu']),
+        'entfallen': len(diff['entfallen']),
+        'geaendert': len(diff['geaendert']),
+        'beispiele': {
+            'neu': beispiele(diff['neu'], neu),
+            'entfallen': beispiele(diff['entfallen'], alt),
+            'geaendert': beispiele(diff['geaendert'], neu),
+        },
+    }
+
+
+def gesamt(bericht: dict) -> dict[str, int]:
+    """Summen über alle Monate eines Berichts."""
+    summe = {'neu': 0, 'entfallen': 0, 'geaendert': 0}
+    for eintrag in bericht.get('monate', {}).values():
+        for art in summe:
+            summe[art] += eintrag[art]
+    return summe
+
+
+def neuer_bericht() -> dict:
+    return {'generiert': datetime.now().isoformat(timespec='seconds'), 'monate': {}}
+
+
+def main():
+    argv = sys.argv[1:]
+    if argv != ['kurz']:
+        raise SystemExit(__doc__)
+    pfad = os.path.join(os.path.dirname(os.path.abspath(__file__)), BERICHT_DATEI)
+    print(kurzfassung(gesamt(lade_json(pfad))))
+
+
+if __name__ == '__main__':
+    main()
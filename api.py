@@ -0,0 +1,241 @@
+"""JSON-Abfrage-API über die Veranstaltungen (app.py --serve).
+
+Die Events liegen sortiert (Datum, Uhrzeit, Name) in einer Liste; ihre
+Position ist die interne ID. Daneben stehen Indizes:
+
+- Datum: sortierte Datumsschlüssel (Beginn), von/bis per bisect -> ID-Bereich;
+  dazu mehrtägige Events, die vor von begonnen haben und an von noch laufen
+  (Intervall-Index) — von/bis liefert alles, was den Zeitraum berührt
+- Laufzeit (am): Intervall-Index über Beginn bis Ende -> alles, was an dem Tag
+  läuft, auch mehrtägige Events, die früher begonnen haben
+- stadt, quelle, kategorie, rubrik: Wert (casefold) -> Menge von IDs
+- Volltext (q): Wort -> Menge von IDs über Name, Ort, Stadt und Beschreibung;
+  Suchwörter treffen als Präfix (bisect auf der sortierten Wortliste)
+
+Eine Abfrage schneidet die Mengen (kleinste zuerst) und den Datumsbereich;
+kein Filter läuft über alle Events. Antworten sind paginiert (limit/offset),
+tragen ein ETag aus Datenstand und normalisierter Abfrage (If-None-Match ->
+304, ohne die Antwort zu bauen) und werden bei Bedarf gzip-komprimiert.
+
+    GET /events?stadt=Münster&von=2026-10-01&bis=2026-10-31&q=jazz&rubrik=Konzert&limit=20&offset=0
+    GET /events?am=2026-10-05   # läuft an diesem Tag
+    GET /facetten   # Städte, Quellen, Kategorien, Rubriken mit Anzahl, Zeitraum, Datenstand
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from intervall_index import IntervallIndex
+from scraper import Veranstaltung
+
+
+SERVE_HOST = '127.0.0.1'  # nur lokal erreichbar
+LIMIT_STANDARD = 50
+LIMIT_MAX = 500
+GZIP_AB = 1024  # kleinere Antworten lohnen die Kompression nicht
+
+_WORT = re.compile(r'\w{2,}')
+_FILTER = ('stadt', 'quelle', 'kategorie', 'rubrik')
+
+
+class UngueltigeAbfrage(ValueError):
+    """Parameter der Abfrage fehlerhaft (-> 400)."""
+
+
+def _woerter(text: str) -> set[str]:
+    return set(_WORT.findall(text.casefold()))
+
+
+class EventIndex:
+    """Unveränderlicher Index über eine Event-Menge; Neuladen baut einen neuen."""
+
+    def __init__(self, veranstaltungen: list[Veranstaltung], kennung: Callable[[Veranstaltung], str]):
+        veranstaltungen = sorted(veranstaltungen)
+        self.events = [{
+            'id': kennung(v),
+            'name': v.name,
+            'datum': v.datum.strftime('%Y-%m-%d'),
+            'uhrzeit': v.uhrzeit,
+            'ort': v.ort,
+            'stadt': v.stadt,
+            'link': v.link,
+            'beschreibung': v.beschreibung,
+            'quelle': v.quelle,
+            'kategorie': v.kategorie,
+            'rubrik': v.rubrik,
+            'ende': v.ende.strftime('%Y-%m-%d') if v.ist_mehrtaegig() else None,
+        } for v in veranstaltungen]
+        self._laufzeit = IntervallIndex((date.fromisoformat(e['datum']), date.fromisoformat(e['ende'] or e['datum']), i)
+                                        for i, e in enumerate(self.events))
+        self._daten = [e['datum'] for e in self.events]
+        self._nach: dict[str, dict[str, set[int]]] = {feld: {} for feld in _FILTER}
+        self._anzeige: dict[str, dict[str, str]] = {feld: {} for feld in _FILTER}  # casefold -> Originalschreibung
+        volltext: dict[str, set[int]] = {}
+        for i, e in enumerate(self.events):
+            for feld in _FILTER:
+                if e[feld]:
+                    self._nach[feld].setdefault(e[feld].casefold(), set()).add(i)
+                    self._anzeige[feld].setdefault(e[feld].casefold(), e[feld])
+            for wort in _woerter(' '.join((e['name'], e['ort'], e['stadt'], e['beschreibung']))):
+                volltext.setdefault(wort, set()).add(i)
+        self._volltext = volltext
+        self._wortliste = sorted(volltext)
+        roh = json.dumps(self.events, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        self.version = hashlib.sha256(roh).hexdigest()[:16]
+        self.geladen = datetime.now().isoformat(timespec='seconds')
+
+    def _praefix(self, wort: str) -> set[int]:
+        """IDs aller Events mit einem Wort, das mit wort beginnt."""
+        treffer = set()
+        for i in range(bisect_left(self._wortliste, wort), len(self._wortliste)):
+            if not self._wortliste[i].startswith(wort):
+                break
+            treffer |= self._volltext[self._wortliste[i]]
+        return treffer
+
+    def suche(self, von: str = '', bis: str = '', q: str = '', am: str = '', **filter: str) -> list[int]:
+        """IDs der Treffer in Sortierreihenfolge. Filterwerte mit Komma = eines davon."""
+        lo = bisect_left(self._daten, von) if von else 0
+        hi = bisect_right(self._daten, bis) if bis else len(self._daten)
+        # Vor von begonnen, aber noch nicht vorbei: läuft genau dann auch am Tag von
+        laufend = {i for i in self._laufzeit.am(date.fromisoformat(von)) if i < lo} if von else set()
+        mengen = []
+        if am:
+            mengen.append(set(self._laufzeit.am(date.fromisoformat(am))))
+        for feld, wert in filter.items():
+            if wert:
+                index = self._nach[feld]
+                mengen.append(set().union(*(index.get(w.strip().casefold(), set()) for w in wert.split(','))))
+        for wort in _woerter(q):
+            mengen.append(self._praefix(wort))
+        if not mengen:
+            return sorted(laufend) + list(range(lo, hi))
+        mengen.sort(key=len)
+        treffer = mengen[0].intersection(*mengen[1:])
+        return sorted(i for i in treffer if lo <= i < hi or i in laufend)
+
+    def _zaehle(self, feld: str) -> dict[str, int]:
+        return {self._anzeige[feld][k]: len(ids) for k, ids in sorted(self._nach[feld].items())}
+
+    def facetten(self) -> dict:
+        return {
+            'version': self.version,
+            'geladen': self.geladen,
+            'anzahl': len(self.events),
+            'von': self._daten[0] if self._daten else None,
+            'bis': self._daten[-1] if self._daten else None,
+            'staedte': self._zaehle('stadt'),
+            'quellen': self._zaehle('quelle'),
+            'kategorien': self._zaehle('kategorie'),
+            'rubriken': self._zaehle('rubrik'),
+        }
+
+
+def _datum_parameter(wert: str, name: str) -> str:
+    try:
+        return datetime.strptime(wert, '%Y-%m-%d').strftime('%Y-%m-%d') if wert else ''
+    except ValueError:
+        raise UngueltigeAbfrage(f"{name} erwartet JJJJ-MM-TT, nicht {wert!r}")
+
+
+def _zahl_parameter(wert: str, name: str, standard: int, maximum: int | None = None) -> int:
+    try:
+        zahl = int(wert) if wert else standard
+    except ValueError:
+        raise UngueltigeAbfrage(f"{name} erwartet eine Zahl, nicht {wert!r}")
+    if zahl < 0:
+        raise UngueltigeAbfrage(f"{name} darf nicht negativ sein")
+    return min(zahl, maximum) if maximum else zahl
+
+
+def beantworte(index: EventIndex, pfad: str, parameter: dict[str, str]) -> dict:
+    """Antwort-JSON für einen Pfad; wirft UngueltigeAbfrage (400) oder KeyError (404)."""
+    if pfad == '/facetten':
+        return index.facetten()
+    if pfad != '/events':
+        raise KeyError(pfad)
+    unbekannt = set(parameter) - {'von', 'bis', 'am', 'q', 'limit', 'offset', *_FILTER}
+    if unbekannt:
+        raise UngueltigeAbfrage(f"Unbekannte Parameter: {', '.join(sorted(unbekannt))}")
+    limit = _zahl_parameter(parameter.get('limit', ''), 'limit', LIMIT_STANDARD, LIMIT_MAX)
+    offset = _zahl_parameter(parameter.get('offset', ''), 'offset', 0)
+    if limit == 0:
+        raise UngueltigeAbfrage("limit muss mindestens 1 sein")
+    treffer = index.suche(von=_datum_parameter(parameter.get('von', ''), 'von'),
+                          bis=_datum_parameter(parameter.get('bis', ''), 'bis'),
+                          am=_datum_parameter(parameter.get('am', ''), 'am'),
+                          q=parameter.get('q', ''),
+                          **{feld: parameter.get(feld, '') for feld in _FILTER})
+    seite = treffer[offset:offset + limit]
+    antwort = {
+        'version': index.version,
+        'gesamt': len(treffer),
+        'offset': offset,
+        'limit': limit,
+        'events': [index.events[i] for i in seite],
+        'weiter': None,
+    }
+    if offset + limit < len(treffer):
+        antwort['weiter'] = '/events?' + urlencode({**parameter, 'offset': offset + limit, 'limit': limit})
+    return antwort
+
+
+def etag(index: EventIndex, pfad: str, parameter: dict[str, str]) -> str:
+    """Gleicher Datenstand + gleiche Abfrage = gleiche Antwort."""
+    abfrage = urlencode(sorted(parameter.items()))
+    return '"' + hashlib.sha1(f"{index.version}|{pfad}|{abfrage}".encode('utf-8')).hexdigest()[:20] + '"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'VeranstaltungenMS'
+
+    def do_GET(self):
+        teile = urlsplit(self.path)
+        parameter = dict(parse_qsl(teile.query))
+        index = self.server.index  # einmal lesen: ein Neuladen tauscht die Referenz aus
+        tag = etag(index, teile.path, parameter)
+        if tag in (t.strip() for t in self.headers.get('If-None-Match', '').split(',')):
+            self.send_response(304)
+            self.send_header('ETag', tag)
+            self.end_headers()
+            return
+        try:
+            status, antwort = 200, beantworte(index, teile.path, parameter)
+        except UngueltigeAbfrage as e:
+            status, antwort = 400, {'fehler': str(e)}
+        except KeyError:
+            status, antwort = 404, {'fehler': f"Unbekannter Pfad: {teile.path}", 'pfade': ['/events', '/facetten']}
+
+        body = json.dumps(antwort, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Vary', 'Accept-Encoding')
+        if status == 200:
+            self.send_header('ETag', tag)
+            self.send_header('Cache-Control', 'no-cache')
+        if len(body) >= GZIP_AB and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # kein Zugriffslog auf stderr
+
+
+def starte_server(index: EventIndex, port: int, host: str = SERVE_HOST) -> ThreadingHTTPServer:
+    """Startet den Server im Hintergrund; server.index kann jederzeit ersetzt werden."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.index = index
+    threading.Thread(target=server.serve_forever, name='api', daemon=True).start()
+    return server
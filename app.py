@@ -8,40 +8,73 @@ Verwendung:
     python3 app.py 2026 2       # Generiert ab Februar 2026 (3 Monate)
     python3 app.py 2026 2 6     # Generiert 6 Monate ab Februar 2026
     python3 app.py --no-browser # Ohne Browser öffnen
+    python3 app.py 2026 2 --record fixtures/  # Alle HTTP-Antworten aufzeichnen
+    python3 app.py 2026 2 --replay fixtures/  # Offline aus der Aufzeichnung (kein Netz)
+    python3 app.py --no-parse-cache  # Jede Antwort neu parsen (sonst Memo in .parse_cache/)
+    python3 app.py --parse-prozesse 4  # HTML/JSON in 4 Worker-Prozessen parsen (Standard 0 = im Abruf-Thread)
+    python3 app.py --shell      # Zusätzlich dashboard.html + daten/*.json (Monatswechsel ohne Neuladen)
+    python3 app.py --daemon --intervall 30  # Dauerbetrieb: alle 30 Minuten, nur geänderte Monate (Ende: SIGTERM)
+    python3 app.py --serve --port 8765      # JSON-API: /events?stadt=Münster&von=...&bis=...&q=... (siehe api.py)
+    python3 app.py stats [--json]           # Auswertung des Spaltenarchivs archiv/ (siehe archiv.py)
+
+Jeder Lauf schreibt außerdem iCal-Feeds zum Abonnieren nach kalender/ (siehe ical.py).
 """
 
+import hashlib
 import html as _html
+import json
 import os
 import re
-import webbrowser
+import signal
+import threading
+import time
+import traceback
 import calendar
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from dataclasses import replace
+from datetime import date, datetime, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 from scraper import (
-    hole_veranstaltungen, hole_digitalhub_events, hole_halle_muensterland_events,
-    hole_theater_muenster, hole_lwl_museum,
-    Veranstaltung,
+    aktiviere_aufnahme, aktiviere_wiedergabe, aktiviere_parse_cache, aktiviere_parse_prozesse,
+    beende_parse_prozesse, ignoriere_sigint, aktiviere_sitzungen, schliesse_sitzungen, host_statistik,
+    als_zeile, Veranstaltung,
+)
+from quellen import REGISTER, hole_alle_quellen, plane_lauf, bewerte_lauf
+from quellen_status import QuellenStatus, STATUS_DATEI
+from service_worker import SW_DATEI, REGISTRIERUNG_HTML, generiere_service_worker
+from archiv import ARCHIV_VERZEICHNIS, haenge_an
+from atomar import schreibe_atomar
+from ical import (
+    KALENDER_VERZEICHNIS, FEED_ALLE, feed_datei, feed_fuer_quelle, feed_fuer_region, schreibe_teile, schreibe_feeds,
+)
+from intervall_index import IntervallIndex
+from kategorien import RUBRIKEN, SONSTIGES, ordne_ein, reihenfolge
+from regionen import REGIONEN, kuerzel, teile_auf
+from manifest import MANIFEST_DATEI, lade_manifest, speichere_manifest, trage_ein, bereinige
+from aenderungen import (
+    FINGERABDRUCK_DATEI, BERICHT_DATEI, lade_json, speichere_json, vergleiche, kurzfassung,
+    bericht_eintrag, neuer_bericht,
 )
-# hole_regioactive_ms: deaktiviert seit 2026-04-19 (Cloudflare-Block, 403 für alle 15 Städte)
 
 
-QUELLEN = {
-    'muensterland':       'Münsterland',
-    'digitalhub':         'Digital Hub',
-    'halle_muensterland': 'Halle Münsterland',
-    # 'regioactive':        'regioactive.de',  # deaktiviert (Cloudflare-Block)
-    'theater_muenster':   'Theater Münster',
-    'lwl_museum':         'LWL-Museum',
-}
+# Abgeleitet aus dem Quellen-Register (quellen.py)
+QUELLEN = {q.schluessel: q.label for q in REGISTER}
+BADGE_CONFIG = {q.schluessel: (q.badge, q.label) for q in REGISTER}
 
-BADGE_CONFIG = {
-    'muensterland':       ('badge-muensterland', 'Münsterland'),
-    'digitalhub':         ('badge-digitalhub',   'Digital Hub'),
-    'halle_muensterland': ('badge-halle',         'Halle Münsterland'),
-    # 'regioactive':        ('badge-regioactive',   'regioactive.de'),  # deaktiviert
-    'theater_muenster':   ('badge-theater',       'Theater Münster'),
-    'lwl_museum':         ('badge-lwl',           'LWL-Museum'),
-}
+PARSE_CACHE_VERZEICHNIS = '.parse_cache'
+# Standard: im Abruf-Thread parsen. Ein Pool kostet bei jedem Lauf den Start der Prozesse und lohnt
+# erst, wenn benchmarks/bench_parse_prozesse.py bei realen Seitenzahlen einen Gewinn zeigt.
+PARSE_PROZESSE_STANDARD = 0
+RENDER_PROZESSE_MAX = os.cpu_count() or 1
+NEU_MARKIEREN = True  # Badge "neu" für Events, die im letzten Lauf für diesen Monat fehlten
+SHELL_DATEI = 'dashboard.html'
+DAEMON_INTERVALL_MINUTEN = 60
+SERVE_PORT_STANDARD = 8765  # app.py --serve
+DATEN_VERZEICHNIS = 'daten'
+WOCHENTAGE = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
 
 
 def _normalisiere(name: str) -> str:
@@ -51,6 +84,41 @@ def _normalisiere(name: str) -> str:
     return name
 
 
+_TRACKING_PARAMETER = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid)$', re.IGNORECASE)
+
+
+def kanonischer_link(link: str) -> str:
+    """Link ohne Schema-/Host-Varianten, Tracking-Parameter, Fragment und abschließenden Slash."""
+    if not link:
+        return ''
+    teile = urlsplit(link.strip())
+    host = (teile.hostname or '').removeprefix('www.')
+    if teile.port:
+        host = f"{host}:{teile.port}"
+    query = urlencode(sorted((k, w) for k, w in parse_qsl(teile.query, keep_blank_values=True)
+                             if not _TRACKING_PARAMETER.match(k)))
+    return urlunsplit(('https', host, teile.path.rstrip('/'), query, ''))
+
+
+def fingerabdruck(v: Veranstaltung) -> str:
+    """Stabile Identität eines Events: normalisierter Name, Datum, Quelle, kanonischer Link.
+
+    Uhrzeit, Ort und Beschreibung gehören nicht dazu — ändern sie sich, ist das Event
+    "geändert", nicht neu.
+    """
+    schluessel = '|'.join([_normalisiere(v.name), v.datum.strftime('%Y-%m-%d'), v.quelle, kanonischer_link(v.link)])
+    return hashlib.sha1(schluessel.encode('utf-8')).hexdigest()[:16]
+
+
+def event_hash(v: Veranstaltung) -> str:
+    """Inhalts-Hash über alle Felder der Quelle — erkennt geänderte Events bei gleichem Fingerabdruck.
+
+    Die abgeleitete Rubrik zählt nicht mit: eine geänderte Taxonomie ist keine Änderung am Event.
+    """
+    zeile = als_zeile(replace(v, rubrik=''))
+    return hashlib.sha1(json.dumps(zeile, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
 def _veranstaltung_score(v: Veranstaltung) -> int:
     score = 0
     if v.link:
@@ -111,9 +179,24 @@ def entferne_duplikate(veranstaltungen: list[Veranstaltung]) -> list[Veranstaltu
     return ergebnis
 
 
-def dateiname_fuer_monat(jahr: int, monat: int) -> str:
-    """Generiert den Dateinamen für einen Monat."""
-    return f"veranstaltungen_{jahr}_{monat:02d}.html"
+def dateiname_fuer_monat(jahr: int, monat: int, region: str = '') -> str:
+    """Generiert den Dateinamen für einen Monat (mit region: die Regionsseite, siehe regionen.py)."""
+    return f"veranstaltungen_{jahr}_{monat:02d}{'_' + kuerzel(region) if region else ''}.html"
+
+
+def daten_dateiname_fuer_monat(jahr: int, monat: int, region: str = '') -> str:
+    """Pfad (relativ zum Dashboard) der Monatsdaten für die Shell."""
+    return f"{DATEN_VERZEICHNIS}/veranstaltungen_{jahr}_{monat:02d}{'_' + kuerzel(region) if region else ''}.json"
+
+
+def laufend_index(veranstaltungen: list[Veranstaltung]) -> IntervallIndex[Veranstaltung]:
+    """Intervall-Index der mehrtägigen Events über ihre Tage (Beginn bis Ende)."""
+    return IntervallIndex((v.datum.date(), v.ende.date(), v) for v in veranstaltungen if v.ist_mehrtaegig())
+
+
+def laufzeit(v: Veranstaltung, jahr: int) -> str:
+    """Zeitangabe mehrtägiger Events: "bis 31.12.", mit Jahr nur wenn es nicht das des Monats ist."""
+    return f"bis {v.ende.strftime('%d.%m.')}" + (str(v.ende.year) if v.ende.year != jahr else '')
 
 
 def generiere_kalender(jahr: int, monat: int, tage_mit_events: set[int]) -> str:
@@ -123,7 +206,7 @@ def generiere_kalender(jahr: int, monat: int, tage_mit_events: set[int]) -> str:
 
     html = '<table class="kalender" id="kalender">\n'
     html += '<tr>'
-    for tag_name in ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']:
+    for tag_name in WOCHENTAGE:
         html += f'<th>{tag_name}</th>'
     html += '</tr>\n'
 
@@ -144,120 +227,9 @@ def generiere_kalender(jahr: int, monat: int, tage_mit_events: set[int]) -> str:
     return html
 
 
-def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
-                   verfuegbare_monate: list[tuple[int, int]]) -> str:
-    """Generiert das HTML-Dashboard."""
-    monatsnamen = [
-        '', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
-        'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember'
-    ]
-
-    # Termine nach Datum gruppieren
-    nach_datum = {}
-    for v in veranstaltungen:
-        key = v.datum.strftime('%Y-%m-%d')
-        if key not in nach_datum:
-            nach_datum[key] = []
-        nach_datum[key].append(v)
-
-    # Alle Städte für Filter
-    alle_staedte = sorted(set(v.stadt for v in veranstaltungen if v.stadt))
-
-    # Termine-HTML
-    termine_html = ""
-    for datum_key in sorted(nach_datum.keys()):
-        tage = nach_datum[datum_key]
-        datum_formatiert = tage[0].datum_formatiert()
-
-        termine_html += f'''
-        <div class="datum-gruppe" id="datum-{datum_key}">
-            <div class="datum-header">{datum_formatiert}</div>
-            <div class="termine-liste">
-        '''
-
-        for v in sorted(tage, key=lambda x: (x.uhrzeit == 'ganztägig', x.uhrzeit, x.name)):
-            name_esc = _html.escape(v.name)
-            stadt_esc = _html.escape(v.stadt)
-            uhrzeit_esc = _html.escape(v.uhrzeit)
-            ort_esc = _html.escape(v.ort) if v.ort else ''
-            kategorie_esc = _html.escape(v.kategorie) if v.kategorie else ''
-            beschreibung_escaped = _html.escape(v.beschreibung)
-            beschreibung_escaped = beschreibung_escaped[:200] if v.link else beschreibung_escaped
-            link_safe = v.link if v.link and v.link.startswith(('http://', 'https://')) else ''
-
-            # Badge für Quelle
-            badge_cls, badge_label = BADGE_CONFIG.get(v.quelle, ('badge-muensterland', 'Münsterland'))
-            badge_html = f'<span class="badge {badge_cls}">{badge_label}</span>'
-            if kategorie_esc:
-                badge_html += f' <span class="badge badge-kategorie">{kategorie_esc}</span>'
-
-            # Name: als Link oder aufklappbar
-            if link_safe:
-                name_html = f'<a href="{link_safe}" target="_blank" rel="noopener noreferrer">{name_esc}</a>'
-            else:
-                name_html = f'<span class="termin-toggle" onclick="this.closest(\'.termin\').classList.toggle(\'expanded\')">{name_esc}</span>'
-
-            termine_html += f'''
-                <div class="termin" data-stadt="{stadt_esc}" data-quelle="{v.quelle}">
-                    <div class="termin-zeit">{uhrzeit_esc}</div>
-                    <div class="termin-info">
-                        <div class="termin-name">
-                            {name_html}
-                            {badge_html}
-                        </div>
-                        <div class="termin-stadt">{stadt_esc}</div>
-                        {f'<div class="termin-ort">{ort_esc}</div>' if ort_esc else ''}
-                        {f'<div class="termin-beschreibung">{beschreibung_escaped}</div>' if beschreibung_escaped else ''}
-                    </div>
-                </div>
-            '''
-
-        termine_html += '''
-            </div>
-            <div class="zurueck-link"><a href="#kalender">&#8593; Kalender</a></div>
-        </div>
-        '''
-
-    # Filter-Optionen Stadt
-    filter_html = '<option value="">Alle Städte</option>'
-    for stadt in alle_staedte:
-        stadt_esc = _html.escape(stadt)
-        filter_html += f'<option value="{stadt_esc}">{stadt_esc}</option>'
-
-    # Dynamischer Quellen-Filter (nur vorhandene Quellen)
-    quellen_filter = '<option value="">Alle Quellen</option>'
-    vorhandene_quellen = sorted(set(v.quelle for v in veranstaltungen))
-    for q in vorhandene_quellen:
-        label = QUELLEN.get(q, q)
-        quellen_filter += f'<option value="{q}">{label}</option>'
-
-    # Monatsnavigation
-    prev_monat = monat - 1 if monat > 1 else 12
-    prev_jahr = jahr if monat > 1 else jahr - 1
-    next_monat = monat + 1 if monat < 12 else 1
-    next_jahr = jahr if monat < 12 else jahr + 1
-
-    prev_verfuegbar = (prev_jahr, prev_monat) in verfuegbare_monate
-    next_verfuegbar = (next_jahr, next_monat) in verfuegbare_monate
-
-    prev_link = dateiname_fuer_monat(prev_jahr, prev_monat) if prev_verfuegbar else "#"
-    next_link = dateiname_fuer_monat(next_jahr, next_monat) if next_verfuegbar else "#"
-
-    prev_class = "" if prev_verfuegbar else " disabled"
-    next_class = "" if next_verfuegbar else " disabled"
-
-    # Kalenderblatt generieren
-    tage_mit_events = set(int(k.split('-')[2]) for k in nach_datum.keys())
-    kalender_html = generiere_kalender(jahr, monat, tage_mit_events)
-
-    html = f'''<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Veranstaltungen Münsterland — {monatsnamen[monat]} {jahr}</title>
-    <style>
-        :root {{
+# Stylesheet aller Dashboard-Seiten (Monatsseiten und Shell)
+_CSS = '''\
+        :root {
             --bg-color: #f5f5f7;
             --card-bg: #ffffff;
             --text-color: #1d1d1f;
@@ -265,10 +237,10 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             --border-color: #d2d2d7;
             --accent-color: #347c3b;
             --hover-color: #f0f0f5;
-        }}
+        }
 
-        @media (prefers-color-scheme: dark) {{
-            :root {{
+        @media (prefers-color-scheme: dark) {
+            :root {
                 --bg-color: #1d1d1f;
                 --card-bg: #2d2d2f;
                 --text-color: #f5f5f7;
@@ -276,48 +248,48 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
                 --border-color: #424245;
                 --accent-color: #5cb85c;
                 --hover-color: #3a3a3c;
-            }}
-        }}
+            }
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: var(--bg-color);
             color: var(--text-color);
             line-height: 1.5;
             padding: 20px;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
-        }}
+        }
 
-        header {{
+        header {
             text-align: center;
             margin-bottom: 30px;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 2rem;
             font-weight: 600;
             margin-bottom: 10px;
-        }}
+        }
 
-        .nav {{
+        .nav {
             display: flex;
             justify-content: center;
             align-items: center;
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
 
-        .nav-btn {{
+        .nav-btn {
             background: var(--card-bg);
             border: 1px solid var(--border-color);
             color: var(--accent-color);
@@ -326,24 +298,50 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             cursor: pointer;
             font-size: 14px;
             text-decoration: none;
-        }}
+        }
 
-        .nav-btn:hover {{
+        .nav-btn:hover {
             background: var(--hover-color);
-        }}
+        }
 
-        .nav-btn.disabled {{
+        .nav-btn.disabled {
             opacity: 0.3;
             pointer-events: none;
             cursor: default;
-        }}
+        }
+
+        .regionen {
+            display: flex;
+            justify-content: center;
+            flex-wrap: wrap;
+            gap: 6px;
+            margin-bottom: 20px;
+            font-size: 13px;
+        }
+
+        .region-link {
+            color: var(--accent-color);
+            text-decoration: none;
+            padding: 2px 10px;
+            border: 1px solid var(--border-color);
+            border-radius: 12px;
+        }
+
+        .region-link.aktiv {
+            background: var(--accent-color);
+            color: white;
+        }
 
-        .monat-titel {{
+        .abo-link {
+            border-style: dashed;
+        }
+
+        .monat-titel {
             font-size: 1.2rem;
             font-weight: 500;
-        }}
+        }
 
-        .filter-bar {{
+        .filter-bar {
             display: flex;
             justify-content: space-between;
             align-items: center;
@@ -360,156 +358,161 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             top: 8px;
             z-index: 100;
             box-shadow: 0 2px 8px rgba(0, 0, 0, 0.12);
-        }}
+        }
 
-        @media (prefers-color-scheme: dark) {{
-            .filter-bar {{
+        @media (prefers-color-scheme: dark) {
+            .filter-bar {
                 background: rgba(45, 45, 47, 0.6);
-            }}
-        }}
+            }
+        }
 
-        .filter-group {{
+        .filter-group {
             display: flex;
             gap: 10px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .filter-bar select {{
+        .filter-bar select {
             padding: 8px 12px;
             border: 1px solid var(--border-color);
             border-radius: 6px;
             background: var(--bg-color);
             color: var(--text-color);
             font-size: 14px;
-        }}
+        }
 
-        .stats {{
+        .stats {
             font-size: 14px;
             color: var(--text-secondary);
-        }}
+        }
 
-        .datum-gruppe {{
+        .datum-gruppe {
             margin-bottom: 20px;
-        }}
+        }
 
-        .datum-header {{
+        .datum-header {
             font-weight: 600;
             font-size: 1rem;
             padding: 10px 15px;
             background: var(--accent-color);
             color: white;
             border-radius: 10px 10px 0 0;
-        }}
+        }
 
-        .termine-liste {{
+        .termine-liste {
             background: var(--card-bg);
             border: 1px solid var(--border-color);
             border-top: none;
             border-radius: 0 0 10px 10px;
-        }}
+        }
 
-        .termin {{
+        .termin {
             display: flex;
             padding: 12px 15px;
             border-bottom: 1px solid var(--border-color);
             transition: background 0.2s;
-        }}
+        }
 
-        .termin:last-child {{
+        .termin:last-child {
             border-bottom: none;
-        }}
+        }
 
-        .termin:hover {{
+        .termin:hover {
             background: var(--hover-color);
-        }}
+        }
 
-        .termin-zeit {{
+        .termin-zeit {
             width: 90px;
             font-weight: 500;
             color: var(--accent-color);
             flex-shrink: 0;
-        }}
+        }
 
-        .termin-info {{
+        .termin-info {
             flex: 1;
-        }}
+        }
 
-        .termin-name {{
+        .termin-name {
             font-weight: 500;
             margin-bottom: 2px;
             display: flex;
             align-items: center;
             gap: 8px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .termin-name a {{
+        .termin-name a {
             color: var(--text-color);
             text-decoration: none;
-        }}
+        }
 
-        .termin-name a:hover {{
+        .termin-name a:hover {
             color: var(--accent-color);
             text-decoration: underline;
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 2px 8px;
             border-radius: 4px;
             font-size: 11px;
             font-weight: 500;
             white-space: nowrap;
-        }}
+        }
 
-        .badge-muensterland {{
+        .badge-muensterland {
             background: linear-gradient(135deg, #347c3b 0%, #255c2a 100%);
             color: white;
-        }}
+        }
 
-        .badge-digitalhub {{
+        .badge-digitalhub {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
-        }}
+        }
 
-        .badge-halle {{
+        .badge-halle {
             background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%);
             color: white;
-        }}
+        }
 
-        .badge-regioactive {{
+        .badge-regioactive {
             background: linear-gradient(135deg, #d4690a 0%, #b05808 100%);
             color: white;
-        }}
+        }
 
-        .badge-theater {{
+        .badge-theater {
             background: linear-gradient(135deg, #722f37 0%, #521520 100%);
             color: white;
-        }}
+        }
 
-        .badge-lwl {{
+        .badge-lwl {
             background: linear-gradient(135deg, #1a6b8a 0%, #0e4f68 100%);
             color: white;
-        }}
+        }
 
-        .badge-kategorie {{
+        .badge-neu {
+            background: #2e7d32;
+            color: white;
+        }
+
+        .badge-kategorie {
             background: var(--hover-color);
             color: var(--text-secondary);
             border: 1px solid var(--border-color);
-        }}
+        }
 
-        .termin-stadt {{
+        .termin-stadt {
             font-size: 13px;
             color: var(--text-secondary);
-        }}
+        }
 
-        .termin-ort {{
+        .termin-ort {
             font-size: 12px;
             color: var(--text-secondary);
             font-style: italic;
-        }}
+        }
 
-        .termin-beschreibung {{
+        .termin-beschreibung {
             font-size: 12px;
             color: var(--text-secondary);
             margin-top: 4px;
@@ -517,51 +520,62 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             -webkit-line-clamp: 2;
             -webkit-box-orient: vertical;
             overflow: hidden;
-        }}
+        }
 
-        .termin-toggle {{
+        .termin-toggle {
             cursor: pointer;
             color: var(--text-color);
             border-bottom: 1px dashed var(--text-secondary);
-        }}
+        }
 
-        .termin-toggle:hover {{
+        .termin-toggle:hover {
             color: var(--accent-color);
-        }}
+        }
 
-        .termin-toggle::after {{
+        .termin-toggle::after {
             content: ' \\25B8';
             font-size: 11px;
             color: var(--text-secondary);
-        }}
+        }
 
-        .termin.expanded .termin-toggle::after {{
+        .termin.expanded .termin-toggle::after {
             content: ' \\25BE';
-        }}
+        }
 
-        .termin:has(.termin-toggle) .termin-beschreibung {{
+        .termin:has(.termin-toggle) .termin-beschreibung {
             display: none;
-        }}
+        }
 
-        .termin.expanded .termin-beschreibung {{
+        .termin.expanded .termin-beschreibung {
             display: block;
             -webkit-line-clamp: unset;
             overflow: visible;
-        }}
+        }
 
-        .zurueck-link {{
+        .laufend-link {
+            margin-left: 10px;
+            font-size: 13px;
+            font-weight: 400;
+            color: white;
+        }
+
+        .termin.nicht-am-tag {
+            display: none;
+        }
+
+        .zurueck-link {
             text-align: right;
             padding: 6px 15px;
             font-size: 13px;
-        }}
+        }
 
-        .zurueck-link a {{
+        .zurueck-link a {
             color: var(--accent-color);
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
 
-        .scroll-top-btn {{
+        .scroll-top-btn {
             position: fixed;
             bottom: 24px;
             right: 24px;
@@ -577,61 +591,61 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             box-shadow: 0 2px 8px rgba(0,0,0,0.25);
             z-index: 200;
             transition: opacity 0.2s;
-        }}
+        }
 
-        .scroll-top-btn:hover {{
+        .scroll-top-btn:hover {
             opacity: 0.8;
-        }}
+        }
 
-        .keine-termine {{
+        .keine-termine {
             text-align: center;
             padding: 40px;
             color: var(--text-secondary);
-        }}
+        }
 
-        .hidden {{
+        .hidden {
             display: none !important;
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             margin-top: 30px;
             padding: 20px;
             color: var(--text-secondary);
             font-size: 12px;
-        }}
+        }
 
-        footer a {{
+        footer a {
             color: var(--text-secondary);
-        }}
+        }
 
-        .kalender {{
+        .kalender {
             width: 100%;
             max-width: 400px;
             margin: 0 auto 25px;
             border-collapse: collapse;
             text-align: center;
-        }}
+        }
 
-        .kalender th {{
+        .kalender th {
             padding: 6px;
             font-size: 13px;
             color: var(--text-secondary);
             font-weight: 500;
-        }}
+        }
 
-        .kalender td {{
+        .kalender td {
             padding: 6px;
             font-size: 14px;
             border-radius: 6px;
-        }}
+        }
 
-        .kalender .kal-leer {{
+        .kalender .kal-leer {
             color: var(--text-secondary);
             opacity: 0.5;
-        }}
+        }
 
-        .kalender .kal-link {{
+        .kalender .kal-link {
             display: inline-block;
             width: 32px;
             height: 32px;
@@ -641,30 +655,261 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             color: white;
             text-decoration: none;
             font-weight: 600;
-        }}
+        }
 
-        .kalender .kal-link:hover {{
+        .kalender .kal-link:hover {
             opacity: 0.8;
-        }}
+        }
 
-        .kalender .kal-heute {{
+        .kalender .kal-heute {
             outline: 2px solid var(--accent-color);
             outline-offset: -2px;
-        }}
+        }
 
-        .kalender .kal-heute .kal-link {{
+        .kalender .kal-heute .kal-link {
             box-shadow: 0 0 0 2px white, 0 0 0 4px var(--accent-color);
-        }}
+        }
 
-        @media (max-width: 600px) {{
-            .termin {{
+        @media (max-width: 600px) {
+            .termin {
                 flex-direction: column;
                 gap: 4px;
-            }}
-            .termin-zeit {{
+            }
+            .termin-zeit {
                 width: auto;
-            }}
-        }}
+            }
+        }'''
+
+
+# Laufende (mehrtägige) Events auf einen Tag einschränken: sie stehen nur einmal im Abschnitt
+# #laufend, die Links "+ N laufend" an den Tagen blenden dort die übrigen aus.
+_LAUFEND_JS = '''\
+        function zeigeLaufend(tag, label) {
+            for (const t of document.querySelectorAll('#laufend .termin')) {
+                t.classList.toggle('nicht-am-tag', tag !== '' && !(t.dataset.von <= tag && tag <= t.dataset.bis));
+            }
+            document.getElementById('laufend-titel').textContent = tag ? 'Laufend am ' + label : 'Laufende Veranstaltungen';
+            document.getElementById('laufend-alle').hidden = !tag;
+        }'''
+
+
+# Stadt-/Quellenfilter (Monatsseiten und Shell)
+_FILTER_JS = '''\
+        // Filterindex: pro Feld Wert -> Menge der Termin-Elemente; eine Auswahl schneidet nur Mengen.
+        // Wird beim ersten Filtern aufgebaut und nach einem Monatswechsel (Shell) verworfen.
+        const FILTER_FELDER = ['stadt', 'quelle', 'rubrik'];
+        let filterIndex = null;
+
+        function baueFilterIndex() {
+            filterIndex = {alle: [...document.querySelectorAll('.termin')]};
+            for (const feld of FILTER_FELDER) {
+                const index = new Map();
+                for (const t of filterIndex.alle) {
+                    const wert = t.dataset[feld] || '';
+                    if (!index.has(wert)) index.set(wert, new Set());
+                    index.get(wert).add(t);
+                }
+                filterIndex[feld] = index;
+            }
+        }
+
+        function filterTermine() {
+            if (!filterIndex) baueFilterIndex();
+            let treffer = null;  // null = keine Einschränkung
+            for (const feld of FILTER_FELDER) {
+                const wert = document.getElementById(feld + '-filter').value;
+                if (!wert) continue;
+                const menge = filterIndex[feld].get(wert) || new Set();
+                treffer = treffer === null ? menge : new Set([...treffer].filter(t => menge.has(t)));
+            }
+            const sichtbareStaedte = new Set();
+            for (const t of filterIndex.alle) {
+                const sichtbar = treffer === null || treffer.has(t);
+                t.classList.toggle('hidden', !sichtbar);
+                if (sichtbar && t.dataset.stadt) sichtbareStaedte.add(t.dataset.stadt);
+            }
+
+            document.getElementById('termine-count').textContent = treffer === null ? filterIndex.alle.length : treffer.size;
+            document.getElementById('staedte-count').textContent = sichtbareStaedte.size;
+
+            // Gruppen nur mit laufenden Events (Kopf mit "+ N laufend") folgen den sichtbaren in #laufend
+            const laufendSichtbar = [...document.querySelectorAll('#laufend .termin:not(.hidden)')];
+            document.querySelectorAll('.datum-gruppe').forEach(g => {
+                const tag = g.dataset.nurLaufend;
+                const sichtbar = tag
+                    ? laufendSichtbar.some(t => t.dataset.von <= tag && tag <= t.dataset.bis)
+                    : g.querySelectorAll('.termin:not(.hidden)').length > 0;
+                g.classList.toggle('hidden', !sichtbar);
+            });
+        }'''
+
+
+def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
+                   verfuegbare_monate: list[tuple[int, int]], neue: frozenset[str] = frozenset(),
+                   region: str = '') -> str:
+    """Generiert das HTML-Dashboard. neue: Fingerabdrücke, die ein "neu"-Badge bekommen.
+
+    region: Seite einer Region (nur deren Events); Monatsnavigation bleibt in der Region.
+    """
+    monatsnamen = [
+        '', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+        'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember'
+    ]
+
+    # Eintägige Termine nach Datum gruppieren; mehrtägige stehen einmal im Abschnitt "Laufend"
+    nach_datum = {}
+    laufend = []
+    for v in veranstaltungen:
+        if v.ist_mehrtaegig():
+            laufend.append(v)
+            continue
+        key = v.datum.strftime('%Y-%m-%d')
+        if key not in nach_datum:
+            nach_datum[key] = []
+        nach_datum[key].append(v)
+    laufend_pro_tag = laufend_index(laufend).zaehle_pro_tag(date(jahr, monat, 1),
+                                                             date(jahr, monat, calendar.monthrange(jahr, monat)[1]))
+
+    # Alle Städte für Filter
+    alle_staedte = sorted(set(v.stadt for v in veranstaltungen if v.stadt))
+
+    def termin_html(v: Veranstaltung) -> str:
+        name_esc = _html.escape(v.name)
+        stadt_esc = _html.escape(v.stadt)
+        uhrzeit_esc = _html.escape(v.uhrzeit if not v.ist_mehrtaegig() else laufzeit(v, jahr))
+        laufzeit_attr = (f' data-von="{v.datum.strftime("%Y-%m-%d")}" data-bis="{v.ende.strftime("%Y-%m-%d")}"'
+                         if v.ist_mehrtaegig() else '')
+        ort_esc = _html.escape(v.ort) if v.ort else ''
+        kategorie_esc = _html.escape(v.kategorie) if v.kategorie else ''
+        beschreibung_escaped = _html.escape(v.beschreibung)
+        beschreibung_escaped = beschreibung_escaped[:200] if v.link else beschreibung_escaped
+        link_safe = v.link if v.link and v.link.startswith(('http://', 'https://')) else ''
+
+        # Badge für Quelle
+        badge_cls, badge_label = BADGE_CONFIG.get(v.quelle, ('badge-muensterland', 'Münsterland'))
+        badge_html = f'<span class="badge {badge_cls}">{badge_label}</span>'
+        if kategorie_esc:
+            badge_html += f' <span class="badge badge-kategorie">{kategorie_esc}</span>'
+        if neue and fingerabdruck(v) in neue:
+            badge_html += ' <span class="badge badge-neu">neu</span>'
+
+        # Name: als Link oder aufklappbar
+        if link_safe:
+            name_html = f'<a href="{link_safe}" target="_blank" rel="noopener noreferrer">{name_esc}</a>'
+        else:
+            name_html = f'<span class="termin-toggle" onclick="this.closest(\'.termin\').classList.toggle(\'expanded\')">{name_esc}</span>'
+
+        return f'''
+            <div class="termin" data-stadt="{stadt_esc}" data-quelle="{v.quelle}" data-rubrik="{_html.escape(v.rubrik)}"{laufzeit_attr}>
+                <div class="termin-zeit">{uhrzeit_esc}</div>
+                <div class="termin-info">
+                    <div class="termin-name">
+                        {name_html}
+                        {badge_html}
+                    </div>
+                    <div class="termin-stadt">{stadt_esc}</div>
+                    {f'<div class="termin-ort">{ort_esc}</div>' if ort_esc else ''}
+                    {f'<div class="termin-beschreibung">{beschreibung_escaped}</div>' if beschreibung_escaped else ''}
+                </div>
+            </div>
+        '''
+
+    # Termine-HTML
+    termine_html = ""
+    if laufend:
+        termine_html += f'''
+        <div class="datum-gruppe" id="laufend">
+            <div class="datum-header"><span id="laufend-titel">Laufende Veranstaltungen</span>
+                <a href="#laufend" id="laufend-alle" class="laufend-link" onclick="zeigeLaufend('', '')" hidden>alle zeigen</a></div>
+            <div class="termine-liste">
+                {''.join(termin_html(v) for v in laufend)}
+            </div>
+        </div>
+        '''
+
+    # Tage mit eintägigen Terminen oder laufenden Events; an Tagen nur mit laufenden bleibt die Gruppe ein Kopf
+    for tag in sorted(set(date.fromisoformat(k) for k in nach_datum) | laufend_pro_tag.keys()):
+        datum_key = tag.isoformat()
+        tage = nach_datum.get(datum_key, [])
+        datum_formatiert = f"{WOCHENTAGE[tag.weekday()]} {tag.strftime('%d.%m.%Y')}"
+        anzahl_laufend = laufend_pro_tag.get(tag, 0)
+        laufend_html = (f' <a href="#laufend" class="laufend-link" onclick="zeigeLaufend(\'{datum_key}\', '
+                        f'\'{datum_formatiert}\')">+ {anzahl_laufend} laufend</a>' if anzahl_laufend else '')
+        nur_laufend = '' if tage else f' data-nur-laufend="{datum_key}"'
+
+        termine_html += f'''
+        <div class="datum-gruppe" id="datum-{datum_key}"{nur_laufend}>
+            <div class="datum-header">{datum_formatiert}{laufend_html}</div>
+            <div class="termine-liste">
+                {''.join(termin_html(v) for v in sorted(tage, key=lambda x: (x.uhrzeit == 'ganztägig', x.uhrzeit, x.name)))}
+            </div>
+            <div class="zurueck-link"><a href="#kalender">&#8593; Kalender</a></div>
+        </div>
+        '''
+
+    # Filter-Optionen Stadt
+    filter_html = '<option value="">Alle Städte</option>'
+    for stadt in alle_staedte:
+        stadt_esc = _html.escape(stadt)
+        filter_html += f'<option value="{stadt_esc}">{stadt_esc}</option>'
+
+    # Dynamischer Quellen-Filter (nur vorhandene Quellen)
+    quellen_filter = '<option value="">Alle Quellen</option>'
+    vorhandene_quellen = sorted(set(v.quelle for v in veranstaltungen))
+    for q in vorhandene_quellen:
+        label = QUELLEN.get(q, q)
+        quellen_filter += f'<option value="{q}">{label}</option>'
+
+    # Rubriken-Filter (kategorien.py), in Taxonomie-Reihenfolge
+    rubriken_filter = '<option value="">Alle Rubriken</option>'
+    for r in reihenfolge(set(v.rubrik for v in veranstaltungen if v.rubrik)):
+        rubrik_esc = _html.escape(r)
+        rubriken_filter += f'<option value="{rubrik_esc}">{rubrik_esc}</option>'
+
+    quellen_links = ' &middot;\n            '.join(
+        f'<a href="{q.webseite}" target="_blank" rel="noopener noreferrer">{_html.escape(q.quellenangabe)}</a>'
+        for q in REGISTER
+    )
+
+    # Monatsnavigation
+    prev_monat = monat - 1 if monat > 1 else 12
+    prev_jahr = jahr if monat > 1 else jahr - 1
+    next_monat = monat + 1 if monat < 12 else 1
+    next_jahr = jahr if monat < 12 else jahr + 1
+
+    prev_verfuegbar = (prev_jahr, prev_monat) in verfuegbare_monate
+    next_verfuegbar = (next_jahr, next_monat) in verfuegbare_monate
+
+    prev_link = dateiname_fuer_monat(prev_jahr, prev_monat, region) if prev_verfuegbar else "#"
+    next_link = dateiname_fuer_monat(next_jahr, next_monat, region) if next_verfuegbar else "#"
+
+    # Regionen: ganzes Münsterland oder eine Stadt bzw. ein Kreis
+    regionen_html = ' '.join(
+        f'<a href="{dateiname_fuer_monat(jahr, monat, r)}" class="region-link{" aktiv" if r == region else ""}">'
+        f'{_html.escape(r or "Alle Orte")}</a>'
+        for r in [''] + REGIONEN
+    )
+    abo = feed_datei(feed_fuer_region(region) if region else FEED_ALLE)
+    regionen_html += (f' <a href="{abo}" class="region-link abo-link" '
+                      f'title="Termine im Kalender abonnieren (iCal)">Abonnieren</a>')
+    titel_region = f" — {_html.escape(region)}" if region else ''
+
+    prev_class = "" if prev_verfuegbar else " disabled"
+    next_class = "" if next_verfuegbar else " disabled"
+
+    # Kalenderblatt generieren
+    tage_mit_events = set(int(k.split('-')[2]) for k in nach_datum.keys()) | {t.day for t in laufend_pro_tag}
+    kalender_html = generiere_kalender(jahr, monat, tage_mit_events)
+
+    html = f'''<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Veranstaltungen Münsterland{titel_region} — {monatsnamen[monat]} {jahr}</title>
+    <link rel="alternate" type="text/calendar" title="Veranstaltungen Münsterland{titel_region}" href="{abo}">
+    <style>
+{_CSS}
     </style>
 </head>
 <body>
@@ -676,6 +921,7 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
                 <span class="monat-titel">{monatsnamen[monat]} {jahr}</span>
                 <a href="{next_link}" class="nav-btn{next_class}">{monatsnamen[next_monat]} &rarr;</a>
             </div>
+            <nav class="regionen">{regionen_html}</nav>
         </header>
 
         {kalender_html}
@@ -688,6 +934,9 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
                 <select id="quelle-filter" onchange="filterTermine()">
                     {quellen_filter}
                 </select>
+                <select id="rubrik-filter" onchange="filterTermine()">
+                    {rubriken_filter}
+                </select>
             </div>
             <div class="stats">
                 <span id="termine-count">{len(veranstaltungen)}</span> Veranstaltungen in <span id="staedte-count">{len(alle_staedte)}</span> Orten
@@ -701,11 +950,7 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
         <footer>
             Generiert am {datetime.now().strftime('%d.%m.%Y um %H:%M Uhr')}<br>
             Quellen:
-            <a href="https://www.muensterland.com/tourismus/service/veranstaltungen-im-muensterland/" target="_blank" rel="noopener noreferrer">muensterland.com</a> &middot;
-            <a href="https://www.digitalhub.ms" target="_blank" rel="noopener noreferrer">Digital Hub münsterLAND</a> &middot;
-            <a href="https://www.mcc-halle-muensterland.de" target="_blank" rel="noopener noreferrer">Halle Münsterland</a> &middot;
-            <a href="https://neu.theater-muenster.com/spielplan" target="_blank" rel="noopener noreferrer">Theater Münster</a> &middot;
-            <a href="https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/" target="_blank" rel="noopener noreferrer">LWL-Museum</a>
+            {quellen_links}
         </footer>
     </div>
 
@@ -736,44 +981,372 @@ def generiere_html(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
             }}
         }})();
 
-        function filterTermine() {{
-            const stadtFilter = document.getElementById('stadt-filter').value;
-            const quelleFilter = document.getElementById('quelle-filter').value;
-            const termine = document.querySelectorAll('.termin');
-            let sichtbar = 0;
-            const sichtbareStaedte = new Set();
-
-            termine.forEach(t => {{
-                const stadtMatch = !stadtFilter || t.dataset.stadt === stadtFilter;
-                const quelleMatch = !quelleFilter || t.dataset.quelle === quelleFilter;
+{_FILTER_JS}
 
-                if (stadtMatch && quelleMatch) {{
-                    t.classList.remove('hidden');
-                    sichtbar++;
-                    if (t.dataset.stadt) sichtbareStaedte.add(t.dataset.stadt);
-                }} else {{
-                    t.classList.add('hidden');
-                }}
-            }});
-
-            document.getElementById('termine-count').textContent = sichtbar;
-            document.getElementById('staedte-count').textContent = sichtbareStaedte.size;
-
-            document.querySelectorAll('.datum-gruppe').forEach(g => {{
-                const sichtbareTermine = g.querySelectorAll('.termin:not(.hidden)');
-                g.classList.toggle('hidden', sichtbareTermine.length === 0);
-            }});
-        }}
+{_LAUFEND_JS}
 
         // Filter beim Laden anwenden (z.B. bei gesetztem Quellen-Filter)
         filterTermine();
     </script>
+    {REGISTRIERUNG_HTML}
 </body>
 </html>'''
 
     return html
 
 
+# Reihenfolge der Spalten in daten/*.json
+MONATSDATEN_FELDER = ['datum', 'uhrzeit', 'name', 'link', 'ort', 'stadt', 'beschreibung', 'quelle', 'kategorie', 'neu',
+                      'rubrik', 'ende']
+
+
+def generiere_monatsdaten(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
+                          neue: frozenset[str] = frozenset()) -> str:
+    """Termine eines Monats als kompaktes JSON für die Shell — dieselben Inhalte wie die Monatsseite.
+
+    Eine Zeile pro Termin (Spalten siehe MONATSDATEN_FELDER), sortiert wie in der
+    Seite; Escaping übernimmt der Client. ende ist nur bei mehrtägigen Events gesetzt.
+    """
+    termine = []
+    for v in sorted(veranstaltungen, key=lambda x: (x.datum.strftime('%Y-%m-%d'), x.uhrzeit == 'ganztägig',
+                                                    x.uhrzeit, x.name)):
+        link_safe = v.link if v.link and v.link.startswith(('http://', 'https://')) else ''
+        beschreibung = v.beschreibung[:200] if v.link else v.beschreibung
+        termine.append([v.datum.strftime('%Y-%m-%d'), v.uhrzeit, v.name, link_safe, v.ort, v.stadt,
+                        beschreibung, v.quelle, v.kategorie, int(bool(neue) and fingerabdruck(v) in neue), v.rubrik,
+                        v.ende.strftime('%Y-%m-%d') if v.ist_mehrtaegig() else ''])
+    return json.dumps({
+        'jahr': jahr,
+        'monat': monat,
+        'generiert': datetime.now().strftime('%d.%m.%Y um %H:%M Uhr'),
+        'felder': MONATSDATEN_FELDER,
+        'termine': termine,
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+# Client der Shell: Monatsdaten laden, Seite aufbauen, Hash-Routing und Vorab-Laden der Nachbarmonate
+_SHELL_JS = """\
+        const MONATSNAMEN = ['', 'Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+                             'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember'];
+        const WOCHENTAGE = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So'];
+        const ZEICHEN = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'};
+        const pad = n => String(n).padStart(2, '0');
+        const esc = s => String(s).replace(/[&<>"']/g, z => ZEICHEN[z]);
+        const geladen = new Map();  // "JJJJ-MM" -> Promise mit den Monatsdaten
+        let aktuell = null;
+
+        function nachbar(schluessel, schritt) {
+            let [jahr, monat] = schluessel.split('-').map(Number);
+            monat += schritt;
+            if (monat < 1) { monat = 12; jahr--; }
+            if (monat > 12) { monat = 1; jahr++; }
+            return jahr + '-' + pad(monat);
+        }
+
+        // schluessel: "JJJJ-MM" (ganzes Münsterland) oder "JJJJ-MM/kuerzel" (eine Region, siehe regionen.py)
+        const dateiname = schluessel => 'veranstaltungen_' + schluessel.replace('-', '_').replace('/', '_');
+
+        function ladeMonat(schluessel) {
+            if (!geladen.has(schluessel)) {
+                const datei = 'daten/' + dateiname(schluessel) + '.json';
+                geladen.set(schluessel, fetch(datei).then(antwort => {
+                    if (!antwort.ok) throw new Error(datei + ': HTTP ' + antwort.status);
+                    return antwort.json();
+                }).catch(fehler => {
+                    geladen.delete(schluessel);
+                    throw fehler;
+                }));
+            }
+            return geladen.get(schluessel);
+        }
+
+        function datumFormatiert(datum) {
+            const [jahr, monat, tag] = datum.split('-').map(Number);
+            return WOCHENTAGE[(new Date(jahr, monat - 1, tag).getDay() + 6) % 7] + ' ' + pad(tag) + '.' + pad(monat) + '.' + jahr;
+        }
+
+        function kalender(jahr, monat, tageMitEvents) {
+            const versatz = (new Date(jahr, monat - 1, 1).getDay() + 6) % 7;  // Montag = 0
+            const letzter = new Date(jahr, monat, 0).getDate();
+            let html = '<tr>' + WOCHENTAGE.map(t => '<th>' + t + '</th>').join('') + '</tr>';
+            for (let tag = 1 - versatz; tag <= letzter;) {
+                html += '<tr>';
+                for (let i = 0; i < 7; i++, tag++) {
+                    const datum = jahr + '-' + pad(monat) + '-' + pad(tag);
+                    if (tag < 1 || tag > letzter) {
+                        html += '<td></td>';
+                    } else if (tageMitEvents.has(datum)) {
+                        html += '<td data-datum="' + datum + '"><a href="#datum-' + datum + '" class="kal-link">' + tag + '</a></td>';
+                    } else {
+                        html += '<td class="kal-leer" data-datum="' + datum + '">' + tag + '</td>';
+                    }
+                }
+                html += '</tr>';
+            }
+            return html;
+        }
+
+        function termin(t, jahr) {
+            const [badgeKlasse, badgeLabel] = QUELLEN[t.quelle] || QUELLEN.muensterland;
+            let badges = '<span class="badge ' + badgeKlasse + '">' + badgeLabel + '</span>';
+            if (t.kategorie) badges += ' <span class="badge badge-kategorie">' + esc(t.kategorie) + '</span>';
+            if (t.neu) badges += ' <span class="badge badge-neu">neu</span>';
+            const zeit = t.ende
+                ? 'bis ' + t.ende.slice(8, 10) + '.' + t.ende.slice(5, 7) + '.' + (t.ende.slice(0, 4) !== String(jahr) ? t.ende.slice(0, 4) : '')
+                : t.uhrzeit;
+            const name = t.link
+                ? '<a href="' + esc(t.link) + '" target="_blank" rel="noopener noreferrer">' + esc(t.name) + '</a>'
+                : '<span class="termin-toggle">' + esc(t.name) + '</span>';
+            return '<div class="termin" data-stadt="' + esc(t.stadt) + '" data-quelle="' + esc(t.quelle)
+                + '" data-rubrik="' + esc(t.rubrik || '') + '"'
+                + (t.ende ? ' data-von="' + esc(t.datum) + '" data-bis="' + esc(t.ende) + '"' : '') + '>'
+                + '<div class="termin-zeit">' + esc(zeit) + '</div>'
+                + '<div class="termin-info">'
+                + '<div class="termin-name">' + name + ' ' + badges + '</div>'
+                + '<div class="termin-stadt">' + esc(t.stadt) + '</div>'
+                + (t.ort ? '<div class="termin-ort">' + esc(t.ort) + '</div>' : '')
+                + (t.beschreibung ? '<div class="termin-beschreibung">' + esc(t.beschreibung) + '</div>' : '')
+                + '</div></div>';
+        }
+
+        function optionen(select, alle, werte, label) {
+            const gewaehlt = select.value;
+            select.innerHTML = '<option value="">' + alle + '</option>'
+                + werte.map(w => '<option value="' + esc(w) + '">' + esc(label(w)) + '</option>').join('');
+            if (werte.includes(gewaehlt)) select.value = gewaehlt;
+        }
+
+        function navLink(element, monat, region, text) {
+            const ziel = monat + (region ? '/' + region : '');
+            element.textContent = text;
+            element.classList.toggle('disabled', !MONATE.includes(monat));
+            element.href = MONATE.includes(monat) ? '#' + ziel : '#';
+            element.dataset.monat = MONATE.includes(monat) ? ziel : '';
+        }
+
+        function regionenLeiste(monat, region) {
+            return [['', 'Alle Orte'], ...REGIONEN].map(([k, name]) => {
+                const ziel = monat + (k ? '/' + k : '');
+                return '<a href="#' + ziel + '" data-monat="' + ziel + '" class="region-link' + (k === region ? ' aktiv' : '')
+                    + '">' + esc(name) + '</a>';
+            }).join(' ') + ' <a href="kalender/' + (region ? 'region-' + region : 'alle')
+                + '.ics" class="region-link abo-link" title="Termine im Kalender abonnieren (iCal)">Abonnieren</a>';
+        }
+
+        function zeigeMonat(schluessel, daten) {
+            const termine = daten.termine.map(zeile => Object.fromEntries(daten.felder.map((f, i) => [f, zeile[i]])));
+            const [monat, region = ''] = schluessel.split('/');
+            const titel = MONATSNAMEN[daten.monat] + ' ' + daten.jahr;
+            const regionName = (REGIONEN.find(([k]) => k === region) || [])[1];
+            const vorher = nachbar(monat, -1), nachher = nachbar(monat, 1);
+            document.title = 'Veranstaltungen Münsterland' + (regionName ? ' — ' + regionName : '') + ' — ' + titel;
+            document.getElementById('monat-titel').textContent = titel;
+            navLink(document.getElementById('nav-zurueck'), vorher, region, '\\u2190 ' + MONATSNAMEN[Number(vorher.slice(5))]);
+            navLink(document.getElementById('nav-weiter'), nachher, region, MONATSNAMEN[Number(nachher.slice(5))] + ' \\u2192');
+            document.getElementById('regionen').innerHTML = regionenLeiste(monat, region);
+
+            // Eintägige nach Datum, mehrtägige (ende gesetzt) einmal im Abschnitt #laufend
+            const nachDatum = new Map();
+            const laufend = termine.filter(t => t.ende);
+            for (const t of termine) {
+                if (t.ende) continue;
+                if (!nachDatum.has(t.datum)) nachDatum.set(t.datum, []);
+                nachDatum.get(t.datum).push(t);
+            }
+
+            // Laufende pro Tag: Differenzen am ersten und nach dem letzten Tag im Monat, dann aufsummieren
+            const letzter = new Date(daten.jahr, daten.monat, 0).getDate();
+            const prefix = daten.jahr + '-' + pad(daten.monat) + '-';
+            const differenz = new Array(letzter + 2).fill(0);
+            for (const t of laufend) {
+                differenz[t.datum < prefix ? 1 : Number(t.datum.slice(8))]++;
+                differenz[t.ende.slice(0, 8) > prefix ? letzter + 1 : Number(t.ende.slice(8)) + 1]--;
+            }
+            const laufendAm = new Map();
+            for (let tag = 1, anzahl = 0; tag <= letzter; tag++) {
+                anzahl += differenz[tag];
+                laufendAm.set(prefix + pad(tag), anzahl);
+            }
+
+            let html = '';
+            if (laufend.length) {
+                html += '<div class="datum-gruppe" id="laufend">'
+                    + '<div class="datum-header"><span id="laufend-titel">Laufende Veranstaltungen</span> '
+                    + '<a href="#laufend" id="laufend-alle" class="laufend-link" data-tag="" hidden>alle zeigen</a></div>'
+                    + '<div class="termine-liste">' + laufend.map(t => termin(t, daten.jahr)).join('') + '</div></div>';
+            }
+            // Tage mit eintägigen Terminen oder laufenden Events; an Tagen nur mit laufenden bleibt die Gruppe ein Kopf
+            const tageMitEvents = new Set([...nachDatum.keys(), ...[...laufendAm].filter(([, n]) => n).map(([d]) => d)]);
+            document.getElementById('kalender').innerHTML = kalender(daten.jahr, daten.monat, tageMitEvents);
+            for (const datum of [...tageMitEvents].sort()) {
+                const tage = nachDatum.get(datum) || [];
+                const anzahl = laufendAm.get(datum) || 0;
+                html += '<div class="datum-gruppe" id="datum-' + datum + '"' + (tage.length ? '' : ' data-nur-laufend="' + datum + '"') + '>'
+                    + '<div class="datum-header">' + datumFormatiert(datum)
+                    + (anzahl ? ' <a href="#laufend" class="laufend-link" data-tag="' + datum + '">+ ' + anzahl + ' laufend</a>' : '')
+                    + '</div>'
+                    + '<div class="termine-liste">' + tage.map(t => termin(t, daten.jahr)).join('') + '</div>'
+                    + '<div class="zurueck-link"><a href="#kalender">&#8593; Kalender</a></div></div>';
+            }
+            document.getElementById('termine-container').innerHTML =
+                html || '<div class="keine-termine">Keine Veranstaltungen gefunden</div>';
+
+            const staedte = [...new Set(termine.map(t => t.stadt).filter(Boolean))].sort((a, b) => a.localeCompare(b));
+            const quellen = [...new Set(termine.map(t => t.quelle))].sort();
+            optionen(document.getElementById('stadt-filter'), 'Alle Städte', staedte, s => s);
+            optionen(document.getElementById('quelle-filter'), 'Alle Quellen', quellen, q => (QUELLEN[q] || [0, q])[1]);
+            const rubriken = RUBRIKEN.filter(r => termine.some(t => t.rubrik === r));
+            optionen(document.getElementById('rubrik-filter'), 'Alle Rubriken', rubriken, r => r);
+            document.getElementById('generiert').textContent = daten.generiert;
+            filterIndex = null;
+            filterTermine();
+
+            // Heutigen Tag markieren und dorthin springen (oder an den Anfang)
+            const heute = new Date();
+            const key = heute.getFullYear() + '-' + pad(heute.getMonth() + 1) + '-' + pad(heute.getDate());
+            const td = document.querySelector('td[data-datum="' + key + '"]');
+            if (td) td.classList.add('kal-heute');
+            const ziel = [...document.querySelectorAll('.datum-gruppe[id^="datum-"]')].find(g => g.id.slice(6) >= key);
+            if (ziel && key.slice(0, 7) === monat) {
+                ziel.scrollIntoView({behavior: 'instant', block: 'start'});
+            } else {
+                window.scrollTo(0, 0);
+            }
+        }
+
+        // Nachbarmonate laden, wenn der Browser nichts zu tun hat
+        const wennFrei = fn => 'requestIdleCallback' in window ? requestIdleCallback(fn) : setTimeout(fn, 200);
+
+        async function wechsle(schluessel, verlauf) {
+            let [monat, region = ''] = schluessel.split('/');
+            if (!MONATE.includes(monat)) monat = START;
+            if (!REGIONEN.some(([k]) => k === region)) region = '';
+            schluessel = monat + (region ? '/' + region : '');
+            if (verlauf === 'push') history.pushState(null, '', '#' + schluessel);
+            if (verlauf === 'replace') history.replaceState(null, '', '#' + schluessel);
+            aktuell = schluessel;
+            let daten;
+            try {
+                daten = await ladeMonat(schluessel);
+            } catch (fehler) {
+                // Ohne Daten (offline, nicht gecacht): zur eigenständigen Monatsseite
+                location.href = dateiname(schluessel) + '.html';
+                return;
+            }
+            if (aktuell !== schluessel) return;  // inzwischen weitergeklickt
+            zeigeMonat(schluessel, daten);
+            wennFrei(() => [nachbar(monat, 1), nachbar(monat, -1)]
+                .filter(m => MONATE.includes(m)).forEach(m => ladeMonat(m + (region ? '/' + region : '')).catch(() => {})));
+        }
+
+        document.addEventListener('click', event => {
+            const toggle = event.target.closest('.termin-toggle');
+            if (toggle) {
+                toggle.closest('.termin').classList.toggle('expanded');
+                return;
+            }
+            const link = event.target.closest('a[href^="#"]');
+            if (!link) return;
+            if (link.classList.contains('laufend-link')) {
+                zeigeLaufend(link.dataset.tag, link.dataset.tag && datumFormatiert(link.dataset.tag));
+            }
+            event.preventDefault();
+            if (link.classList.contains('nav-btn') || link.classList.contains('region-link')) {
+                if (link.dataset.monat) wechsle(link.dataset.monat, 'push');
+                return;
+            }
+            // Sprünge innerhalb des Monats (Kalender, Datumsgruppen) ändern den Hash nicht
+            const ziel = document.getElementById(link.getAttribute('href').slice(1));
+            if (ziel) ziel.scrollIntoView({block: 'start'});
+        });
+
+        window.addEventListener('popstate', () => wechsle(location.hash.slice(1), null));
+        wechsle(location.hash.slice(1), 'replace');
+"""
+
+
+def generiere_shell(verfuegbare_monate: list[tuple[int, int]], start: tuple[int, int]) -> str:
+    """Generiert dashboard.html: eine Seite für alle Monate, die Termine kommen aus daten/*.json.
+
+    Monatswechsel tauschen nur den Inhalt aus (Hash #JJJJ-MM bzw. #JJJJ-MM/region, Verlauf per pushState)
+    und übertragen nur die Monatsdaten; die Nachbarmonate werden im Leerlauf vorab geladen.
+    """
+    monate = [f"{j}-{m:02d}" for j, m in verfuegbare_monate]
+    quellen = {schluessel: list(badge) for schluessel, badge in BADGE_CONFIG.items()}
+    quellen_links = ' &middot;\n            '.join(
+        f'<a href="{q.webseite}" target="_blank" rel="noopener noreferrer">{_html.escape(q.quellenangabe)}</a>'
+        for q in REGISTER
+    )
+
+    return f'''<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Veranstaltungen Münsterland</title>
+    <style>
+{_CSS}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>Veranstaltungen Münsterland</h1>
+            <div class="nav">
+                <a href="#" id="nav-zurueck" class="nav-btn disabled">&larr;</a>
+                <span class="monat-titel" id="monat-titel"></span>
+                <a href="#" id="nav-weiter" class="nav-btn disabled">&rarr;</a>
+            </div>
+            <nav class="regionen" id="regionen"></nav>
+        </header>
+
+        <table class="kalender" id="kalender"></table>
+
+        <div class="filter-bar">
+            <div class="filter-group">
+                <select id="stadt-filter" onchange="filterTermine()">
+                    <option value="">Alle Städte</option>
+                </select>
+                <select id="quelle-filter" onchange="filterTermine()">
+                    <option value="">Alle Quellen</option>
+                </select>
+                <select id="rubrik-filter" onchange="filterTermine()">
+                    <option value="">Alle Rubriken</option>
+                </select>
+            </div>
+            <div class="stats">
+                <span id="termine-count">0</span> Veranstaltungen in <span id="staedte-count">0</span> Orten
+            </div>
+        </div>
+
+        <main id="termine-container"></main>
+
+        <footer>
+            Generiert am <span id="generiert"></span><br>
+            Quellen:
+            {quellen_links}
+        </footer>
+    </div>
+
+    <a href="#kalender" class="scroll-top-btn" title="Zum Kalender">↑</a>
+
+    <script>
+        const MONATE = {json.dumps(monate)};
+        const START = {json.dumps(f"{start[0]}-{start[1]:02d}")};
+        const QUELLEN = {json.dumps(quellen, ensure_ascii=False)};
+        const RUBRIKEN = {json.dumps(reihenfolge([r for r, _ in RUBRIKEN] + [SONSTIGES]), ensure_ascii=False)};
+        const REGIONEN = {json.dumps([[kuerzel(r), r] for r in REGIONEN], ensure_ascii=False)};
+
+{_FILTER_JS}
+
+{_LAUFEND_JS}
+
+{_SHELL_JS}    </script>
+    {REGISTRIERUNG_HTML}
+</body>
+</html>'''
+
+
 def berechne_monate(start_jahr: int, start_monat: int, anzahl: int) -> list[tuple[int, int]]:
     """Berechnet eine Liste von (jahr, monat) Tupeln."""
     monate = []
@@ -787,90 +1360,227 @@ def berechne_monate(start_jahr: int, start_monat: int, anzahl: int) -> list[tupl
     return monate
 
 
-def main():
-    """Hauptfunktion."""
-    import sys
-
-    no_browser = '--no-browser' in sys.argv
-    args = [a for a in sys.argv[1:] if not a.startswith('--')]
-
+def inhalts_hash(veranstaltungen: list[Veranstaltung]) -> str:
+    """Hash über die Events selbst — ändert sich nicht mit dem Zeitstempel im HTML."""
+    zeilen = sorted(als_zeile(v) for v in veranstaltungen)
+    return hashlib.sha256(json.dumps(zeilen, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def kalender_titel() -> dict[str, str]:
+    """Alle iCal-Feeds mit ihrem Kalendernamen — auch solche, die gerade keine Events haben."""
+    titel = {FEED_ALLE: 'Veranstaltungen Münsterland'}
+    titel.update({feed_fuer_region(r): f'Veranstaltungen Münsterland — {r}' for r in REGIONEN})
+    titel.update({feed_fuer_quelle(q): f'Veranstaltungen Münsterland — {label}' for q, label in QUELLEN.items()})
+    return titel
+
+
+def rendere_monat(veranstaltungen: list[Veranstaltung], jahr: int, monat: int,
+                  monate_liste: list[tuple[int, int]], ausgabe_pfad: str,
+                  vorher: set[str] | None = None,
+                  daten_pfad: str | None = None,
+                  archiv_verzeichnis: str | None = None,
+                  lauf: datetime | None = None,
+                  kalender_verzeichnis: str | None = None,
+                  frueher: dict[str, list] | None = None) -> tuple[list[str], dict, dict[str, list]]:
+    """Filtert, dedupliziert und schreibt die Seite eines Monats.
+
+    Läuft in einem Render-Prozess, darum sammelt sie ihre Ausgabe statt zu drucken.
+    vorher: Fingerabdrücke des letzten Laufs; was dort fehlt, wird als neu markiert.
+    daten_pfad: schreibt zusätzlich die Monatsdaten für die Shell (--shell).
+    archiv_verzeichnis: hängt den Stand des Monats als Block des Laufs lauf ans Archiv (archiv.py).
+    kalender_verzeichnis: schreibt die Teilstücke der iCal-Feeds für den Monat (ical.py).
+    frueher: Fingerabdrücke aller Monate des letzten Laufs; bei unverändertem event_hash
+    bleibt der Zeitpunkt der letzten Änderung erhalten, sonst ist es lauf.
+    Gibt die Konsolenzeilen, den Manifest-Eintrag und die Fingerabdrücke
+    ({fingerabdruck: [event_hash, name, datum, geaendert]}) zurück.
+    """
+    zeilen = []
+    vor_filter = len(veranstaltungen)
+    veranstaltungen = entferne_ausgeschlossene(veranstaltungen)
+    ausgeschlossen = vor_filter - len(veranstaltungen)
+    if ausgeschlossen:
+        zeilen.append(f"  -> {ausgeschlossen} Veranstaltung(en) ausgeschlossen (demokratiefeindliche Gruppierung)")
+
+    vor_dedup = len(veranstaltungen)
+    veranstaltungen = entferne_duplikate(veranstaltungen)
+    veranstaltungen.sort()
+    ordne_ein(veranstaltungen)
+    entfernt = vor_dedup - len(veranstaltungen)
+    staedte = len(set(v.stadt for v in veranstaltungen if v.stadt))
+    zeilen.append(f"  => Gesamt: {len(veranstaltungen)} Veranstaltungen in {staedte} Orten ({entfernt} Duplikate entfernt)")
+
+    frueher = frueher or {}
+    stempel = (lauf or datetime.now()).astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    abdruecke = {}
+    for v in veranstaltungen:
+        fp, h = fingerabdruck(v), event_hash(v)
+        alt = frueher.get(fp)
+        seit = alt[3] if alt and len(alt) > 3 and alt[0] == h else stempel
+        abdruecke[fp] = [h, v.name, v.datum.strftime('%Y-%m-%d'), seit]
+    neue = frozenset(abdruecke.keys() - vorher) if vorher is not None else frozenset()
+
+    schreibe_atomar(ausgabe_pfad, generiere_html(veranstaltungen, jahr, monat, monate_liste, neue))
+    eintrag = {
+        'jahr': jahr,
+        'monat': monat,
+        'veranstaltungen': len(veranstaltungen),
+        'beginnen': sum((v.datum.year, v.datum.month) == (jahr, monat) for v in veranstaltungen),
+        'orte': staedte,
+        'quellen': dict(sorted(Counter(v.quelle for v in veranstaltungen).items())),
+        'sha256': inhalts_hash(veranstaltungen),
+        'generiert': datetime.now().isoformat(timespec='seconds'),
+    }
+    if daten_pfad:
+        schreibe_atomar(daten_pfad, generiere_monatsdaten(veranstaltungen, jahr, monat, neue))
+        eintrag['daten'] = daten_dateiname_fuer_monat(jahr, monat)
+
+    # Regionsseiten (und -daten) aus derselben Gruppierung; update.sh räumt sie über das Manifest mit auf
+    eintrag['regionen'] = []
+    for region, events in teile_auf(veranstaltungen).items():
+        dateiname = dateiname_fuer_monat(jahr, monat, region)
+        schreibe_atomar(os.path.join(os.path.dirname(ausgabe_pfad), dateiname),
+                        generiere_html(events, jahr, monat, monate_liste, neue, region))
+        eintrag['regionen'].append(dateiname)
+        if daten_pfad:
+            daten_datei = daten_dateiname_fuer_monat(jahr, monat, region)
+            schreibe_atomar(os.path.join(os.path.dirname(daten_pfad), os.path.basename(daten_datei)),
+                            generiere_monatsdaten(events, jahr, monat, neue))
+            eintrag['regionen'].append(daten_datei)
+    if archiv_verzeichnis and haenge_an(archiv_verzeichnis, jahr, monat, lauf or datetime.now(), veranstaltungen,
+                                        eintrag['sha256']):
+        zeilen.append("  -> im Archiv abgelegt")
+    if kalender_verzeichnis:
+        geaendert = schreibe_teile(kalender_verzeichnis, jahr, monat, veranstaltungen, fingerabdruck,
+                                   lambda v: abdruecke[fingerabdruck(v)][3])
+        if geaendert:
+            zeilen.append(f"  -> {geaendert} Kalender-Teilstück(e) aktualisiert")
+    return zeilen, eintrag, abdruecke
+
+
+def _option_wert(argv: list[str], name: str) -> str | None:
+    """Entfernt '--name WERT' aus argv und gibt WERT zurück (None, wenn nicht gesetzt)."""
+    if name not in argv:
+        return None
+    idx = argv.index(name)
+    if idx + 1 >= len(argv):
+        raise SystemExit(f"{name} erwartet einen Wert")
+    wert = argv[idx + 1]
+    del argv[idx:idx + 2]
+    return wert
+
+
+def _rendere_alle(auftraege: list[tuple], pool: ProcessPoolExecutor | None) -> list[tuple]:
+    """rendere_monat für alle Aufträge — im übergebenen Pool, in einem neuen oder im Prozess selbst."""
+    prozesse = min(RENDER_PROZESSE_MAX, len(auftraege))
+    if prozesse > 1 and pool is not None:
+        return [f.result() for f in [pool.submit(rendere_monat, *argumente) for argumente in auftraege]]
+    if prozesse > 1:
+        with ProcessPoolExecutor(max_workers=prozesse, mp_context=multiprocessing.get_context('spawn')) as pool:
+            return [f.result() for f in [pool.submit(rendere_monat, *argumente) for argumente in auftraege]]
+    return [rendere_monat(*argumente) for argumente in auftraege]
+
+
+def erzeuge(monate_liste: list[tuple[int, int]], basis_pfad: str, shell: bool = False,
+            render_pool: ProcessPoolExecutor | None = None, letzte: dict[str, str] | None = None) -> list[str]:
+    """Ein Durchgang: alle Quellen abrufen, Monatsseiten, Manifest, sw.js und index.html schreiben.
+
+    render_pool: ein bereits laufender Pool (Daemon), sonst wird bei Bedarf einer gestartet.
+    letzte: {dateiname: Hash der abgerufenen Events und der Nachbarmonate im Fenster} aus dem
+    vorigen Durchgang im selben Prozess. Monate mit unverändertem Hash werden nicht neu
+    geschrieben; das Dict wird
+    aktualisiert. Gibt die neu geschriebenen Monatsdateien zurück.
+    """
     jetzt = datetime.now()
-    jahr = int(args[0]) if len(args) > 0 else jetzt.year
-    monat = int(args[1]) if len(args) > 1 else jetzt.month
-    anzahl_monate = int(args[2]) if len(args) > 2 else 3
-
-    monate_liste = berechne_monate(jahr, monat, anzahl_monate)
-
-    print(f"Generiere {anzahl_monate} Monate ab {monat}/{jahr}...")
-    print("=" * 50)
-
-    basis_pfad = os.path.dirname(__file__)
-    erster_dateiname = None
-
+    status = QuellenStatus(os.path.join(basis_pfad, STATUS_DATEI))
+    modi = plane_lauf(status)
+    statistik_vorher = host_statistik()
+    abruf = hole_alle_quellen(monate_liste, modi)
+
+    # Monate parallel rendern (CPU-gebunden: Dedup und HTML), Ausgabe danach in Monatsreihenfolge
+    monatsnamen = ['', 'Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun',
+                   'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez']
+    abdruck_pfad = os.path.join(basis_pfad, FINGERABDRUCK_DATEI)
+    alte_abdruecke = lade_json(abdruck_pfad)
+    frueher = {fp: e for monat in alte_abdruecke.values() for fp, e in monat.items()}
+    quellen_zeilen = {}
+    roh_hashes = {}
+    auftraege = []
     for idx, (j, m) in enumerate(monate_liste):
-        monatsnamen = ['', 'Jan', 'Feb', 'Mär', 'Apr', 'Mai', 'Jun',
-                       'Jul', 'Aug', 'Sep', 'Okt', 'Nov', 'Dez']
-        print(f"\n[{idx+1}/{anzahl_monate}] {monatsnamen[m]} {j}:")
-
-        # Münsterland Events
-        veranstaltungen = hole_veranstaltungen(j, m)
-        print(f"  -> {len(veranstaltungen)} muensterland.com")
-
-        # Digital Hub Events
-        digitalhub_events = hole_digitalhub_events(j, m)
-        if digitalhub_events:
-            print(f"  -> {len(digitalhub_events)} Digital Hub")
-            veranstaltungen.extend(digitalhub_events)
-
-        # Halle Münsterland Events
-        halle_events = hole_halle_muensterland_events(j, m)
-        if halle_events:
-            print(f"  -> {len(halle_events)} Halle Münsterland")
-            veranstaltungen.extend(halle_events)
-
-        # regioactive.de Münster — deaktiviert seit 2026-04-19 (Cloudflare-Block, 403)
-        # regioactive_events = hole_regioactive_ms(j, m)
-        # if regioactive_events:
-        #     print(f"  -> {len(regioactive_events)} regioactive.de")
-        #     veranstaltungen.extend(regioactive_events)
-
-        # Theater Münster
-        theater_events = hole_theater_muenster(j, m)
-        if theater_events:
-            print(f"  -> {len(theater_events)} Theater Münster")
-            veranstaltungen.extend(theater_events)
-
-        # LWL-Museum für Kunst und Kultur
-        lwl_events = hole_lwl_museum(j, m)
-        if lwl_events:
-            print(f"  -> {len(lwl_events)} LWL-Museum")
-            veranstaltungen.extend(lwl_events)
-
-        vor_filter = len(veranstaltungen)
-        veranstaltungen = entferne_ausgeschlossene(veranstaltungen)
-        ausgeschlossen = vor_filter - len(veranstaltungen)
-        if ausgeschlossen:
-            print(f"  -> {ausgeschlossen} Veranstaltung(en) ausgeschlossen (demokratiefeindliche Gruppierung)")
-
-        vor_dedup = len(veranstaltungen)
-        veranstaltungen = entferne_duplikate(veranstaltungen)
-        veranstaltungen.sort()
-        entfernt = vor_dedup - len(veranstaltungen)
-        staedte = len(set(v.stadt for v in veranstaltungen if v.stadt))
-        print(f"  => Gesamt: {len(veranstaltungen)} Veranstaltungen in {staedte} Orten ({entfernt} Duplikate entfernt)")
-
-        html = generiere_html(veranstaltungen, j, m, monate_liste)
-
         dateiname = dateiname_fuer_monat(j, m)
+        zeilen = []
+        veranstaltungen = []
+        for quelle, events in abruf.fuer_monat(j, m):
+            if events or quelle.schluessel == 'muensterland':
+                zeilen.append(f"  -> {len(events)} {quelle.label}")
+            veranstaltungen.extend(events)
+        quellen_zeilen[dateiname] = zeilen
         ausgabe_pfad = os.path.join(basis_pfad, dateiname)
-        with open(ausgabe_pfad, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        if idx == 0:
-            erster_dateiname = ausgabe_pfad
+        # Die Navigation hängt am Fenster: verschiebt es sich, ändern sich die Links zu den Nachbarmonaten
+        roh_hashes[dateiname] = f"{inhalts_hash(veranstaltungen)}|{idx > 0}|{idx < len(monate_liste) - 1}"
+        if letzte is not None and letzte.get(dateiname) == roh_hashes[dateiname] and os.path.exists(ausgabe_pfad):
+            continue
+        vorher = set(alte_abdruecke[dateiname]) if NEU_MARKIEREN and dateiname in alte_abdruecke else None
+        daten_pfad = os.path.join(basis_pfad, daten_dateiname_fuer_monat(j, m)) if shell else None
+        auftraege.append((veranstaltungen, j, m, monate_liste, ausgabe_pfad, vorher, daten_pfad,
+                          os.path.join(basis_pfad, ARCHIV_VERZEICHNIS), jetzt,
+                          os.path.join(basis_pfad, KALENDER_VERZEICHNIS), frueher))
+
+    ergebnisse = dict(zip((dateiname_fuer_monat(a[1], a[2]) for a in auftraege),
+                          _rendere_alle(auftraege, render_pool)))
+
+    manifest_pfad = os.path.join(basis_pfad, MANIFEST_DATEI)
+    manifest = lade_manifest(manifest_pfad)
+    neue_abdruecke = dict(alte_abdruecke)
+    bericht = neuer_bericht()
+    for idx, (j, m) in enumerate(monate_liste):
+        dateiname = dateiname_fuer_monat(j, m)
+        print(f"\n[{idx+1}/{len(monate_liste)}] {monatsnamen[m]} {j}:")
+        if dateiname not in ergebnisse:
+            print('\n'.join(quellen_zeilen[dateiname] + ["  => unverändert seit dem letzten Durchgang"]))
+            continue
+        render_zeilen, eintrag, abdruecke = ergebnisse[dateiname]
+        print('\n'.join(quellen_zeilen[dateiname] + render_zeilen))
+        trage_ein(manifest, dateiname, eintrag)
+
+        # Änderungen gegenüber dem letzten Lauf (nur, wenn es für den Monat einen gab)
+        if dateiname in alte_abdruecke:
+            diff = vergleiche(alte_abdruecke[dateiname], abdruecke)
+            bericht['monate'][dateiname] = bericht_eintrag(alte_abdruecke[dateiname], abdruecke, diff)
+            print(f"  ~> {kurzfassung(bericht['monate'][dateiname])} seit dem letzten Lauf")
+        neue_abdruecke[dateiname] = abdruecke
+
+    bewerte_lauf(status, modi, abruf, statistik_vorher, host_statistik())
+    status.speichere()
+    if letzte is not None:
+        letzte.update(roh_hashes)
+    if not ergebnisse:
+        return []
+
+    bereinige(manifest, basis_pfad)
+    if shell:
+        manifest['shell'] = SHELL_DATEI
+    speichere_manifest(manifest_pfad, manifest)
+    speichere_json(abdruck_pfad, {d: a for d, a in neue_abdruecke.items() if d in manifest['monate']})
+    speichere_json(os.path.join(basis_pfad, BERICHT_DATEI), bericht)
+
+    # iCal-Feeds aus den Teilstücken aller Monate; unveränderte Feeds bleiben unangetastet
+    feeds = schreibe_feeds(os.path.join(basis_pfad, KALENDER_VERZEICHNIS), monate_liste, kalender_titel())
+    print(f"Kalender: {len(feeds)} Feed(s) neu geschrieben")
+
+    # Service Worker: Vormonat, aktueller und nächster Monat (relativ zu heute) vorab cachen
+    vormonat_jahr, vormonat = (jetzt.year, jetzt.month - 1) if jetzt.month > 1 else (jetzt.year - 1, 12)
+    fenster = [dateiname_fuer_monat(j, m) for j, m in berechne_monate(vormonat_jahr, vormonat, 3)]
+    schreibe_atomar(os.path.join(basis_pfad, SW_DATEI), generiere_service_worker(manifest, fenster))
+
+    # Shell: alle Monate, deren Daten vorliegen; Start ist der erste generierte Monat
+    erster_monat_datei = dateiname_fuer_monat(monate_liste[0][0], monate_liste[0][1])
+    if shell:
+        mit_daten = sorted((e['jahr'], e['monat']) for e in manifest['monate'].values()
+                           if 'daten' in e and os.path.exists(os.path.join(basis_pfad, e['daten'])))
+        schreibe_atomar(os.path.join(basis_pfad, SHELL_DATEI), generiere_shell(mit_daten, monate_liste[0]))
+        erster_monat_datei = f"{SHELL_DATEI}#{monate_liste[0][0]}-{monate_liste[0][1]:02d}"
 
     # index.html generieren (Redirect zum aktuellen Monat)
-    erster_monat_datei = dateiname_fuer_monat(monate_liste[0][0], monate_liste[0][1])
     index_html = f'''<!DOCTYPE html>
 <html lang="de">
 <head>
@@ -882,16 +1592,199 @@ def main():
     <p>Weiterleitung zu <a href="{erster_monat_datei}">{erster_monat_datei}</a>...</p>
 </body>
 </html>'''
-    index_pfad = os.path.join(basis_pfad, 'index.html')
-    with open(index_pfad, 'w', encoding='utf-8') as f:
-        f.write(index_html)
+    # Zuletzt: index.html zeigt erst auf die neuen Seiten, wenn alle geschrieben sind
+    schreibe_atomar(os.path.join(basis_pfad, 'index.html'), index_html)
     print(f"index.html -> {erster_monat_datei}")
+    return list(ergebnisse)
+
+
+def _stopp_bei_signal() -> threading.Event:
+    """Event, das SIGTERM/SIGINT setzt — der laufende Durchgang wird noch zu Ende gebracht."""
+    stopp = threading.Event()
+
+    def beenden(signum, _frame):
+        print(f"\n{signal.Signals(signum).name} empfangen, beende nach dem laufenden Durchgang...", flush=True)
+        stopp.set()
+
+    signal.signal(signal.SIGTERM, beenden)
+    signal.signal(signal.SIGINT, beenden)
+    return stopp
+
+
+def daemon(start: tuple[int, int] | None, anzahl_monate: int, basis_pfad: str, shell: bool,
+           intervall_minuten: float, parse_prozesse: int) -> None:
+    """Läuft bis SIGTERM/SIGINT und aktualisiert alle intervall_minuten.
+
+    HTTP-Sitzungen, Parse- und Render-Prozesse bleiben zwischen den Durchgängen
+    warm; geschrieben werden nur Monate, deren Events sich geändert haben. Ein
+    Signal beendet den Daemon nach dem laufenden Durchgang (Dateien werden nie
+    halb geschrieben), in der Pause sofort. start=None: jeweils ab dem
+    aktuellen Monat.
+    """
+    stopp = _stopp_bei_signal()
+    aktiviere_sitzungen()
+    aktiviere_parse_prozesse(parse_prozesse)
+    render_pool = None
+    if RENDER_PROZESSE_MAX > 1:
+        render_pool = ProcessPoolExecutor(max_workers=min(RENDER_PROZESSE_MAX, anzahl_monate),
+                                          mp_context=multiprocessing.get_context('spawn'),
+                                          initializer=ignoriere_sigint)
+    letzte = {}
+    try:
+        while not stopp.is_set():
+            beginn = time.monotonic()
+            jetzt = datetime.now()
+            jahr, monat = start or (jetzt.year, jetzt.month)
+            print(f"\n[{jetzt.strftime('%d.%m.%Y %H:%M')}] Durchgang: {anzahl_monate} Monate ab {monat}/{jahr}")
+            print("=" * 50)
+            try:
+                geschrieben = erzeuge(berechne_monate(jahr, monat, anzahl_monate), basis_pfad, shell,
+                                      render_pool, letzte)
+                print(f"\n{len(geschrieben)} von {anzahl_monate} Monaten neu geschrieben", flush=True)
+            except Exception:
+                # Netz, Platte, aber auch ein Parser- oder Manifest-Fehler: der Daemon läuft weiter,
+                # der nächste Versuch kommt im nächsten Intervall (SIGINT/SystemExit gehen durch)
+                print(f"\nDurchgang abgebrochen:\n{traceback.format_exc()}", flush=True)
+            stopp.wait(max(0.0, intervall_minuten * 60 - (time.monotonic() - beginn)))
+    finally:
+        if render_pool:
+            render_pool.shutdown()
+        beende_parse_prozesse()
+        schliesse_sitzungen()
+        print("Daemon beendet.")
+
+
+def sammle_veranstaltungen(monate_liste: list[tuple[int, int]], basis_pfad: str) -> list[Veranstaltung]:
+    """Alle Quellen abrufen, gefiltert und dedupliziert wie für die Monatsseiten (für --serve)."""
+    status = QuellenStatus(os.path.join(basis_pfad, STATUS_DATEI))
+    modi = plane_lauf(status)
+    statistik_vorher = host_statistik()
+    abruf = hole_alle_quellen(monate_liste, modi)
+    bewerte_lauf(status, modi, abruf, statistik_vorher, host_statistik())
+    status.speichere()
+
+    alle = []
+    gesehen = set()  # mehrtägige Events stehen in jedem Monat, in den sie hineinlaufen
+    for j, m in monate_liste:
+        veranstaltungen = [v for _, events in abruf.fuer_monat(j, m) for v in events]
+        for v in entferne_duplikate(entferne_ausgeschlossene(veranstaltungen)):
+            if fingerabdruck(v) not in gesehen:
+                gesehen.add(fingerabdruck(v))
+                alle.append(v)
+    ordne_ein(alle)
+    return alle
+
+
+def serve(start: tuple[int, int] | None, anzahl_monate: int, basis_pfad: str, port: int,
+          intervall_minuten: float | None, parse_prozesse: int) -> None:
+    """Lokale JSON-API (api.py) bis SIGTERM/SIGINT.
+
+    Lädt die Events einmal in den Index; mit intervall_minuten wird regelmäßig
+    neu abgerufen und der Index im laufenden Server ausgetauscht.
+    """
+    from api import SERVE_HOST, EventIndex, starte_server  # http.server nur im Serve-Modus laden
+
+    stopp = _stopp_bei_signal()
+    aktiviere_sitzungen()
+    aktiviere_parse_prozesse(parse_prozesse)
+    server = None
+    try:
+        while not stopp.is_set():
+            jetzt = datetime.now()
+            jahr, monat = start or (jetzt.year, jetzt.month)
+            index = EventIndex(sammle_veranstaltungen(berechne_monate(jahr, monat, anzahl_monate), basis_pfad),
+                               fingerabdruck)
+            if server is None:
+                server = starte_server(index, port=port)
+                print(f"\nAPI läuft: http://{SERVE_HOST}:{port}/events?stadt=Münster&q=... "
+                      f"und /facetten (Ende mit SIGTERM/Strg+C)")
+            else:
+                server.index = index
+            print(f"[{jetzt.strftime('%d.%m.%Y %H:%M')}] {len(index.events)} Veranstaltungen geladen "
+                  f"(Stand {index.version})", flush=True)
+            stopp.wait(intervall_minuten * 60 if intervall_minuten else None)
+    finally:
+        if server:
+            server.shutdown()
+        beende_parse_prozesse()
+        schliesse_sitzungen()
+        print("API beendet.")
+
+
+def main():
+    """Hauptfunktion."""
+    import sys
+
+    argv = sys.argv[1:]
+    if argv[:1] == ['stats']:
+        from archiv import bericht, statistik
+        stat = statistik(os.path.join(os.path.dirname(__file__), ARCHIV_VERZEICHNIS))
+        print(json.dumps(stat, ensure_ascii=False, indent=1) if '--json' in argv else bericht(stat))
+        return
+
+    aufnahme_dir = _option_wert(argv, '--record')
+    wiedergabe_dir = _option_wert(argv, '--replay')
+    parse_prozesse = _option_wert(argv, '--parse-prozesse')
+    intervall = _option_wert(argv, '--intervall')
+    port = _option_wert(argv, '--port')
+    parse_prozesse = int(parse_prozesse) if parse_prozesse is not None else PARSE_PROZESSE_STANDARD
+    if aufnahme_dir and wiedergabe_dir:
+        raise SystemExit("--record und --replay schließen sich aus")
+    if aufnahme_dir:
+        aktiviere_aufnahme(aufnahme_dir)
+        print(f"Zeichne HTTP-Antworten auf nach {aufnahme_dir}")
+    if wiedergabe_dir:
+        aktiviere_wiedergabe(wiedergabe_dir)
+        print(f"Offline-Modus: Antworten aus {wiedergabe_dir}")
+
+    no_browser = '--no-browser' in argv
+    shell = '--shell' in argv
+    daemon_modus = '--daemon' in argv
+    serve_modus = '--serve' in argv
+    args = [a for a in argv if not a.startswith('--')]
+
+    jetzt = datetime.now()
+    jahr = int(args[0]) if len(args) > 0 else jetzt.year
+    monat = int(args[1]) if len(args) > 1 else jetzt.month
+    anzahl_monate = int(args[2]) if len(args) > 2 else 3
+
+    basis_pfad = os.path.dirname(__file__)
+    if shell:
+        os.makedirs(os.path.join(basis_pfad, DATEN_VERZEICHNIS), exist_ok=True)
+
+    if '--no-parse-cache' not in argv:
+        aktiviere_parse_cache(os.path.join(basis_pfad, PARSE_CACHE_VERZEICHNIS))
+
+    if serve_modus:
+        start = (jahr, monat) if len(args) > 1 else None
+        serve(start, anzahl_monate, basis_pfad, int(port) if port else SERVE_PORT_STANDARD,
+              float(intervall) if intervall else None, parse_prozesse)
+        return
+
+    if daemon_modus:
+        intervall = float(intervall) if intervall is not None else DAEMON_INTERVALL_MINUTEN
+        start = (jahr, monat) if len(args) > 1 else None
+        print(f"Daemon: {anzahl_monate} Monate, alle {intervall:g} Minuten (Ende mit SIGTERM/Strg+C)")
+        daemon(start, anzahl_monate, basis_pfad, shell, intervall, parse_prozesse)
+        return
+
+    monate_liste = berechne_monate(jahr, monat, anzahl_monate)
+
+    print(f"Generiere {anzahl_monate} Monate ab {monat}/{jahr}...")
+    print("=" * 50)
+
+    aktiviere_parse_prozesse(parse_prozesse)
+    try:
+        erzeuge(monate_liste, basis_pfad, shell)
+    finally:
+        beende_parse_prozesse()
 
     print("\n" + "=" * 50)
     print(f"Fertig! {anzahl_monate} Dateien generiert.")
 
-    if erster_dateiname and not no_browser:
-        webbrowser.open(f'file://{erster_dateiname}')
+    if not no_browser:
+        import webbrowser
+        webbrowser.open(f'file://{os.path.join(basis_pfad, dateiname_fuer_monat(jahr, monat))}')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,250 @@
+"""
+Spaltenarchiv aller Läufe: jede Veranstaltung jedes Laufs, nach Monat partitioniert.
+
+update.sh löscht Monatsseiten vor dem Vormonat; das Archiv behält alles. Pro
+Lauf und Monat entsteht ein Block archiv/JJJJ_MM/<lauf>.spalten. Blöcke werden
+nur angehängt, nie umgeschrieben. Hat sich ein Monat seit seinem letzten Block
+nicht geändert (gleicher Inhalts-Hash), entsteht kein neuer; ein Block gilt bis
+zum nächsten.
+
+Ein Block speichert spaltenweise: jede Spalte ist ein typisiertes Array
+(array-Modul, little-endian) und einzeln zlib-komprimiert. Texte sind
+wörterbuchkodiert (Werteliste + Codes), Tage stehen als Ordinalzahl. Die erste
+Zeile ist ein JSON-Kopf mit Spalten, Typen und Positionen. Eine Auswertung
+entpackt nur die Spalten, die sie braucht, und zählt direkt auf den
+Code-Arrays (Counter über das Array) — ohne eine Veranstaltung pro Zeile.
+
+Auswertung: python3 app.py stats [--json]
+"""
+
+import json
+import os
+import sys
+import zlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+
+from atomar import AtomareDatei
+from scraper import Veranstaltung
+
+
+ARCHIV_VERZEICHNIS = 'archiv'
+BLOCK_ENDUNG = '.spalten'
+FORMAT_VERSION = 1
+WOCHENTAGE = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
+STAEDTE_TOP = 15  # so viele Städte zeigt der Bericht einzeln
+ABDECKUNG_LAEUFE = 14  # so viele Lauftage zeigt die Abdeckung pro Quelle
+
+# Spalte -> Wert aus einer Veranstaltung; Texte werden wörterbuchkodiert
+_ZAHLEN = {
+    'tag': ('I', lambda v: v.datum.toordinal()),
+    'minute': ('H', lambda v: v.datum.hour * 60 + v.datum.minute),
+    'wochentag': ('B', lambda v: v.datum.weekday()),
+    'ende': ('I', lambda v: v.ende.toordinal() if v.ist_mehrtaegig() else 0),
+}
+_TEXTE = ['name', 'uhrzeit', 'ort', 'stadt', 'link', 'beschreibung', 'quelle', 'kategorie', 'rubrik']
+
+
+@dataclass
+class Spalte:
+    werte: array  # Zahlen bzw. Codes ins Wörterbuch
+    woerterbuch: list[str] | None = None
+
+    def zaehle(self) -> Counter:
+        """Häufigkeit jedes Werts (bei Texten: des Worts)."""
+        anzahl = Counter(self.werte)
+        if self.woerterbuch is None:
+            return anzahl
+        return Counter({self.woerterbuch[code]: n for code, n in anzahl.items()})
+
+
+def _als_bytes(werte: array) -> bytes:
+    if sys.byteorder == 'big':
+        werte = array(werte.typecode, werte)
+        werte.byteswap()
+    return werte.tobytes()
+
+
+def _aus_bytes(typ: str, roh: bytes) -> array:
+    werte = array(typ)
+    werte.frombytes(roh)
+    if sys.byteorder == 'big':
+        werte.byteswap()
+    return werte
+
+
+def _kodiere(texte: list[str]) -> tuple[array, list[str]]:
+    woerter = list(dict.fromkeys(texte))
+    code = {w: i for i, w in enumerate(woerter)}
+    return array('H' if len(woerter) <= 0xFFFF else 'I', map(code.__getitem__, texte)), woerter
+
+
+def partition(verzeichnis: str, jahr: int, monat: int) -> str:
+    return os.path.join(verzeichnis, f"{jahr}_{monat:02d}")
+
+
+def bloecke(verzeichnis: str) -> list[str]:
+    """Pfade aller Blöcke, nach Partition und Lauf sortiert."""
+    try:
+        partitionen = sorted(os.listdir(verzeichnis))
+    except OSError:
+        return []
+    pfade = []
+    for name in partitionen:
+        ordner = os.path.join(verzeichnis, name)
+        if os.path.isdir(ordner):
+            pfade.extend(os.path.join(ordner, d) for d in sorted(os.listdir(ordner)) if d.endswith(BLOCK_ENDUNG))
+    return pfade
+
+
+def lies_kopf(pfad: str) -> dict:
+    with open(pfad, 'rb') as f:
+        return json.loads(f.readline())
+
+
+def lies_spalten(pfad: str, namen: list[str]) -> dict[str, Spalte]:
+    """Nur die genannten Spalten eines Blocks entpacken."""
+    with open(pfad, 'rb') as f:
+        kopf = json.loads(f.readline())
+        start = f.tell()
+        spalten = {}
+        for name in namen:
+            info = kopf['spalten'][name]
+            f.seek(start + info['start'])
+            werte = _aus_bytes(info['typ'], zlib.decompress(f.read(info['laenge'])))
+            woerterbuch = None
+            if 'woerter' in info:
+                woerterbuch = json.loads(zlib.decompress(f.read(info['woerter'])))
+            spalten[name] = Spalte(werte, woerterbuch)
+    return spalten
+
+
+def haenge_an(verzeichnis: str, jahr: int, monat: int, lauf: datetime,
+              veranstaltungen: list[Veranstaltung], sha256: str) -> str | None:
+    """Schreibt einen Block für den Monat, sofern sich der Inhalt seit dem letzten geändert hat.
+
+    Gibt den Pfad des neuen Blocks zurück, sonst None.
+    """
+    ordner = partition(verzeichnis, jahr, monat)
+    os.makedirs(ordner, exist_ok=True)
+    vorhandene = sorted(d for d in os.listdir(ordner) if d.endswith(BLOCK_ENDUNG))
+    if vorhandene and lies_kopf(os.path.join(ordner, vorhandene[-1])).get('sha256') == sha256:
+        return None
+
+    teile = []
+    spalten = {}
+    position = 0
+    for name, (typ, wert) in _ZAHLEN.items():
+        roh = zlib.compress(_als_bytes(array(typ, map(wert, veranstaltungen))), 6)
+        spalten[name] = {'typ': typ, 'start': position, 'laenge': len(roh)}
+        teile.append(roh)
+        position += len(roh)
+    for name in _TEXTE:
+        codes, woerter = _kodiere([getattr(v, name) for v in veranstaltungen])
+        roh = zlib.compress(_als_bytes(codes), 6)
+        woerter_roh = zlib.compress(json.dumps(woerter, ensure_ascii=False).encode('utf-8'), 6)
+        spalten[name] = {'typ': codes.typecode, 'start': position, 'laenge': len(roh), 'woerter': len(woerter_roh)}
+        teile += [roh, woerter_roh]
+        position += len(roh) + len(woerter_roh)
+
+    kopf = {
+        'format': FORMAT_VERSION,
+        'lauf': lauf.isoformat(timespec='seconds'),
+        'jahr': jahr,
+        'monat': monat,
+        'anzahl': len(veranstaltungen),
+        'sha256': sha256,
+        'spalten': spalten,
+    }
+    pfad = os.path.join(ordner, lauf.strftime('%Y%m%dT%H%M%S') + BLOCK_ENDUNG)
+    with AtomareDatei(pfad) as datei:
+        datei.schreibe(json.dumps(kopf, separators=(',', ':')).encode('utf-8') + b'\n')
+        for teil in teile:
+            datei.schreibe(teil)
+    return pfad
+
+
+def statistik(verzeichnis: str) -> dict:
+    """Aggregate über das Archiv.
+
+    monate: pro Monat der letzte Stand, gezählt nach Quelle, Stadt, Wochentag und Rubrik.
+    abdeckung: pro Lauftag (letzter Lauf des Tages) die Events je Quelle in den Monaten
+    ab dem Lauf-Monat, jeweils mit dem zu diesem Zeitpunkt gültigen Block.
+    """
+    pfade = bloecke(verzeichnis)
+    koepfe = [lies_kopf(p) for p in pfade]
+
+    letzter = {}  # "JJJJ-MM" -> Pfad des jüngsten Blocks
+    for pfad, kopf in zip(pfade, koepfe):
+        letzter[f"{kopf['jahr']}-{kopf['monat']:02d}"] = pfad
+    monate = {}
+    for schluessel, pfad in sorted(letzter.items()):
+        spalten = lies_spalten(pfad, ['quelle', 'stadt', 'wochentag', 'rubrik'])
+        wochentage = spalten['wochentag'].zaehle()
+        monate[schluessel] = {
+            'gesamt': len(spalten['quelle'].werte),
+            'quellen': dict(spalten['quelle'].zaehle().most_common()),
+            'staedte': dict(spalten['stadt'].zaehle().most_common()),
+            'wochentage': {WOCHENTAGE[i]: wochentage.get(i, 0) for i in range(7)},
+            'rubriken': dict(spalten['rubrik'].zaehle().most_common()),
+        }
+
+    # Abdeckung: Blöcke in Laufreihenfolge abspielen, Stand je Monat fortschreiben
+    stand: dict[str, Counter] = {}
+    abdeckung = {}
+    for pfad, kopf in sorted(zip(pfade, koepfe), key=lambda pk: pk[1]['lauf']):
+        stand[f"{kopf['jahr']}-{kopf['monat']:02d}"] = lies_spalten(pfad, ['quelle'])['quelle'].zaehle()
+        lauf_monat = kopf['lauf'][:7]
+        summe = Counter()
+        for monat, anzahl in stand.items():
+            if monat >= lauf_monat:
+                summe += anzahl
+        abdeckung[kopf['lauf'][:10]] = dict(sorted(summe.items()))
+
+    return {
+        'bloecke': len(pfade),
+        'letzter_lauf': max((k['lauf'] for k in koepfe), default=None),
+        'monate': monate,
+        'abdeckung': dict(sorted(abdeckung.items())[-ABDECKUNG_LAEUFE:]),
+    }
+
+
+def _tabelle(titel: str, spalten: list[str], zeilen: dict[str, list[int]]) -> list[str]:
+    breite = max([len(titel)] + [len(z) for z in zeilen]) + 2
+    breiten = [max(len(s), 5) + 2 for s in spalten]
+    ausgabe = [f"{titel:<{breite}}" + ''.join(f"{s:>{b}}" for s, b in zip(spalten, breiten))]
+    for name, werte in zeilen.items():
+        ausgabe.append(f"{name:<{breite}}" + ''.join(f"{w:>{b}}" for w, b in zip(werte, breiten)))
+    return ausgabe
+
+
+def bericht(stat: dict) -> str:
+    """Lesbare Fassung von statistik()."""
+    if not stat['bloecke']:
+        return "Archiv ist leer — es füllt sich mit jedem Lauf von app.py."
+    monate = list(stat['monate'])
+    ausgabe = [f"Archiv: {stat['bloecke']} Blöcke, {len(monate)} Monate ({monate[0]} bis {monate[-1]}), "
+               f"letzter Lauf {stat['letzter_lauf']}", '']
+
+    def nach(feld, namen):
+        return {n: [stat['monate'][m][feld].get(n, 0) for m in monate] for n in namen}
+
+    def alle(feld):
+        summe = Counter()
+        for m in monate:
+            summe.update(stat['monate'][m][feld])
+        return [n for n, _ in summe.most_common()]
+
+    ausgabe += _tabelle('Veranstaltungen', monate, {'Gesamt': [stat['monate'][m]['gesamt'] for m in monate]})
+    ausgabe += [''] + _tabelle('Quelle', monate, nach('quellen', alle('quellen')))
+    ausgabe += [''] + _tabelle('Wochentag', monate, nach('wochentage', WOCHENTAGE))
+    ausgabe += [''] + _tabelle('Rubrik', monate, nach('rubriken', alle('rubriken')))
+    ausgabe += [''] + _tabelle(f'Stadt (Top {STAEDTE_TOP})', monate, nach('staedte', alle('staedte')[:STAEDTE_TOP]))
+
+    quellen = sorted({q for anzahl in stat['abdeckung'].values() for q in anzahl})
+    ausgabe += ['', 'Abdeckung: kommende Events je Quelle (letzter Lauf des Tages)']
+    ausgabe += _tabelle('Lauftag', quellen, {tag: [anzahl.get(q, 0) for q in quellen]
+                                              for tag, anzahl in stat['abdeckung'].items()})
+    return '\n'.join(ausgabe)
@@ -0,0 +1,58 @@
+"""Atomares Schreiben: Temp-Datei neben dem Ziel, fsync, os.replace.
+
+Leser (Webserver, update.sh, der nächste Lauf) sehen nie eine halbe Datei.
+Die Temp-Datei beginnt mit einem Punkt und endet auf .tmp — so fällt sie
+weder unter update.sh's veranstaltungen_*.html noch unter git (.gitignore).
+Geht beim Schreiben etwas schief, wird sie entfernt: Prozesse haben jeweils
+eine eigene PID, liegengebliebene Reste würden sich sonst sammeln.
+"""
+
+import os
+
+
+class AtomareDatei:
+    """Schreibt in eine Temp-Datei; uebernimm() ersetzt das Ziel, verwirf() räumt auf.
+
+    Als Kontextmanager: übernimmt am Ende des Blocks, verwirft bei einer Ausnahme.
+    """
+
+    def __init__(self, pfad: str):
+        self.pfad = pfad
+        verzeichnis, name = os.path.split(pfad)
+        self._tmp = os.path.join(verzeichnis, f".{name}.{os.getpid()}.tmp")
+        self._f = open(self._tmp, 'wb')
+
+    def schreibe(self, roh: bytes) -> None:
+        self._f.write(roh)
+
+    def uebernimm(self) -> None:
+        try:
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._f.close()
+            os.replace(self._tmp, self.pfad)
+        except BaseException:
+            self.verwirf()
+            raise
+
+    def verwirf(self) -> None:
+        self._f.close()
+        try:
+            os.remove(self._tmp)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'AtomareDatei':
+        return self
+
+    def __exit__(self, typ, wert, tb) -> None:
+        if typ is None:
+            self.uebernimm()
+        else:
+            self.verwirf()
+
+
+def schreibe_atomar(pfad: str, inhalt: str | bytes) -> None:
+    """Ganze Datei atomar schreiben; Text als UTF-8."""
+    with AtomareDatei(pfad) as datei:
+        datei.schreibe(inhalt.encode('utf-8') if isinstance(inhalt, str) else inhalt)
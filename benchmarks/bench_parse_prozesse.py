@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Skalierung der Parse-Stufe über Kerne: Threads gegen Worker-Prozesse.
+
+Erzeugt mit den Generatoren aus benchmarks/mock_server.py eine Menge
+HTML-Bodies (Theater, LWL, Halle) und parst sie mit den Parsern aus
+scraper.py — einmal mit N Threads, einmal mit N Prozessen
+(ProcessPoolExecutor wie in scraper.aktiviere_parse_prozesse). Threads
+skalieren wegen der GIL nicht; Prozesse sollten bis zur Kernzahl zulegen.
+
+Die Prozess-Pools werden vor der Messung aufgewärmt (Start und Import
+von bs4 zählen nicht mit), gemessen wird der Durchsatz in Events/Sekunde.
+
+Verwendung:
+    python3 benchmarks/bench_parse_prozesse.py
+    python3 benchmarks/bench_parse_prozesse.py --worker 1 2 4 8 --faktor 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import scraper  # noqa: E402
+from mock_server import halle_html, lwl_html, theater_html  # noqa: E402
+
+JAHR = 2026
+
+
+def auftraege(faktor: int) -> list[tuple]:
+    """(parser, body, args) für zwölf Monate Theater, LWL-Seiten und Halle, faktor-fach."""
+    monate = [(JAHR, m) for m in range(1, 13)]
+    liste = []
+    for _ in range(faktor):
+        for j, m in monate:
+            liste.append((scraper._parse_theater_muenster, theater_html(j, m, anzahl=120), (j, m)))
+            liste.append((scraper._parse_halle_muensterland, halle_html(j, m, anzahl=60), ([(j, m)],)))
+        for seite in range(1, 11):
+            liste.append((scraper._parse_lwl_seite, lwl_html(monate, seite, 10, pro_seite=40), (monate,)))
+    return liste
+
+
+def _miss(pool, liste: list[tuple]) -> tuple[float, int]:
+    start = time.perf_counter()
+    futures = [pool.submit(scraper._parse_zu_zeilen, parser, body, args) for parser, body, args in liste]
+    anzahl = sum(len(f.result()) for f in futures)
+    return time.perf_counter() - start, anzahl
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    kerne = os.cpu_count() or 1
+    parser.add_argument('--worker', type=int, nargs='+',
+                        default=sorted({1, 2, 4, kerne}), help='Anzahl Threads/Prozesse pro Messung')
+    parser.add_argument('--faktor', type=int, default=2, help='Vielfaches der Body-Menge (Standard 2)')
+    args = parser.parse_args()
+
+    liste = auftraege(args.faktor)
+    mb = sum(len(body) for _, body, _ in liste) / 1024 / 1024
+    print(f"{len(liste)} Bodies, {mb:.1f} MB, {kerne} Kern(e)")
+    print(f"\n{'Worker':>6} {'Threads':>12} {'Prozesse':>12} {'Speedup':>9}")
+
+    basis = None
+    for n in args.worker:
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            t_threads, anzahl = _miss(pool, liste)
+        with ProcessPoolExecutor(max_workers=n, mp_context=multiprocessing.get_context('spawn')) as pool:
+            _miss(pool, liste[:n])  # Aufwärmen: alle Worker starten und importieren
+            t_prozesse, _ = _miss(pool, liste)
+        basis = basis or t_threads
+        print(f"{n:>6} {anzahl / t_threads:>9.0f}/s {anzahl / t_prozesse:>9.0f}/s {basis / t_prozesse:>8.2f}x")
+    print("\nSpeedup: Prozesse gegenüber einem Thread.")
+
+
+if __name__ == '__main__':
+    main()
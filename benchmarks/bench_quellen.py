@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark der Parser pro Quelle auf aufgezeichneten Antworten.
+
+Misst Events/Sekunde und Spitzen-Speicher (tracemalloc) für die Parser aller
+Quellen sowie für entferne_duplikate und generiere_html. Die Antworten kommen
+aus einer Aufzeichnung (scraper.aktiviere_wiedergabe), es gibt also keinen
+Netzwerkzugriff und die Zahlen sind zwischen Läufen vergleichbar.
+
+Jeder Lauf wird an benchmarks/ergebnisse.jsonl angehängt (mit Commit-Hash),
+die Ausgabe zeigt die Veränderung zum vorherigen Lauf.
+
+Verwendung:
+    python3 benchmarks/bench_quellen.py --record benchmarks/fixtures 2026 7   # einmalig live aufzeichnen
+    python3 benchmarks/bench_quellen.py benchmarks/fixtures 2026 7            # Benchmark offline
+    python3 benchmarks/bench_quellen.py benchmarks/fixtures 2026 7 -n 20     # 20 Wiederholungen
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+BASIS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASIS)
+
+import scraper  # noqa: E402
+from app import entferne_duplikate, generiere_html  # noqa: E402
+
+ERGEBNIS_DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ergebnisse.jsonl')
+
+
+def _regioactive_muenster(jahr: int, monat: int) -> list:
+    city_id, slug, stadt_name = scraper.REGIOACTIVE_STAEDTE[0]
+    return scraper._hole_regioactive_stadt(city_id, slug, stadt_name, jahr, monat)
+
+
+QUELLEN_BENCHMARKS = [
+    ('hole_veranstaltungen', scraper.hole_veranstaltungen),
+    ('hole_digitalhub_events', scraper.hole_digitalhub_events),
+    ('hole_halle_muensterland_events', scraper.hole_halle_muensterland_events),
+    ('hole_theater_muenster', scraper.hole_theater_muenster),
+    ('hole_lwl_museum', scraper.hole_lwl_museum),
+    ('_hole_regioactive_stadt', _regioactive_muenster),
+]
+
+
+def _dpms_rohdaten(verzeichnis: str) -> list[dict]:
+    """Alle DPMS-Event-Dicts aus den aufgezeichneten POST-Antworten."""
+    events = []
+    for pfad in sorted(glob.glob(os.path.join(verzeichnis, 'post_www.muensterland.com_*.json'))):
+        with open(pfad, encoding='utf-8') as f:
+            eintrag = json.load(f)
+        try:
+            events.extend(json.loads(eintrag['body']).get('data', []))
+        except ValueError:
+            continue
+    return events
+
+
+def _miss(fn, wiederholungen: int) -> dict:
+    """Führt fn mehrfach aus: Median-Laufzeit, Anzahl Events, Spitzen-Speicher."""
+    ergebnis = fn()
+    anzahl = len(ergebnis) if hasattr(ergebnis, '__len__') else 0
+
+    zeiten = []
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        fn()
+        zeiten.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, spitze = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(zeiten)
+    return {
+        'events': anzahl,
+        'sekunden': round(median, 6),
+        'events_pro_s': round(anzahl / median, 1) if median > 0 else None,
+        'spitze_kb': round(spitze / 1024, 1),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASIS,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def _letzter_lauf() -> dict | None:
+    if not os.path.exists(ERGEBNIS_DATEI):
+        return None
+    with open(ERGEBNIS_DATEI, encoding='utf-8') as f:
+        zeilen = [z for z in f if z.strip()]
+    return json.loads(zeilen[-1]) if zeilen else None
+
+
+def aufzeichnen(verzeichnis: str, jahr: int, monat: int) -> None:
+    """Ruft alle Quellen einmal live ab und zeichnet die Antworten auf."""
+    scraper.aktiviere_aufnahme(verzeichnis)
+    for name, fn in QUELLEN_BENCHMARKS:
+        print(f"  {name}: {len(fn(jahr, monat))} Events aufgezeichnet")
+
+
+def benchmark(verzeichnis: str, jahr: int, monat: int, wiederholungen: int) -> dict:
+    scraper.aktiviere_wiedergabe(verzeichnis)
+    messungen = {}
+    alle = []
+
+    for name, fn in QUELLEN_BENCHMARKS:
+        events = fn(jahr, monat)
+        if not events:
+            print(f"  {name}: keine Aufnahme/keine Events — übersprungen")
+            continue
+        messungen[name] = _miss(lambda: fn(jahr, monat), wiederholungen)
+        alle.extend(events)
+
+    rohdaten = _dpms_rohdaten(verzeichnis)
+    if rohdaten:
+        messungen['_parse_event'] = _miss(
+            lambda: [v for v in map(scraper._parse_event, rohdaten) if v], wiederholungen)
+
+    if alle:
+        messungen['entferne_duplikate'] = _miss(lambda: entferne_duplikate(list(alle)), wiederholungen)
+        eindeutig = sorted(entferne_duplikate(list(alle)))
+        messung = _miss(lambda: generiere_html(eindeutig, jahr, monat, [(jahr, monat)]), wiederholungen)
+        messung['events'] = len(eindeutig)
+        messung['events_pro_s'] = round(len(eindeutig) / messung['sekunden'], 1) if messung['sekunden'] else None
+        messungen['generiere_html'] = messung
+
+    return {
+        'zeitpunkt': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'monat': f"{jahr}-{monat:02d}",
+        'wiederholungen': wiederholungen,
+        'messungen': messungen,
+    }
+
+
+def _ausgabe(lauf: dict, vorher: dict | None) -> None:
+    alt = (vorher or {}).get('messungen', {})
+    print(f"\n{'Stufe':<32} {'Events':>7} {'Events/s':>11} {'Spitze KB':>10} {'vs. vorher':>11}")
+    print('-' * 75)
+    for name, m in lauf['messungen'].items():
+        veraenderung = ''
+        if name in alt and alt[name].get('sekunden'):
+            prozent = (m['sekunden'] / alt[name]['sekunden'] - 1) * 100
+            veraenderung = f"{prozent:+.1f}% Zeit"
+        print(f"{name:<32} {m['events']:>7} {m['events_pro_s'] or 0:>11.1f} {m['spitze_kb']:>10.1f} {veraenderung:>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('verzeichnis', help='Verzeichnis mit aufgezeichneten Antworten')
+    parser.add_argument('jahr', type=int)
+    parser.add_argument('monat', type=int)
+    parser.add_argument('-n', '--wiederholungen', type=int, default=5)
+    parser.add_argument('--record', action='store_true', help='Antworten live aufzeichnen statt messen')
+    parser.add_argument('--nicht-speichern', action='store_true', help='Ergebnis nicht an ergebnisse.jsonl anhängen')
+    args = parser.parse_args()
+
+    if args.record:
+        aufzeichnen(args.verzeichnis, args.jahr, args.monat)
+        return
+
+    vorher = _letzter_lauf()
+    lauf = benchmark(args.verzeichnis, args.jahr, args.monat, args.wiederholungen)
+    _ausgabe(lauf, vorher)
+
+    if not args.nicht_speichern:
+        with open(ERGEBNIS_DATEI, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(lauf, ensure_ascii=False) + '\n')
+        print(f"\nErgebnis gespeichert in {os.path.relpath(ERGEBNIS_DATEI, BASIS)}")
+
+
+if __name__ == '__main__':
+    main()
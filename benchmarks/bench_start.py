@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Startzeit der Einstiegspunkte: Import-Kosten mit python -X importtime.
+
+Misst für jedes Modul in frischen Interpretern die kumulierte Importzeit aus
+-X importtime (Median über --laeufe) und prüft, ob requests oder bs4 dabei
+mitgeladen werden. scraper importiert beide erst beim ersten Abruf bzw.
+Parsen; wer nur rendert, dedupliziert oder das Manifest liest, bezahlt sie
+nicht. Dazu die Wandzeit von `pytest --collect-only` über tests/.
+
+Verwendung:
+    python3 benchmarks/bench_start.py
+    python3 benchmarks/bench_start.py --laeufe 10 --module app scraper
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+MODULE = ['app', 'scraper', 'quellen', 'manifest', 'aenderungen', 'service_worker']
+SCHWER = ['requests', 'bs4']  # sollen beim reinen Import nicht geladen werden
+
+
+def importtime(modul: str) -> tuple[float, set[str]]:
+    """Kumulierte Importzeit von modul in ms und die dabei geladenen Top-Level-Pakete."""
+    ergebnis = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modul}'],
+                              cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    gesamt = 0.0
+    geladen = set()
+    for zeile in ergebnis.stderr.splitlines():
+        if not zeile.startswith('import time:') or '|' not in zeile:
+            continue
+        _, kumuliert, name = zeile.split('|')
+        if not kumuliert.strip().isdigit():
+            continue  # Kopfzeile
+        geladen.add(name.strip().split('.')[0])
+        if name.strip() == modul:
+            gesamt = int(kumuliert) / 1000
+    return gesamt, geladen
+
+
+def pytest_sammeln() -> float:
+    """Wandzeit in ms für das Einsammeln aller Tests."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider', 'tests'],
+                   cwd=REPO_DIR, capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--laeufe', type=int, default=5, help='Messungen pro Modul (Median, Standard 5)')
+    parser.add_argument('--module', nargs='+', default=MODULE, help='zu messende Module')
+    args = parser.parse_args()
+
+    print(f"{'Modul':<16} {'Import':>10}  geladen")
+    for modul in args.module:
+        zeiten = []
+        for _ in range(args.laeufe):
+            ms, geladen = importtime(modul)
+            zeiten.append(ms)
+        schwer = ', '.join(p for p in SCHWER if p in geladen) or '-'
+        print(f"{modul:<16} {statistics.median(zeiten):>7.1f} ms  {schwer}")
+
+    zeiten = [pytest_sammeln() for _ in range(args.laeufe)]
+    print(f"\npytest --collect-only: {statistics.median(zeiten):.0f} ms (Median, inkl. Interpreterstart)")
+
+
+if __name__ == '__main__':
+    main()
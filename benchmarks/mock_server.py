@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Lokaler Mock-Server, der alle Veranstaltungsquellen nachbildet.
+
+Bildet die DPMS-POST-Pagination (muensterland.com), die Digital-Hub-JSON-API
+sowie die HTML-Seiten von Halle Münsterland, Theater Münster, LWL-Museum und
+regioactive (JSON-LD) mit synthetischen Daten nach. Latenz, Fehlerraten,
+403/429-Antworten und Seitenzahlen sind einstellbar, so lassen sich
+Nebenläufigkeit, Retry und Caching auf einem Rechner testen.
+
+Der Scraper wird über Umgebungsvariablen umgelenkt (siehe scraper._basis_url);
+der Server druckt beim Start die passenden export-Zeilen.
+
+Verwendung:
+    python3 benchmarks/mock_server.py
+    python3 benchmarks/mock_server.py --latenz 200 --fehlerrate 0.05 --rate-429 0.1
+    python3 benchmarks/mock_server.py --dpms-seiten 20 --lwl-seiten 8 --regioactive-403
+    eval "$(python3 benchmarks/mock_server.py --nur-env)" && python3 app.py --no-browser
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from calendar import monthrange
+from collections import Counter
+from datetime import datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+_STAEDTE = ['Münster', 'Rheine', 'Bocholt', 'Gronau', 'Ahlen', 'Dülmen', 'Borken', 'Coesfeld', 'Greven', 'Telgte']
+_TITEL = ['Konzert', 'Lesung', 'Führung', 'Workshop', 'Ausstellung', 'Flohmarkt', 'Theaterabend',
+          'Kabarett', 'Vortrag', 'Radtour', 'Orgelkonzert', 'Jazzabend', 'Poetry Slam', 'Meetup']
+_WOCHENTAGE = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+
+
+def _rng(*schluessel) -> random.Random:
+    """Deterministischer Zufall pro Seite — gleiche URL, gleiche Antwort."""
+    return random.Random('|'.join(map(str, schluessel)))
+
+
+def _zufallsdatum(rng: random.Random, jahr: int, monat: int) -> datetime:
+    tag = rng.randint(1, monthrange(jahr, monat)[1])
+    return datetime(jahr, monat, tag, rng.choice([0, 10, 15, 18, 19, 20]), rng.choice([0, 30]))
+
+
+def _titel(rng: random.Random, nr: int) -> str:
+    return f"{rng.choice(_TITEL)} {rng.choice(_STAEDTE)} Nr. {nr:05d}"
+
+
+# --- Seiten-Generatoren (auch von Benchmarks genutzt) ---
+
+def dpms_seite(jahr: int, monat: int, seite: int, seiten: int, pro_seite: int = 100) -> dict:
+    """DPMS-Antwort: volle Seiten bis zur letzten, die letzte nur halb gefüllt."""
+    if seite > seiten:
+        return {'data': []}
+    anzahl = pro_seite if seite < seiten else pro_seite // 2
+    rng = _rng('dpms', jahr, monat, seite)
+    events = []
+    for i in range(anzahl):
+        start = _zufallsdatum(rng, jahr, monat)
+        stadt = rng.choice(_STAEDTE)
+        event = {
+            'name': _titel(rng, seite * 1000 + i),
+            'start_datetime': start.strftime('%Y-%m-%dT%H:%M:00+02:00'),
+            'poi': {'name': f"Bürgerhaus {stadt}",
+                    'address': {'city': stadt, 'street': 'Marktplatz', 'house_number': str(rng.randint(1, 40))}},
+            'external_link': f"https://example.org/dpms/{seite}/{i}" if rng.random() < 0.6 else '',
+            'description_text': '<p>' + ' '.join(rng.choices(_TITEL, k=rng.randint(0, 30))) + '</p>',
+        }
+        if rng.random() < 0.1:
+            event['end_datetime'] = start.replace(day=min(start.day + 5, monthrange(jahr, monat)[1])).isoformat()
+        events.append(event)
+    return {'data': events}
+
+
+def digitalhub_json(jahr: int, monat: int, anzahl: int = 40) -> dict:
+    rng = _rng('digitalhub', jahr, monat)
+    events = []
+    for i in range(anzahl):
+        start = _zufallsdatum(rng, jahr, monat)
+        events.append({
+            'title': f"Digital {_titel(rng, i)}",
+            'start_date': start.strftime('%Y-%m-%d'),
+            'start_time': '18:00',
+            'end_time': '20:00',
+            'address': 'Hafenweg 16',
+            'city': 'Münster',
+            'link_url': f"https://example.org/digitalhub/{i}",
+            'desc': 'Meetup zu Digitalthemen',
+            'mode': rng.choice(['Workshop', 'Meetup', 'Pitch']),
+            'flag': '',
+        })
+    return {'data': events}
+
+
+def halle_html(jahr: int, monat: int, anzahl: int = 30) -> str:
+    rng = _rng('halle', jahr, monat)
+    karten = []
+    for i in range(anzahl):
+        tag = rng.randint(1, monthrange(jahr, monat)[1])
+        karten.append(
+            f'<div class="card" data-date="{monat:02d}-{tag:02d}-{jahr % 100:02d}" '
+            f'data-month="{monat}" data-year="{jahr % 100}">'
+            f'<div class="m-appointment--title"><h4>{escape(_titel(rng, i))}</h4></div>'
+            f'<a href="https://www.eventim.de/event/{i}">Tickets</a></div>'
+        )
+    return f"<html><body>{''.join(karten)}</body></html>"
+
+
+def theater_html(jahr: int, monat: int, anzahl: int = 60) -> str:
+    rng = _rng('theater', jahr, monat)
+    teile = []
+    for i in range(anzahl):
+        tag = rng.randint(1, monthrange(jahr, monat)[1])
+        teile.append(
+            '<div class="tm-performance">'
+            f'<div class="tm-performance__dayNumber">{tag}</div>'
+            f'<div class="tm-performance__performanceTime">{rng.choice(["19.30", "20.00", "16.30"])} Uhr</div>'
+            f'<div class="tm-performance__location">{rng.choice(["Großes Haus", "Kleines Haus"])}</div>'
+            f'<div class="tm-performance__productionName"><a href="/produktion/{i}">{escape(_titel(rng, i))}</a></div>'
+            f'<ul><li class="tm-performance__category">{rng.choice(["Oper", "Schauspiel", "Tanz"])}</li></ul>'
+            '<div class="tm-performance__productionInfo">Eine Produktion des Theater Münster</div>'
+            '</div>'
+        )
+    return f"<html><body>{''.join(teile)}</body></html>"
+
+
+def lwl_html(monate: list[tuple[int, int]], seite: int, seiten: int, pro_seite: int = 20) -> str:
+    """LWL-Terminliste über den vom/bis-Zeitraum mit ul.pagination (Seitenzahlen plus '›')."""
+    rng = _rng('lwl', *monate, seite)
+    elemente = []
+    if seite <= seiten:
+        for i in range(pro_seite):
+            start = _zufallsdatum(rng, *rng.choice(monate))
+            eid = seite * 1000 + i
+            elemente.append(
+                '<div class="event-element">'
+                f'<p class="event-date">{_WOCHENTAGE[start.weekday()]}, {start.day}.{start.month}.{start.year}</p>'
+                '<p class="event-time">10.30 - 12.30 Uhr</p>'
+                f'<h4 class="event-title"><span id="event-title-{eid}">{escape(_titel(rng, eid))}</span></h4>'
+                '<p class="event-description">Führung durch die Sammlung</p>'
+                f'<p class="event-type">{rng.choice(["Erwachsene", "Familien", "Kinder"])}</p>'
+                '</div>'
+            )
+    punkte = []
+    for p in range(1, seiten + 1):
+        if p == seite:
+            punkte.append(f'<li class="active"><span>{p}</span></li>')
+        else:
+            punkte.append(f'<li><a href="?p={p}">{p}</a></li>')
+    if seite < seiten:
+        punkte.append(f'<li><a href="?p={seite + 1}">›</a></li>')
+    else:
+        punkte.append('<li class="disabled"><span>›</span></li>')
+    return f"<html><body>{''.join(elemente)}<ul class=\"pagination\">{''.join(punkte)}</ul></body></html>"
+
+
+def regioactive_html(stadt: str, jahr: int, monat: int, anzahl: int = 25) -> str:
+    rng = _rng('regioactive', stadt, jahr, monat)
+    items = []
+    for i in range(anzahl):
+        start = _zufallsdatum(rng, jahr, monat)
+        items.append({'item': {
+            '@type': 'Event',
+            'name': _titel(rng, i),
+            'startDate': start.strftime('%Y-%m-%dT%H:%M:00+02:00'),
+            'location': {'name': f"Club {stadt}", 'address': {'streetAddress': 'Hauptstraße 1'}},
+            'url': f"https://example.org/regioactive/{stadt}/{i}",
+            'description': 'Live-Musik',
+        }})
+    daten = json.dumps({'@type': 'ItemList', 'itemListElement': items}, ensure_ascii=False)
+    return f'<html><head><script type="application/ld+json">{daten}</script></head><body></body></html>'
+
+
+CLOUDFLARE_CHALLENGE = ('<html><head><title>Just a moment...</title></head>'
+                        '<body><div id="challenge-platform">cf-chl</div></body></html>')
+
+
+# --- Server ---
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routen: /dpms/, /api/events, /halle/, /spielplan, /lwl/, /regioactive/..."""
+
+    config: argparse.Namespace
+    statistik: Counter
+    statistik_lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        if self.config.log:
+            super().log_message(format, *args)
+
+    def _zaehle(self, route: str, status: int) -> None:
+        with self.statistik_lock:
+            self.statistik[f"{route} {status}"] += 1
+
+    def _sende(self, route: str, status: int, body: str, content_type: str, headers: dict | None = None):
+        daten = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(daten)))
+        for key, wert in (headers or {}).items():
+            self.send_header(key, wert)
+        self.end_headers()
+        self.wfile.write(daten)
+        self._zaehle(route, status)
+
+    def _stoerung(self, route: str) -> bool:
+        """Latenz und zufällige Fehler; True, wenn bereits eine Fehlerantwort gesendet wurde."""
+        cfg = self.config
+        if cfg.latenz:
+            time.sleep(max(0.0, random.gauss(cfg.latenz, cfg.latenz * 0.25)) / 1000)
+        if route == 'regioactive' and cfg.regioactive_403:
+            self._sende(route, 403, CLOUDFLARE_CHALLENGE, 'text/html; charset=utf-8')
+            return True
+        wurf = random.random()
+        if wurf < cfg.rate_429:
+            self._sende(route, 429, 'Too Many Requests', 'text/plain', {'Retry-After': str(cfg.retry_after)})
+            return True
+        wurf -= cfg.rate_429
+        if wurf < cfg.rate_403:
+            self._sende(route, 403, 'Forbidden', 'text/plain')
+            return True
+        wurf -= cfg.rate_403
+        if wurf < cfg.fehlerrate:
+            self._sende(route, 500, 'Internal Server Error', 'text/plain')
+            return True
+        return False
+
+    def _monat(self, werte: dict, schluessel: str, fallback: datetime | None = None) -> tuple[int, int]:
+        roh = werte.get(schluessel, [''])[0]
+        try:
+            if '.' in roh:  # LWL: 01.07.2026
+                _, monat, jahr = roh.split('.')
+                return int(jahr), int(monat)
+            jahr, monat = roh.split('-')[:2]
+            return int(jahr), int(monat)
+        except ValueError:
+            jetzt = fallback or datetime.now()
+            return jetzt.year, jetzt.month
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if not url.path.startswith('/dpms'):
+            return self._sende('unbekannt', 404, 'not found', 'text/plain')
+        if self._stoerung('dpms'):
+            return
+        laenge = int(self.headers.get('Content-Length', 0))
+        form = parse_qs(self.rfile.read(laenge).decode('utf-8'))
+        jahr, monat = self._monat(form, 'from')
+        seite = int(form.get('page[number]', ['1'])[0])
+        pro_seite = int(form.get('page[size]', ['100'])[0])
+        antwort = dpms_seite(jahr, monat, seite, self.config.dpms_seiten, pro_seite)
+        self._sende('dpms', 200, json.dumps(antwort, ensure_ascii=False), 'application/json')
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        pfad = url.path
+
+        if pfad == '/_stats':
+            with self.statistik_lock:
+                return self._sende('stats', 200, json.dumps(dict(self.statistik)), 'application/json')
+
+        if pfad.startswith('/api/events'):
+            if self._stoerung('digitalhub'):
+                return
+            jetzt = datetime.now()
+            return self._sende('digitalhub', 200, json.dumps(digitalhub_json(jetzt.year, jetzt.month),
+                                                            ensure_ascii=False), 'application/json')
+        if pfad.startswith('/halle'):
+            if self._stoerung('halle'):
+                return
+            jetzt = datetime.now()
+            return self._sende('halle', 200, halle_html(jetzt.year, jetzt.month), 'text/html; charset=utf-8')
+        if pfad.startswith('/spielplan'):
+            if self._stoerung('theater'):
+                return
+            jahr, monat = self._monat(query, 'date')
+            return self._sende('theater', 200, theater_html(jahr, monat), 'text/html; charset=utf-8')
+        if pfad.startswith('/lwl'):
+            if self._stoerung('lwl'):
+                return
+            von, bis = self._monat(query, 'vom'), self._monat(query, 'bis')
+            monate = [von]
+            while monate[-1] < bis:
+                jahr, monat = monate[-1]
+                monate.append((jahr + monat // 12, monat % 12 + 1))
+            # Seitenzahl wächst mit dem Zeitraum wie auf der echten Seite
+            seiten = self.config.lwl_seiten * len(monate)
+            seite = int(query.get('p', ['1'])[0])
+            return self._sende('lwl', 200, lwl_html(monate, seite, seiten), 'text/html; charset=utf-8')
+        if pfad.startswith('/regioactive'):
+            if self._stoerung('regioactive'):
+                return
+            teile = pfad.strip('/').split('/')
+            slug = teile[3] if len(teile) > 3 else 'stadt'
+            jahr, monat = self._monat({'m': [teile[-1]]}, 'm')
+            return self._sende('regioactive', 200, regioactive_html(slug, jahr, monat), 'text/html; charset=utf-8')
+
+        return self._sende('unbekannt', 404, 'not found', 'text/plain')
+
+
+def umgebung(basis: str) -> dict[str, str]:
+    """Umgebungsvariablen, die den Scraper auf den Mock-Server umlenken."""
+    return {
+        'VERANSTALTUNGEN_API_URL': f"{basis}/dpms/",
+        'VERANSTALTUNGEN_DIGITALHUB_API_URL': f"{basis}/api/events",
+        'VERANSTALTUNGEN_HALLE_MUENSTERLAND_URL': f"{basis}/halle/",
+        'VERANSTALTUNGEN_THEATER_MS_URL': f"{basis}/spielplan",
+        'VERANSTALTUNGEN_LWL_MUSEUM_URL': f"{basis}/lwl/",
+        'VERANSTALTUNGEN_REGIOACTIVE_URL_TEMPLATE':
+            f"{basis}/regioactive/events/{{city_id}}/{{slug}}/veranstaltungen-party-konzerte/monat/{{jahr}}-{{monat:02d}}",
+    }
+
+
+def starte(config: argparse.Namespace) -> ThreadingHTTPServer:
+    """Startet den Server im Hintergrund-Thread (z.B. aus Tests oder Lasttests)."""
+    handler = type('KonfigurierterMockHandler', (MockHandler,), {'config': config, 'statistik': Counter()})
+    server = ThreadingHTTPServer((config.host, config.port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8765)
+    p.add_argument('--latenz', type=float, default=0, help='mittlere Latenz in ms (±25%%)')
+    p.add_argument('--fehlerrate', type=float, default=0.0, help='Anteil 500-Antworten')
+    p.add_argument('--rate-403', type=float, default=0.0, help='Anteil 403-Antworten')
+    p.add_argument('--rate-429', type=float, default=0.0, help='Anteil 429-Antworten (mit Retry-After)')
+    p.add_argument('--retry-after', type=int, default=1, help='Retry-After in Sekunden bei 429')
+    p.add_argument('--regioactive-403', action='store_true', help='regioactive dauerhaft blockiert (Cloudflare)')
+    p.add_argument('--dpms-seiten', type=int, default=3)
+    p.add_argument('--lwl-seiten', type=int, default=3)
+    p.add_argument('--log', action='store_true', help='jeden Request protokollieren')
+    p.add_argument('--nur-env', action='store_true', help='nur die export-Zeilen ausgeben')
+    return p
+
+
+def main():
+    config = parser().parse_args()
+    basis = f"http://{config.host}:{config.port}"
+    exports = '\n'.join(f"export {k}='{v}'" for k, v in umgebung(basis).items())
+    if config.nur_env:
+        print(exports)
+        return
+
+    server = starte(config)
+    print(f"Mock-Server läuft auf {basis} (Statistik: {basis}/_stats)")
+    print("Scraper umlenken mit:\n" + exports)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        handler = server.RequestHandlerClass
+        print("\nRequests pro Route/Status:")
+        for schluessel, anzahl in sorted(handler.statistik.items()):
+            print(f"  {schluessel:<20} {anzahl}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Skalierungsbericht: Laufzeit und Speicher pro Stufe gegen die Anzahl Events.
+
+Erzeugt für jede Größe synthetische Veranstaltungen (benchmarks/synthetisch.py)
+und misst entferne_ausgeschlossene, entferne_duplikate und generiere_html.
+Aus je zwei benachbarten Größen wird der Exponent k in t ~ n^k geschätzt;
+k deutlich über 1 markiert super-lineares Verhalten.
+
+filterTermine läuft im Browser und kann hier nicht gemessen werden. Als
+Stellvertreter werden die HTML-Größe und die Anzahl .termin-Elemente berichtet
+(filterTermine ist linear in beidem); mit --html-ausgabe werden die Seiten
+zusätzlich geschrieben, um sie im Browser zu messen.
+
+Ergebnis: benchmarks/skalierung.csv, bei installiertem matplotlib zusätzlich
+benchmarks/skalierung.png.
+
+Verwendung:
+    python3 benchmarks/skalierung.py
+    python3 benchmarks/skalierung.py --groessen 10000 30000 100000
+    python3 benchmarks/skalierung.py --duplikate 0.3 --html-ausgabe /tmp/skalierung
+"""
+
+import argparse
+import csv
+import math
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from app import entferne_ausgeschlossene, entferne_duplikate, generiere_html  # noqa: E402
+from synthetisch import erzeuge_veranstaltungen  # noqa: E402
+
+JAHR, MONAT = 2026, 7
+
+
+def _stufen(events: list) -> list[tuple[str, callable]]:
+    eindeutig = sorted(entferne_duplikate(list(events)))
+    return [
+        ('entferne_ausgeschlossene', lambda: entferne_ausgeschlossene(events)),
+        ('entferne_duplikate', lambda: entferne_duplikate(list(events))),
+        ('generiere_html', lambda: generiere_html(eindeutig, JAHR, MONAT, [(JAHR, MONAT)])),
+    ]
+
+
+def _miss(fn, mit_speicher: bool) -> tuple[float, float | None, object]:
+    start = time.perf_counter()
+    ergebnis = fn()
+    sekunden = time.perf_counter() - start
+
+    spitze_mb = None
+    if mit_speicher:
+        tracemalloc.start()
+        fn()
+        spitze_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return sekunden, spitze_mb, ergebnis
+
+
+def _exponent(n1: int, t1: float, n2: int, t2: float) -> float | None:
+    if t1 <= 0 or t2 <= 0 or n1 == n2:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def messe(groessen: list[int], duplikat_rate: float, mit_speicher: bool,
+          html_ausgabe: str | None) -> list[dict]:
+    zeilen = []
+    for n in groessen:
+        events = erzeuge_veranstaltungen(n, JAHR, MONAT, duplikat_rate=duplikat_rate)
+        print(f"\nn = {n}")
+        for stufe, fn in _stufen(events):
+            sekunden, spitze_mb, ergebnis = _miss(fn, mit_speicher)
+            zeile = {'n': n, 'stufe': stufe, 'sekunden': round(sekunden, 4),
+                     'spitze_mb': round(spitze_mb, 2) if spitze_mb is not None else ''}
+            if stufe == 'generiere_html':
+                zeile['html_kb'] = round(len(ergebnis.encode('utf-8')) / 1024)
+                zeile['dom_termine'] = ergebnis.count('<div class="termin"')
+                if html_ausgabe:
+                    os.makedirs(html_ausgabe, exist_ok=True)
+                    with open(os.path.join(html_ausgabe, f"skalierung_{n}.html"), 'w', encoding='utf-8') as f:
+                        f.write(ergebnis)
+            zeilen.append(zeile)
+            print(f"  {stufe:<26} {sekunden:>9.3f} s"
+                  + (f" {spitze_mb:>9.1f} MB" if spitze_mb is not None else ''))
+    return zeilen
+
+
+def bericht(zeilen: list[dict]) -> None:
+    """Druckt die geschätzten Exponenten pro Stufe und markiert super-lineares Wachstum."""
+    print("\nGeschätzter Exponent k (t ~ n^k) zwischen benachbarten Größen:")
+    for stufe in dict.fromkeys(z['stufe'] for z in zeilen):
+        punkte = [(z['n'], z['sekunden']) for z in zeilen if z['stufe'] == stufe]
+        exponenten = [_exponent(n1, t1, n2, t2) for (n1, t1), (n2, t2) in zip(punkte, punkte[1:])]
+        text = ', '.join(f"{k:.2f}" if k is not None else '–' for k in exponenten)
+        warnung = '  <-- super-linear' if any(k and k > 1.3 for k in exponenten) else ''
+        print(f"  {stufe:<26} {text}{warnung}")
+
+
+def speichere(zeilen: list[dict]) -> None:
+    csv_pfad = os.path.join(BENCH_DIR, 'skalierung.csv')
+    felder = ['n', 'stufe', 'sekunden', 'spitze_mb', 'html_kb', 'dom_termine']
+    with open(csv_pfad, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=felder)
+        writer.writeheader()
+        writer.writerows(zeilen)
+    print(f"\nCSV: {os.path.relpath(csv_pfad)}")
+
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib nicht installiert — kein Diagramm erzeugt")
+        return
+
+    fig, (ax_zeit, ax_speicher) = plt.subplots(1, 2, figsize=(12, 5))
+    for stufe in dict.fromkeys(z['stufe'] for z in zeilen):
+        punkte = [z for z in zeilen if z['stufe'] == stufe]
+        ax_zeit.plot([z['n'] for z in punkte], [z['sekunden'] for z in punkte], marker='o', label=stufe)
+        if all(z['spitze_mb'] != '' for z in punkte):
+            ax_speicher.plot([z['n'] for z in punkte], [z['spitze_mb'] for z in punkte], marker='o', label=stufe)
+    for ax, titel, einheit in ((ax_zeit, 'Laufzeit', 's'), (ax_speicher, 'Spitzen-Speicher', 'MB')):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Events pro Monat')
+        ax.set_ylabel(einheit)
+        ax.set_title(titel)
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    png_pfad = os.path.join(BENCH_DIR, 'skalierung.png')
+    fig.tight_layout()
+    fig.savefig(png_pfad, dpi=120)
+    print(f"Diagramm: {os.path.relpath(png_pfad)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--groessen', type=int, nargs='+', default=[1000, 3000, 10000])
+    parser.add_argument('--duplikate', type=float, default=0.15, help='Anteil Duplikate (Standard 0.15)')
+    parser.add_argument('--ohne-speicher', action='store_true', help='tracemalloc-Messung auslassen (schneller)')
+    parser.add_argument('--html-ausgabe', help='Verzeichnis für die erzeugten HTML-Seiten')
+    args = parser.parse_args()
+
+    zeilen = messe(sorted(args.groessen), args.duplikate, not args.ohne_speicher, args.html_ausgabe)
+    bericht(zeilen)
+    speichere(zeilen)
+
+
+if __name__ == '__main__':
+    main()
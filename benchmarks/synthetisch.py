@@ -0,0 +1,119 @@
+"""
+Synthetische Veranstaltungen für Last- und Skalierungstests.
+
+Erzeugt realistisch verteilte Veranstaltung-Objekte: Städte nach Zipf-Verteilung
+(Münster dominiert), Namen aus Bausteinen, Wochenend- und Festtags-Spitzen sowie
+einen einstellbaren Anteil an Duplikaten aus anderen Quellen (leicht abgewandelte
+Namen am selben Tag), wie sie entferne_duplikate in echten Läufen sieht.
+"""
+
+import os
+import random
+import sys
+from calendar import monthrange
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import Veranstaltung  # noqa: E402
+
+
+STAEDTE = [
+    'Münster', 'Rheine', 'Bocholt', 'Gronau', 'Ibbenbüren', 'Ahlen', 'Dülmen',
+    'Borken', 'Coesfeld', 'Greven', 'Emsdetten', 'Warendorf', 'Steinfurt',
+    'Lengerich', 'Oelde', 'Ahaus', 'Telgte', 'Beckum', 'Lüdinghausen', 'Vreden',
+    'Stadtlohn', 'Billerbeck', 'Havixbeck', 'Nottuln', 'Senden', 'Ochtrup',
+    'Tecklenburg', 'Sendenhorst', 'Everswinkel', 'Ostbevern', 'Olfen', 'Heek',
+]
+
+_TYPEN = [
+    'Konzert', 'Lesung', 'Führung', 'Workshop', 'Ausstellung', 'Flohmarkt',
+    'Stadtfest', 'Theater', 'Kabarett', 'Vortrag', 'Radtour', 'Kinderprogramm',
+    'Orgelkonzert', 'Jazzabend', 'Poetry Slam', 'Meetup', 'Wochenmarkt', 'Yoga',
+]
+_ADJEKTIVE = [
+    'Großes', 'Offenes', 'Sommerliches', 'Musikalisches', 'Historisches',
+    'Literarisches', 'Plattdeutsches', 'Internationales', 'Kleines', 'Festliches',
+]
+_ZUSAETZE = [
+    'im Schlossgarten', 'am Aasee', 'in der Stadthalle', 'im Kulturzentrum',
+    'für Familien', 'mit Live-Band', 'zum Mitmachen', 'an der Ems',
+    'im Museum', 'auf dem Marktplatz', '2026', 'für Einsteiger',
+]
+_ORTE = ['Stadthalle', 'Kulturzentrum', 'Rathaus', 'Pfarrkirche', 'Bürgerhaus', 'Museum', 'Jugendzentrum']
+_QUELLEN = [('muensterland', 80), ('digitalhub', 3), ('halle_muensterland', 2),
+            ('theater_muenster', 8), ('lwl_museum', 4), ('regioactive', 3)]
+
+
+def _tag_gewichte(jahr: int, monat: int, rng: random.Random) -> list[float]:
+    """Gewicht pro Tag: Wochenenden stärker, dazu zwei Festtage mit Spitzenlast."""
+    letzter_tag = monthrange(jahr, monat)[1]
+    gewichte = []
+    for tag in range(1, letzter_tag + 1):
+        wochentag = datetime(jahr, monat, tag).weekday()
+        gewichte.append({4: 2.0, 5: 3.0, 6: 2.5}.get(wochentag, 1.0))
+    for festtag in rng.sample(range(letzter_tag), k=2):
+        gewichte[festtag] *= 4
+    return gewichte
+
+
+def _variante(name: str, rng: random.Random) -> str:
+    """Schreibvariante eines Namens, die entferne_duplikate als Duplikat erkennen soll."""
+    return rng.choice([
+        name,
+        name.upper(),
+        f"{name}!",
+        f"Großes {name}" if not name.startswith('Großes') else name,
+        name.replace(' ', '  '),
+    ])
+
+
+def erzeuge_veranstaltungen(anzahl: int, jahr: int = 2026, monat: int = 7,
+                            duplikat_rate: float = 0.15, seed: int = 0) -> list[Veranstaltung]:
+    """Erzeugt anzahl Veranstaltungen in einem Monat, davon ca. duplikat_rate Duplikate."""
+    rng = random.Random(seed)
+    tage = list(range(1, monthrange(jahr, monat)[1] + 1))
+    tag_gewichte = _tag_gewichte(jahr, monat, rng)
+    stadt_gewichte = [1 / (rang + 1) ** 1.1 for rang in range(len(STAEDTE))]
+    stadt_gewichte[0] *= 3  # Münster ist deutlich größer als der Rest
+    quellen, quellen_gewichte = zip(*_QUELLEN)
+
+    veranstaltungen: list[Veranstaltung] = []
+    for i in range(anzahl):
+        if veranstaltungen and rng.random() < duplikat_rate:
+            vorlage = rng.choice(veranstaltungen)
+            veranstaltungen.append(Veranstaltung(
+                name=_variante(vorlage.name, rng),
+                datum=vorlage.datum,
+                uhrzeit=rng.choice([vorlage.uhrzeit, 'siehe Website']),
+                ort=vorlage.ort if rng.random() < 0.5 else '',
+                stadt=vorlage.stadt,
+                link=vorlage.link if rng.random() < 0.3 else '',
+                beschreibung='',
+                quelle=rng.choices(quellen, quellen_gewichte)[0],
+            ))
+            continue
+
+        tag = rng.choices(tage, tag_gewichte)[0]
+        stunde = rng.choice([10, 11, 14, 15, 16, 18, 19, 19, 20, 20])
+        ganztaegig = rng.random() < 0.15
+        datum = datetime(jahr, monat, tag, 0 if ganztaegig else stunde, 0 if ganztaegig else rng.choice([0, 30]))
+        stadt = rng.choices(STAEDTE, stadt_gewichte)[0]
+        # Laufende Nummer mit fester Breite, damit kein Name Teilstring eines anderen ist
+        name = f"{rng.choice(_ADJEKTIVE)} {rng.choice(_TYPEN)} {rng.choice(_ZUSAETZE)} Nr. {i:06d}"
+        quelle = rng.choices(quellen, quellen_gewichte)[0]
+
+        veranstaltungen.append(Veranstaltung(
+            name=name,
+            datum=datum,
+            uhrzeit='ganztägig' if ganztaegig else datum.strftime('%H:%M Uhr'),
+            ort=f"{rng.choice(_ORTE)} {stadt}",
+            stadt=stadt,
+            link=f"https://example.org/events/{i}" if rng.random() < 0.7 else '',
+            beschreibung=' '.join(rng.choices(_ZUSAETZE + _TYPEN, k=rng.randint(0, 25))),
+            quelle=quelle,
+            kategorie=rng.choice(['', '', 'Workshop', 'Konzert/Show', 'Familie']),
+        ))
+
+    rng.shuffle(veranstaltungen)
+    return veranstaltungen
@@ -0,0 +1,255 @@
+"""iCalendar-Feeds zum Abonnieren (kalender/*.ics).
+
+Feeds: alle.ics (ganzes Münsterland), region-<kürzel>.ics (je Region, siehe
+regionen.py) und quelle-<schlüssel>.ics (je Quelle). Sie entstehen im selben
+Durchgang wie die Seiten, aus denselben gefilterten Events — ohne neuen Abruf:
+
+1. rendere_monat schreibt pro Monat und Feed ein Teilstück mit den VEVENTs
+   (kalender/.teile/JJJJ_MM/<feed>.ics), in einem Durchlauf über die Events.
+2. erzeuge setzt daraus die Feeds zusammen: Kopf, Teilstücke in
+   Monatsreihenfolge, Ende — zeilenweise gestreamt, ohne einen Feed im
+   Speicher aufzubauen. Monate, die der Daemon nicht neu rendert, behalten ihre
+   Teilstücke aus dem vorigen Durchgang.
+
+Jede Datei wird über eine Temp-Datei geschrieben und dabei gehasht; nur wenn
+sich der SHA-256 vom vorhandenen unterscheidet, ersetzt sie das Ziel. Ein
+unveränderter Feed behält so Inhalt und Änderungszeit, und Kalender-Apps, die
+ihn abfragen, bekommen vom Webserver ein billiges 304.
+
+Dafür muss die Ausgabe deterministisch sein: UID ist der Fingerabdruck des
+Events, DTSTAMP und LAST-MODIFIED der Lauf, in dem sich sein event_hash
+zuletzt geändert hat (steht in fingerabdruecke.json) — nicht jeder Lauf.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+from datetime import timedelta
+from typing import Callable
+
+from atomar import AtomareDatei
+from regionen import kuerzel, region
+from scraper import Veranstaltung
+
+
+KALENDER_VERZEICHNIS = 'kalender'
+TEILE_VERZEICHNIS = '.teile'
+UID_DOMAIN = 'ms-veranstaltungen.reporter.ruhr'
+FEED_ALLE = 'alle'
+ZEITZONE = 'Europe/Berlin'
+ZEILE_MAX = 75  # Oktette pro Zeile ohne CRLF (RFC 5545, 3.1)
+
+_VTIMEZONE = [
+    'BEGIN:VTIMEZONE', f'TZID:{ZEITZONE}',
+    'BEGIN:DAYLIGHT', 'TZOFFSETFROM:+0100', 'TZOFFSETTO:+0200', 'TZNAME:CEST',
+    'DTSTART:19700329T020000', 'RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU', 'END:DAYLIGHT',
+    'BEGIN:STANDARD', 'TZOFFSETFROM:+0200', 'TZOFFSETTO:+0100', 'TZNAME:CET',
+    'DTSTART:19701025T030000', 'RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU', 'END:STANDARD',
+    'END:VTIMEZONE',
+]
+_UHRZEIT = re.compile(r'^\s*(\d{1,2})[:.](\d{2})(?:\s*(?:Uhr)?\s*[-–]\s*(\d{1,2})[:.](\d{2}))?')
+_ESCAPE = str.maketrans({'\\': '\\\\', ';': '\\;', ',': '\\,', '\n': '\\n', '\r': None})
+
+
+def feed_fuer_region(name: str) -> str:
+    return f"region-{kuerzel(name)}"
+
+
+def feed_fuer_quelle(schluessel: str) -> str:
+    return f"quelle-{schluessel}"
+
+
+def feed_datei(feed: str) -> str:
+    """Pfad relativ zum Dashboard, z.B. 'kalender/region-muenster.ics'."""
+    return f"{KALENDER_VERZEICHNIS}/{feed}.ics"
+
+
+def feeds_fuer(v: Veranstaltung) -> tuple[str, str, str]:
+    """Alle Feeds, in denen ein Event steht."""
+    return FEED_ALLE, feed_fuer_region(region(v.stadt)), feed_fuer_quelle(v.quelle)
+
+
+def _text(wert: str) -> str:
+    return wert.translate(_ESCAPE)
+
+
+def falte(zeile: str) -> bytes:
+    """Eine Inhaltszeile als UTF-8 mit CRLF, nach 75 Oktetten umbrochen (nie mitten in einem Zeichen)."""
+    roh = zeile.encode('utf-8')
+    teile = []
+    platz = ZEILE_MAX
+    while len(roh) > platz:
+        schnitt = platz
+        while roh[schnitt] & 0xC0 == 0x80:  # Folgebyte eines Mehrbyte-Zeichens
+            schnitt -= 1
+        teile.append(roh[:schnitt])
+        roh = roh[schnitt:]
+        platz = ZEILE_MAX - 1  # Fortsetzungszeilen beginnen mit einem Leerzeichen
+    teile.append(roh)
+    return b'\r\n '.join(teile) + b'\r\n'
+
+
+def zeiten(v: Veranstaltung) -> tuple[str, str | None]:
+    """DTSTART und DTEND (oder None) eines Events, jeweils mit Parametern.
+
+    Mehrtägige und Events ohne Uhrzeit sind ganztägig (VALUE=DATE, DTEND exklusiv);
+    sonst Ortszeit mit TZID. Steht die Uhrzeit nur im Text ("19:30-22:00 Uhr"),
+    wird sie daraus gelesen.
+    """
+    if v.ist_mehrtaegig():
+        return (f";VALUE=DATE:{v.datum:%Y%m%d}",
+                f";VALUE=DATE:{v.ende.date() + timedelta(days=1):%Y%m%d}")
+    beginn, ende = v.datum, None
+    treffer = _UHRZEIT.match(v.uhrzeit)
+    if not (beginn.hour or beginn.minute) and treffer and int(treffer[1]) < 24 and int(treffer[2]) < 60:
+        beginn = beginn.replace(hour=int(treffer[1]), minute=int(treffer[2]))
+    if not (beginn.hour or beginn.minute):
+        return f";VALUE=DATE:{beginn:%Y%m%d}", f";VALUE=DATE:{beginn.date() + timedelta(days=1):%Y%m%d}"
+    if treffer and treffer[3] and int(treffer[3]) < 24 and int(treffer[4]) < 60:
+        ende = beginn.replace(hour=int(treffer[3]), minute=int(treffer[4]))
+    tzid = f";TZID={ZEITZONE}:"
+    return tzid + f"{beginn:%Y%m%dT%H%M%S}", (tzid + f"{ende:%Y%m%dT%H%M%S}" if ende and ende > beginn else None)
+
+
+def vevent(v: Veranstaltung, kennung: str, geaendert: str) -> list[str]:
+    """Inhaltszeilen eines Events (ungefaltet); geaendert als UTC-Zeitstempel (JJJJMMTTTHHMMSSZ)."""
+    dtstart, dtend = zeiten(v)
+    zeilen = [
+        'BEGIN:VEVENT',
+        f'UID:{kennung}@{UID_DOMAIN}',
+        f'DTSTAMP:{geaendert}',
+        f'LAST-MODIFIED:{geaendert}',
+        f'DTSTART{dtstart}',
+    ]
+    if dtend:
+        zeilen.append(f'DTEND{dtend}')
+    zeilen.append(f'SUMMARY:{_text(v.name)}')
+    ort = ', '.join(dict.fromkeys(teil for teil in (v.ort, v.stadt) if teil))
+    if ort:
+        zeilen.append(f'LOCATION:{_text(ort)}')
+    if v.beschreibung:
+        zeilen.append(f'DESCRIPTION:{_text(v.beschreibung)}')
+    if v.link.startswith(('https://', 'http://')):
+        zeilen.append(f'URL:{v.link}')
+    if v.rubrik:
+        zeilen.append(f'CATEGORIES:{_text(v.rubrik)}')
+    zeilen.append('END:VEVENT')
+    return zeilen
+
+
+def _datei_hash(pfad: str) -> str | None:
+    try:
+        with open(pfad, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class IcsDatei(AtomareDatei):
+    """Streamt atomar und hasht mit; schliesse() ersetzt das Ziel nur bei neuem Inhalt."""
+
+    def __init__(self, pfad: str):
+        super().__init__(pfad)
+        self._hash = hashlib.sha256()
+
+    def schreibe(self, roh: bytes) -> None:
+        self._hash.update(roh)
+        super().schreibe(roh)
+
+    def zeilen(self, zeilen: list[str]) -> None:
+        self.schreibe(b''.join(map(falte, zeilen)))
+
+    def schliesse(self) -> bool:
+        """True, wenn die Datei neu geschrieben wurde."""
+        if _datei_hash(self.pfad) == self._hash.hexdigest():
+            self.verwirf()
+            return False
+        self.uebernimm()
+        return True
+
+
+def _partition(verzeichnis: str, jahr: int, monat: int) -> str:
+    return os.path.join(verzeichnis, TEILE_VERZEICHNIS, f"{jahr}_{monat:02d}")
+
+
+def schreibe_teile(verzeichnis: str, jahr: int, monat: int, veranstaltungen: list[Veranstaltung],
+                   kennung: Callable[[Veranstaltung], str], geaendert: Callable[[Veranstaltung], str]) -> int:
+    """VEVENTs eines Monats in die Teilstücke seiner Feeds, in einem Durchlauf über die Events.
+
+    Teilstücke von Feeds ohne Events in diesem Monat werden entfernt.
+    Gibt die Anzahl geänderter Teilstücke zurück.
+    """
+    ordner = _partition(verzeichnis, jahr, monat)
+    os.makedirs(ordner, exist_ok=True)
+    dateien: dict[str, IcsDatei] = {}
+    try:
+        for v in veranstaltungen:
+            roh = b''.join(map(falte, vevent(v, kennung(v), geaendert(v))))
+            for feed in feeds_fuer(v):
+                if feed not in dateien:
+                    dateien[feed] = IcsDatei(os.path.join(ordner, f"{feed}.ics"))
+                dateien[feed].schreibe(roh)
+    except BaseException:
+        for datei in dateien.values():
+            datei.verwirf()
+        raise
+    geaendert = sum(datei.schliesse() for datei in dateien.values())
+    for name in os.listdir(ordner):
+        if name.endswith('.ics') and name[:-4] not in dateien:
+            os.remove(os.path.join(ordner, name))
+            geaendert += 1
+    return geaendert
+
+
+def _vevents(pfad: str):
+    """Die VEVENTs eines Teilstücks als (UID-Zeile, Bytes), ohne die Datei ganz zu laden."""
+    with open(pfad, 'rb') as f:
+        block, uid = [], b''
+        for zeile in f:
+            block.append(zeile)
+            if zeile.startswith(b'UID:'):
+                uid = zeile
+            elif zeile == b'END:VEVENT\r\n':
+                yield uid, b''.join(block)
+                block, uid = [], b''
+
+
+def schreibe_feeds(verzeichnis: str, monate_liste: list[tuple[int, int]], titel: dict[str, str]) -> list[str]:
+    """Setzt jeden Feed aus titel ({feed: Kalendername}) aus den Teilstücken der Monate zusammen.
+
+    Ein Event, das in mehreren Monaten steht (mehrtägig), erscheint nur einmal.
+    Teilstücke von Monaten vor dem ersten werden gelöscht. Gibt die neu
+    geschriebenen Feed-Dateien zurück.
+    """
+    os.makedirs(verzeichnis, exist_ok=True)
+    ordner = [_partition(verzeichnis, j, m) for j, m in monate_liste]
+    teile = os.path.join(verzeichnis, TEILE_VERZEICHNIS)
+    erster = os.path.basename(ordner[0])
+    for name in os.listdir(teile) if os.path.isdir(teile) else []:
+        if name < erster:
+            shutil.rmtree(os.path.join(teile, name), ignore_errors=True)
+
+    geschrieben = []
+    for feed, name in titel.items():
+        datei = IcsDatei(os.path.join(verzeichnis, f"{feed}.ics"))
+        try:
+            datei.zeilen(['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//Veranstaltungen Münsterland//DE',
+                          'CALSCALE:GREGORIAN', 'METHOD:PUBLISH',
+                          f'X-WR-CALNAME:{_text(name)}', f'X-WR-TIMEZONE:{ZEITZONE}',
+                          'REFRESH-INTERVAL;VALUE=DURATION:PT6H', 'X-PUBLISHED-TTL:PT6H', *_VTIMEZONE])
+            gesehen = set()
+            for pfad in (os.path.join(o, f"{feed}.ics") for o in ordner):
+                if not os.path.exists(pfad):
+                    continue
+                for uid, roh in _vevents(pfad):
+                    if uid not in gesehen:
+                        gesehen.add(uid)
+                        datei.schreibe(roh)
+            datei.zeilen(['END:VCALENDAR'])
+        except BaseException:
+            datei.verwirf()
+            raise
+        if datei.schliesse():
+            geschrieben.append(feed_datei(feed))
+    return geschrieben
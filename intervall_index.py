@@ -0,0 +1,100 @@
+"""Intervall-Index: welche mehrtägigen Veranstaltungen laufen an einem Tag?
+
+Ein zentrierter Intervallbaum über geschlossene Tagesintervalle [von, bis].
+Jeder Knoten hält die Intervalle, die seinen Mittelpunkt enthalten, einmal
+nach Beginn und einmal nach Ende sortiert; alle anderen liegen vollständig
+links oder rechts davon. am(tag) läuft einen Pfad von der Wurzel ab und
+liest in jedem Knoten nur die Treffer: O(log n + k) statt eines Durchlaufs
+über alle Events.
+
+zaehle_pro_tag() beantwortet "wie viele laufen an jedem Tag eines Zeitraums"
+mit einem Differenzen-Feld in O(n + Tage) — dafür braucht es den Baum nicht.
+"""
+
+from datetime import date, timedelta
+from operator import itemgetter
+from typing import Generic, Iterable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Knoten:
+    __slots__ = ('mitte', 'nach_von', 'nach_bis', 'links', 'rechts')
+
+    def __init__(self, mitte, nach_von, nach_bis, links, rechts):
+        self.mitte = mitte
+        self.nach_von = nach_von  # aufsteigend nach Beginn
+        self.nach_bis = nach_bis  # absteigend nach Ende
+        self.links = links
+        self.rechts = rechts
+
+
+def _baue(intervalle: list[tuple]) -> _Knoten | None:
+    if not intervalle:
+        return None
+    grenzen = sorted([e[0] for e in intervalle] + [e[1] for e in intervalle])
+    mitte = grenzen[len(grenzen) // 2]  # ein Endpunkt: mindestens ein Intervall enthält ihn
+    links, rechts, hier = [], [], []
+    for e in intervalle:
+        if e[1] < mitte:
+            links.append(e)
+        elif e[0] > mitte:
+            rechts.append(e)
+        else:
+            hier.append(e)
+    return _Knoten(mitte, sorted(hier, key=itemgetter(0, 2)), sorted(hier, key=lambda e: (e[1], -e[2]), reverse=True),
+                   _baue(links), _baue(rechts))
+
+
+class IntervallIndex(Generic[T]):
+    """Unveränderlicher Index über (von, bis, wert); von und bis gehören dazu."""
+
+    def __init__(self, eintraege: Iterable[tuple[date, date, T]]):
+        # Laufende Nummer: Treffer kommen in Beginn- und dann Einfügereihenfolge zurück
+        self._intervalle = [(von, bis, nr, wert) for nr, (von, bis, wert) in enumerate(eintraege)]
+        for von, bis, _, wert in self._intervalle:
+            if bis < von:
+                raise ValueError(f"Intervall endet vor dem Beginn: {von} – {bis} ({wert!r})")
+        self._wurzel = _baue(self._intervalle)
+
+    def __len__(self) -> int:
+        return len(self._intervalle)
+
+    def am(self, tag: date) -> list[T]:
+        """Alle Werte mit von <= tag <= bis."""
+        treffer = []
+        knoten = self._wurzel
+        while knoten is not None:
+            if tag < knoten.mitte:
+                for e in knoten.nach_von:
+                    if e[0] > tag:
+                        break
+                    treffer.append(e)
+                knoten = knoten.links
+            elif tag > knoten.mitte:
+                for e in knoten.nach_bis:
+                    if e[1] < tag:
+                        break
+                    treffer.append(e)
+                knoten = knoten.rechts
+            else:
+                treffer.extend(knoten.nach_von)
+                break
+        treffer.sort(key=itemgetter(0, 2))
+        return [e[3] for e in treffer]
+
+    def zaehle_pro_tag(self, von: date, bis: date) -> dict[date, int]:
+        """Anzahl laufender Intervalle für jeden Tag von..bis (Tage ohne Treffer fehlen)."""
+        tage = (bis - von).days + 1
+        differenz = [0] * (tage + 1)
+        for beginn, ende, _, _ in self._intervalle:
+            if ende < von or beginn > bis:
+                continue
+            differenz[max((beginn - von).days, 0)] += 1
+            differenz[min((ende - von).days, tage - 1) + 1] -= 1
+        anzahl, ergebnis = 0, {}
+        for i in range(tage):
+            anzahl += differenz[i]
+            if anzahl:
+                ergebnis[von + timedelta(days=i)] = anzahl
+        return ergebnis
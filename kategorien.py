@@ -0,0 +1,120 @@
+"""Einordnung der Veranstaltungen in eine feste Rubrik-Taxonomie.
+
+`kategorie` ist Freitext der Quelle ("Workshop · Meetup", Theater-Sparten,
+LWL-Zielgruppen, "Konzert/Show", bei DPMS meist leer) und taugt nicht als
+Filter. rubrik() ordnet jedes Event genau einer Rubrik aus RUBRIKEN zu.
+
+Alle Stichwörter aller Rubriken stecken in einem einzigen Automaten: einem
+regulären Ausdruck, der aus dem Präfixbaum der Stichwörter gebaut ist
+(gemeinsame Anfänge stehen nur einmal drin, z.B. kon(?:zert|ferenz)). Ein
+Durchlauf über "kategorie | name | beschreibung" findet alle Treffer;
+Stichwörter zählen auch mitten im Wort (Orgelkonzert, Kinderführung) — darum
+keine kurzen, mehrdeutigen Stichwörter ("oper" steckt in "Kooperation").
+Stichwörter in NUR_AM_WORTANFANG stecken in zu vielen fremden Wörtern
+(Mitgliederversammlung, Transportmesse, Diskurs) und zählen nur am Wortanfang;
+sie bilden einen zweiten Präfixbaum mit Wortanfang-Anker im selben Ausdruck. Treffer
+in kategorie wiegen 3, im Namen 2, in der Beschreibung 1; die Rubrik mit
+der höchsten Summe gewinnt, bei Gleichstand die weiter oben in RUBRIKEN.
+Ohne Treffer greift die Standardrubrik der Quelle (Quelle.rubrik im
+Register, quellen.py), sonst SONSTIGES.
+"""
+
+import re
+
+from quellen import REGISTER
+
+
+SONSTIGES = 'Sonstiges'
+
+# Reihenfolge = Anzeige im Filter und Vorrang bei Gleichstand
+RUBRIKEN: list[tuple[str, list[str]]] = [
+    ('Konzert', ['konzert', 'jazz', 'rocknacht', 'chor', 'orchester', 'sinfonie', 'symphonie', 'orgel', 'musik',
+                 'liveband', 'bigband', 'festival', 'liederabend', 'open air', 'klassik', 'gospel', 'kammermusik']),
+    ('Party', ['party', 'disco', 'clubnacht', 'techno', 'ü30', 'ü40', 'tanznacht', 'rave']),
+    ('Bühne', ['theater', 'schauspiel', 'opernabend', 'operngala', 'ballett', 'tanztheater', 'kabarett', 'comedy',
+               'musical', 'poetry slam', 'improtheater', 'varieté', 'zauber', 'puppenspiel', 'premiere', 'operette']),
+    ('Ausstellung & Museum', ['ausstellung', 'museum', 'galerie', 'vernissage', 'finissage', 'kunstwerk',
+                              'sammlung']),
+    ('Führung & Tour', ['führung', 'rundgang', 'radtour', 'wanderung', 'exkursion', 'stadttour', 'besichtigung',
+                        'fahrradtour']),
+    ('Workshop & Kurs', ['workshop', 'kurs', 'seminar', 'webinar', 'schulung', 'training', 'bootcamp',
+                         'werkstatt', 'atelier']),
+    ('Vortrag & Lesung', ['vortrag', 'lesung', 'diskussion', 'podium', 'vorlesung', 'talk', 'gespräch',
+                          'buchvorstellung']),
+    ('Netzwerk & Business', ['meetup', 'netzwerk', 'pitch', 'startup', 'gründer', 'gründung', 'hackathon',
+                             'konferenz', 'business', 'unternehme', 'barcamp', 'jobmesse', 'fachmesse']),
+    ('Markt & Fest', ['markt', 'trödel', 'kirmes', 'stadtfest', 'volksfest', 'straßenfest', 'schützenfest',
+                      'sommerfest', 'weinfest', 'dorffest', 'basar']),
+    ('Kinder & Familie', ['kinder', 'familie', 'jugend', 'schüler', 'kita', 'ferienprogramm', 'märchen']),
+    ('Sport', ['marathon', 'turnier', 'sport', 'fitness', 'yoga', 'volkslauf', 'spieltag', 'regatta']),
+    ('Film', ['kino', 'film', 'screening']),
+]
+
+# Diese Stichwörter zählen nur am Wortanfang ("Sammlung", aber nicht "Versammlung")
+NUR_AM_WORTANFANG = {'sammlung', 'sport', 'kurs', 'premiere', 'rave', 'kita'}
+
+GEWICHT_KATEGORIE = 3
+GEWICHT_NAME = 2
+GEWICHT_BESCHREIBUNG = 1
+
+
+def _praefixbaum_muster(woerter: list[str]) -> str:
+    """Regulärer Ausdruck aus dem Präfixbaum: jeder Treffer endet auf einem vollständigen Stichwort."""
+    baum: dict = {}
+    for wort in woerter:
+        knoten = baum
+        for zeichen in wort:
+            knoten = knoten.setdefault(zeichen, {})
+        knoten[''] = {}  # Wortende
+
+    def muster(knoten: dict) -> str:
+        zweige = [re.escape(z) + muster(kind) for z, kind in sorted(knoten.items()) if z]
+        if not zweige:
+            return ''
+        gruppe = zweige[0] if len(zweige) == 1 else '(?:' + '|'.join(zweige) + ')'
+        if '' in knoten:  # hier endet ein kürzeres Stichwort: Fortsetzung optional (gierig = längstes)
+            return f'(?:{gruppe})?'
+        return gruppe
+
+    return muster(baum)
+
+
+_RUBRIK_NACH_WORT = {wort.casefold(): name for name, woerter in RUBRIKEN for wort in woerter}
+_VORRANG = {name: i for i, (name, _) in enumerate(RUBRIKEN)}
+_STANDARD_NACH_QUELLE = {q.schluessel: q.rubrik for q in REGISTER if q.rubrik}
+_AUTOMAT = re.compile(
+    r'(?<!\w)' + _praefixbaum_muster(sorted(w for w in _RUBRIK_NACH_WORT if w in NUR_AM_WORTANFANG))
+    + '|' + _praefixbaum_muster(sorted(w for w in _RUBRIK_NACH_WORT if w not in NUR_AM_WORTANFANG))
+)
+
+
+def rubrik(kategorie: str, name: str, beschreibung: str, quelle: str = '') -> str:
+    """Die Rubrik eines Events (siehe Moduldoku)."""
+    kategorie, name = kategorie.casefold(), name.casefold()  # casefold kann verlängern (ß -> ss)
+    text = f"{kategorie}\n{name}\n{beschreibung.casefold()}"
+    ende_kategorie = len(kategorie)
+    ende_name = ende_kategorie + 1 + len(name)
+    punkte: dict[str, int] = {}
+    for treffer in _AUTOMAT.finditer(text):
+        if treffer.start() < ende_kategorie:
+            gewicht = GEWICHT_KATEGORIE
+        elif treffer.start() < ende_name:
+            gewicht = GEWICHT_NAME
+        else:
+            gewicht = GEWICHT_BESCHREIBUNG
+        name_rubrik = _RUBRIK_NACH_WORT[treffer.group()]
+        punkte[name_rubrik] = punkte.get(name_rubrik, 0) + gewicht
+    if not punkte:
+        return _STANDARD_NACH_QUELLE.get(quelle, SONSTIGES)
+    return min(punkte, key=lambda r: (-punkte[r], _VORRANG[r]))
+
+
+def ordne_ein(veranstaltungen: list) -> None:
+    """Setzt v.rubrik für alle Events (in place)."""
+    for v in veranstaltungen:
+        v.rubrik = rubrik(v.kategorie, v.name, v.beschreibung, v.quelle)
+
+
+def reihenfolge(rubriken) -> list[str]:
+    """Rubriken in Taxonomie-Reihenfolge, SONSTIGES zuletzt."""
+    return sorted(rubriken, key=lambda r: _VORRANG.get(r, len(RUBRIKEN)))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+manifest.json: Inhaltsverzeichnis der generierten Monatsseiten.
+
+app.py trägt pro Monatsdatei Anzahl Veranstaltungen (alle auf der Seite und die
+im Monat beginnenden), Orte, Anzahl pro Quelle,
+einen Inhalts-Hash (über die Events, nicht über das HTML mit seinem
+Zeitstempel) und die Generierungszeit ein. update.sh und der Deploy-Workflow
+lesen nur diese Datei, statt die HTML-Seiten zu durchsuchen.
+
+Verwendung (für update.sh):
+    python3 manifest.py anzahl              # Summe aller Veranstaltungen (mehrtägige einmal)
+    python3 manifest.py veraltet            # Monatsdateien (+ daten/*.json, Regionen) vor dem Vormonat, eine pro Zeile
+    python3 manifest.py entferne DATEI ...  # Einträge löschen (nach git rm)
+    python3 manifest.py zusammenfassung     # Markdown-Tabelle (Deploy-Zusammenfassung)
+    python3 manifest.py pruefe              # Exit 1, wenn eine eingetragene Datei fehlt
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+from atomar import schreibe_atomar
+
+
+MANIFEST_DATEI = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def lade_manifest(pfad: str) -> dict:
+    """Liest das Manifest; fehlt es oder ist es kaputt, beginnt ein leeres."""
+    try:
+        with open(pfad, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'generiert': '', 'monate': {}}
+
+
+def speichere_manifest(pfad: str, manifest: dict) -> None:
+    schreibe_atomar(pfad, json.dumps(manifest, ensure_ascii=False, indent=1, sort_keys=True) + '\n')
+
+
+def trage_ein(manifest: dict, dateiname: str, eintrag: dict) -> None:
+    manifest['monate'][dateiname] = eintrag
+    manifest['generiert'] = datetime.now().isoformat(timespec='seconds')
+
+
+def bereinige(manifest: dict, verzeichnis: str) -> list[str]:
+    """Entfernt Einträge, deren Datei nicht mehr existiert; gibt deren Namen zurück."""
+    fehlend = [d for d in manifest['monate'] if not os.path.exists(os.path.join(verzeichnis, d))]
+    for dateiname in fehlend:
+        del manifest['monate'][dateiname]
+    return fehlend
+
+
+def anzahl(manifest: dict) -> int:
+    """Mehrtägige Events stehen auf jeder Monatsseite, in die sie reichen — gezählt wird nur ihr Beginn."""
+    return sum(e.get('beginnen', e['veranstaltungen']) for e in manifest['monate'].values())
+
+
+def veraltet(manifest: dict, heute: datetime | None = None) -> list[str]:
+    """Monatsdateien vor dem Vormonat (der Vormonat bleibt als Puffer), samt Shell-Daten und Regionsseiten."""
+    heute = heute or datetime.now()
+    stichtag = (heute.year, heute.month - 1) if heute.month > 1 else (heute.year - 1, 12)
+    dateien = []
+    for d, e in sorted(manifest['monate'].items()):
+        if (e['jahr'], e['monat']) < stichtag:
+            dateien.append(d)
+            if 'daten' in e:
+                dateien.append(e['daten'])
+            dateien.extend(e.get('regionen', []))
+    return dateien
+
+
+def zusammenfassung(manifest: dict) -> str:
+    zeilen = ['| Datei | Veranstaltungen | Orte | Generiert |', '|---|---:|---:|---|']
+    for dateiname, e in sorted(manifest['monate'].items()):
+        zeilen.append(f"| {dateiname} | {e['veranstaltungen']} | {e['orte']} | {e['generiert']} |")
+    zeilen.append(f"| **Gesamt** | **{anzahl(manifest)}** | | |")
+    return '\n'.join(zeilen)
+
+
+def main():
+    argv = sys.argv[1:]
+    if not argv:
+        raise SystemExit(__doc__)
+    pfad = os.path.join(os.path.dirname(os.path.abspath(__file__)), MANIFEST_DATEI)
+    manifest = lade_manifest(pfad)
+    befehl, argumente = argv[0], argv[1:]
+
+    if befehl == 'anzahl':
+        print(anzahl(manifest))
+    elif befehl == 'veraltet':
+        print('\n'.join(veraltet(manifest)))
+    elif befehl == 'entferne':
+        for dateiname in argumente:
+            manifest['monate'].pop(dateiname, None)
+        speichere_manifest(pfad, manifest)
+    elif befehl == 'zusammenfassung':
+        print(zusammenfassung(manifest))
+    elif befehl == 'pruefe':
+        fehlend = bereinige(manifest, os.path.dirname(pfad))
+        if fehlend:
+            raise SystemExit(f"Im Manifest, aber nicht vorhanden: {', '.join(fehlend)}")
+    else:
+        raise SystemExit(f"Unbekannter Befehl: {befehl}\n{__doc__}")
+
+
+if __name__ == '__main__':
+    main()
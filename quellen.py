@@ -0,0 +1,183 @@
+"""Register aller Veranstaltungsquellen und der Abruf-Planer.
+
+Jede Quelle wird genau einmal in REGISTER beschrieben: Abruffunktion, Badge,
+Label, Webseite und ihre Abruf-Eigenschaften. Daraus leiten app.py die
+Filter-/Badge-Tabellen und hole_alle_quellen() den Abrufplan ab:
+
+- umfang MONAT: hole(jahr, monat) -> list, ein Auftrag pro Monat
+- umfang ZEITRAUM: hole(monate) -> {(jahr, monat): list}, ein Auftrag für alle
+  Monate; das Ergebnis wird auf die Monate verteilt statt neu abgerufen
+- paginiert/kosten: lange Auftragsketten starten zuerst, damit sie nicht am
+  Ende allein laufen
+- host: für die Quellen-Gesundheit (Fehler pro Host) und die Drosselung
+- rubrik: Standardrubrik für Events ohne Stichwort-Treffer (kategorien.py)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlsplit
+
+import scraper
+from scraper import Veranstaltung, QuelleBlockiert
+from quellen_status import QuellenStatus, VOLL, PROBE, AUS
+
+
+MONAT = 'monat'
+ZEITRAUM = 'zeitraum'
+
+QUELLEN_PARALLEL = 6  # gleichzeitige Abrufaufträge; die Drosselung pro Host greift zusätzlich
+
+
+@dataclass(frozen=True)
+class Quelle:
+    """Eine Veranstaltungsquelle mit ihren Abruf-Eigenschaften."""
+    schluessel: str
+    label: str
+    badge: str
+    webseite: str
+    quellenangabe: str  # Linktext im Footer
+    hole: Callable
+    umfang: str = MONAT
+    paginiert: bool = False
+    host: str = ''
+    kosten: int = 1  # ungefähre Requests pro Auftrag
+    probe: Callable | None = None  # billige Einzelanfrage für pausierte Quellen (sonst: erster Monat)
+    rubrik: str = ''  # was die Quelle überwiegend anbietet; leer = Sonstiges
+
+
+def _probe_regioactive(jahr: int, monat: int) -> list[Veranstaltung]:
+    """Billige Probe für das pausierte regioactive: nur die erste Stadt."""
+    city_id, slug, stadt_name = scraper.REGIOACTIVE_STAEDTE[0]
+    try:
+        return scraper._hole_regioactive_stadt(city_id, slug, stadt_name, jahr, monat)
+    except QuelleBlockiert as e:
+        print(f"  regioactive weiterhin blockiert ({e})")
+        return []
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).hostname or ''
+
+
+REGISTER: list[Quelle] = [
+    Quelle('muensterland', 'Münsterland', 'badge-muensterland',
+           'https://www.muensterland.com/tourismus/service/veranstaltungen-im-muensterland/', 'muensterland.com',
+           scraper.hole_veranstaltungen, umfang=MONAT, paginiert=True,
+           host=_host(scraper.API_URL), kosten=5),
+    Quelle('digitalhub', 'Digital Hub', 'badge-digitalhub', 'https://www.digitalhub.ms',
+           'Digital Hub münsterLAND', scraper.hole_digitalhub_zeitraum, umfang=ZEITRAUM,
+           host=_host(scraper.DIGITALHUB_API_URL), rubrik='Netzwerk & Business'),
+    Quelle('halle_muensterland', 'Halle Münsterland', 'badge-halle', 'https://www.mcc-halle-muensterland.de',
+           'Halle Münsterland', scraper.hole_halle_muensterland_zeitraum, umfang=ZEITRAUM,
+           host=_host(scraper.HALLE_MUENSTERLAND_URL), rubrik='Konzert'),
+    Quelle('regioactive', 'regioactive.de', 'badge-regioactive', 'https://www.regioactive.de',
+           'regioactive.de', scraper.hole_regioactive_ms, umfang=MONAT,
+           host=_host(scraper.REGIOACTIVE_URL_TEMPLATE), kosten=len(scraper.REGIOACTIVE_STAEDTE),
+           probe=_probe_regioactive, rubrik='Konzert'),
+    Quelle('theater_muenster', 'Theater Münster', 'badge-theater', 'https://neu.theater-muenster.com/spielplan',
+           'Theater Münster', scraper.hole_theater_muenster, umfang=MONAT,
+           host=_host(scraper.THEATER_MS_URL), rubrik='Bühne'),
+    Quelle('lwl_museum', 'LWL-Museum', 'badge-lwl',
+           'https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/', 'LWL-Museum',
+           scraper.hole_lwl_museum_zeitraum, umfang=ZEITRAUM, paginiert=True,
+           host=_host(scraper.LWL_MUSEUM_URL), kosten=3, rubrik='Ausstellung & Museum'),
+]
+
+QUELLEN_NACH_SCHLUESSEL = {q.schluessel: q for q in REGISTER}
+
+
+@dataclass
+class Abruf:
+    """Ergebnis von hole_alle_quellen: Events pro Quelle und Monat plus Messwerte."""
+    events: dict[str, dict[tuple[int, int], list[Veranstaltung]]]
+    dauer: dict[str, float]
+    anzahl: dict[str, int]
+
+    def fuer_monat(self, jahr: int, monat: int) -> list[tuple[Quelle, list[Veranstaltung]]]:
+        """Events eines Monats in Registerreihenfolge (unabhängig von der Abrufreihenfolge)."""
+        return [(q, self.events[q.schluessel].get((jahr, monat), []))
+                for q in REGISTER if q.schluessel in self.events]
+
+
+def _auftraege(quelle: Quelle, modus: str, monate: list[tuple[int, int]]) -> list[tuple[Callable, tuple]]:
+    """Abrufaufträge (Funktion, Argumente) einer Quelle für den Lauf."""
+    if modus == AUS:
+        return []
+    if modus == PROBE:
+        monate = monate[:1]
+        if quelle.probe:
+            return [(quelle.probe, monate[0])]
+    if quelle.umfang == ZEITRAUM:
+        return [(quelle.hole, (monate,))]
+    return [(quelle.hole, monat) for monat in monate]
+
+
+def hole_alle_quellen(monate: list[tuple[int, int]], modi: dict[str, str]) -> Abruf:
+    """Ruft alle aktiven Quellen für alle Monate parallel ab.
+
+    Paginierte und teure Aufträge starten zuerst. Zeitraum-Quellen werden
+    einmal abgerufen und auf die Monate verteilt.
+    """
+    geplant = []
+    for quelle in REGISTER:
+        for fn, args in _auftraege(quelle, modi.get(quelle.schluessel, VOLL), monate):
+            geplant.append((quelle, fn, args))
+    geplant.sort(key=lambda auftrag: (not auftrag[0].paginiert, -auftrag[0].kosten))
+
+    abruf = Abruf(events={}, dauer={}, anzahl={})
+    for quelle, _, _ in geplant:
+        abruf.events.setdefault(quelle.schluessel, {})
+        abruf.dauer.setdefault(quelle.schluessel, 0.0)
+        abruf.anzahl.setdefault(quelle.schluessel, 0)
+
+    def ausfuehren(fn: Callable, args: tuple):
+        start = time.monotonic()
+        ergebnis = fn(*args)
+        return ergebnis, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=QUELLEN_PARALLEL) as pool:
+        laufend = [(quelle, args, pool.submit(ausfuehren, fn, args)) for quelle, fn, args in geplant]
+
+    for quelle, args, future in laufend:
+        ergebnis, dauer = future.result()
+        if isinstance(ergebnis, dict):
+            verteilt = ergebnis
+        else:
+            verteilt = {args: ergebnis}  # Monats-Auftrag: args ist (jahr, monat)
+        for monat, events in verteilt.items():
+            abruf.events[quelle.schluessel].setdefault(monat, []).extend(events)
+            abruf.anzahl[quelle.schluessel] += len(events)
+        abruf.dauer[quelle.schluessel] += dauer
+    return abruf
+
+
+def plane_lauf(status: QuellenStatus) -> dict[str, str]:
+    """Abrufmodus (VOLL/PROBE/AUS) je Quelle für diesen Lauf; meldet pausierte Quellen."""
+    modi = {q.schluessel: status.plane(q.schluessel) for q in REGISTER}
+    for schluessel, modus in modi.items():
+        if modus != VOLL:
+            aktion = 'Probe-Anfrage' if modus == PROBE else 'übersprungen'
+            print(f"{QUELLEN_NACH_SCHLUESSEL[schluessel].label}: {status.beschreibe(schluessel)} — {aktion}")
+    return modi
+
+
+def bewerte_lauf(status: QuellenStatus, modi: dict[str, str], abruf: Abruf,
+                 statistik_vorher: dict[str, dict], statistik_nachher: dict[str, dict]) -> None:
+    """Trägt das Laufergebnis jeder abgefragten Quelle in den Status ein.
+
+    Fehlschlag = Request-Fehler auf dem Host der Quelle und keine einzige Veranstaltung.
+    """
+    for quelle in REGISTER:
+        modus = modi.get(quelle.schluessel, VOLL)
+        if modus == AUS:
+            continue
+        vorher = statistik_vorher.get(quelle.host, {})
+        nachher = statistik_nachher.get(quelle.host, {})
+        fehler = nachher.get('fehler', 0) - vorher.get('fehler', 0)
+        erfolg = abruf.anzahl.get(quelle.schluessel, 0) > 0 or fehler == 0
+        status.melde(quelle.schluessel, erfolg, abruf.dauer.get(quelle.schluessel, 0.0),
+                     nachher.get('letzter_fehler', '') if fehler else '')
+        if modus == PROBE or not erfolg:
+            print(f"{quelle.label}: {status.beschreibe(quelle.schluessel)}")
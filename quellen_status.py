@@ -0,0 +1,105 @@
+"""Gesundheit der Quellen über Läufe hinweg (quellen_status.json).
+
+Pro Quelle werden die letzten Läufe (Erfolg, Dauer) und der letzte Fehler
+gespeichert. Eine Quelle, die FEHLER_BIS_PAUSE Läufe in Folge fehlschlägt,
+wird pausiert und nur noch alle PROBE_INTERVALL Läufe mit einer einzelnen
+billigen Anfrage geprüft. Gelingt die Probe, läuft sie wieder voll mit.
+"""
+
+import json
+import os
+from datetime import datetime
+
+from atomar import schreibe_atomar
+
+
+STATUS_DATEI = 'quellen_status.json'
+VERLAUF_LAENGE = 20     # gemerkte Läufe pro Quelle
+FEHLER_BIS_PAUSE = 3    # Fehlschläge in Folge, ab denen eine Quelle pausiert
+PROBE_INTERVALL = 5     # pausierte Quelle: jeder N-te Lauf ist ein Probe-Lauf
+
+VOLL = 'voll'
+PROBE = 'probe'
+AUS = 'aus'
+
+
+def _perzentil(werte: list[float], p: float) -> float | None:
+    if not werte:
+        return None
+    sortiert = sorted(werte)
+    idx = min(len(sortiert) - 1, int(round(p / 100 * (len(sortiert) - 1))))
+    return round(sortiert[idx], 2)
+
+
+class QuellenStatus:
+    """Persistierter Gesundheitszustand aller Quellen."""
+
+    def __init__(self, pfad: str):
+        self.pfad = pfad
+        self.daten: dict[str, dict] = {}
+        if os.path.exists(pfad):
+            try:
+                with open(pfad, encoding='utf-8') as f:
+                    self.daten = json.load(f)
+            except (OSError, ValueError):
+                self.daten = {}  # kaputte Datei: neu anfangen statt den Lauf abzubrechen
+
+    def _eintrag(self, quelle: str) -> dict:
+        return self.daten.setdefault(quelle, {
+            'verlauf': [],
+            'fehler_in_folge': 0,
+            'laeufe_seit_probe': 0,
+            'letzter_fehler': '',
+            'letzter_fehler_am': '',
+        })
+
+    def plane(self, quelle: str) -> str:
+        """Entscheidet einmal pro Lauf: VOLL abrufen, nur PROBE oder AUS (überspringen)."""
+        eintrag = self._eintrag(quelle)
+        if eintrag['fehler_in_folge'] < FEHLER_BIS_PAUSE:
+            return VOLL
+        eintrag['laeufe_seit_probe'] += 1
+        if eintrag['laeufe_seit_probe'] >= PROBE_INTERVALL:
+            eintrag['laeufe_seit_probe'] = 0
+            return PROBE
+        return AUS
+
+    def melde(self, quelle: str, erfolg: bool, dauer: float, fehler: str = '') -> None:
+        """Trägt das Ergebnis eines Laufs (oder einer Probe) ein."""
+        eintrag = self._eintrag(quelle)
+        jetzt = datetime.now().isoformat(timespec='seconds')
+        eintrag['verlauf'].append({'zeit': jetzt, 'ok': erfolg, 'dauer': round(dauer, 2)})
+        del eintrag['verlauf'][:-VERLAUF_LAENGE]
+        if erfolg:
+            eintrag['fehler_in_folge'] = 0
+            eintrag['laeufe_seit_probe'] = 0
+        else:
+            eintrag['fehler_in_folge'] += 1
+        if fehler:
+            eintrag['letzter_fehler'] = fehler[:300]
+            eintrag['letzter_fehler_am'] = jetzt
+
+        verlauf = eintrag['verlauf']
+        dauern = [v['dauer'] for v in verlauf if v['ok']]
+        eintrag['erfolgsquote'] = round(sum(v['ok'] for v in verlauf) / len(verlauf), 2)
+        eintrag['latenz_p50'] = _perzentil(dauern, 50)
+        eintrag['latenz_p90'] = _perzentil(dauern, 90)
+
+    def ist_pausiert(self, quelle: str) -> bool:
+        return self._eintrag(quelle)['fehler_in_folge'] >= FEHLER_BIS_PAUSE
+
+    def beschreibe(self, quelle: str) -> str:
+        """Einzeiliger Status für die Konsolenausgabe."""
+        eintrag = self._eintrag(quelle)
+        if eintrag['fehler_in_folge'] == 0:
+            quote = eintrag.get('erfolgsquote')
+            return f"ok ({quote:.0%} Erfolg, p50 {eintrag.get('latenz_p50')}s)" if quote is not None else 'ok'
+        if not self.ist_pausiert(quelle):
+            return (f"Fehlschlag {eintrag['fehler_in_folge']}/{FEHLER_BIS_PAUSE} "
+                    f"(zuletzt: {eintrag['letzter_fehler'] or 'keine Events'})")
+        naechste = PROBE_INTERVALL - eintrag['laeufe_seit_probe']
+        return (f"pausiert nach {eintrag['fehler_in_folge']} Fehlschlägen "
+                f"(zuletzt: {eintrag['letzter_fehler'] or 'keine Events'}), Probe in {naechste} Lauf/Läufen")
+
+    def speichere(self) -> None:
+        schreibe_atomar(self.pfad, json.dumps(self.daten, ensure_ascii=False, indent=1))
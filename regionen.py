@@ -0,0 +1,60 @@
+"""Aufteilung der Monatsseiten nach Region.
+
+Wer nur Termine in einer Stadt sucht, soll nicht die Seite für das ganze
+Münsterland laden. Jede Veranstaltung gehört genau einer Region:
+
+- Städte über 50.000 Einwohner (GROSSSTAEDTE) bekommen eine eigene Seite,
+- alle anderen Orte die Seite ihres Kreises (KREISE),
+- Orte außerhalb der vier Kreise landen unter WEITERE.
+
+Die Zuordnung ist fest, nicht aus der Anzahl der Events abgeleitet: so
+gibt es jede Regionsseite in jedem Monat, und die Monatsnavigation einer
+Region zeigt nie ins Leere.
+"""
+
+import re
+
+
+GROSSSTAEDTE = ['Münster', 'Rheine', 'Bocholt', 'Ahlen', 'Ibbenbüren']
+
+KREISE = {
+    'Kreis Borken': ['Ahaus', 'Bocholt', 'Borken', 'Gescher', 'Gronau', 'Heek', 'Heiden', 'Isselburg', 'Legden',
+                     'Raesfeld', 'Reken', 'Rhede', 'Schöppingen', 'Stadtlohn', 'Südlohn', 'Velen', 'Vreden'],
+    'Kreis Coesfeld': ['Ascheberg', 'Billerbeck', 'Coesfeld', 'Dülmen', 'Havixbeck', 'Lüdinghausen', 'Nordkirchen',
+                       'Nottuln', 'Olfen', 'Rosendahl', 'Senden'],
+    'Kreis Steinfurt': ['Altenberge', 'Emsdetten', 'Greven', 'Hörstel', 'Hopsten', 'Horstmar', 'Ibbenbüren',
+                        'Ladbergen', 'Laer', 'Lengerich', 'Lienen', 'Lotte', 'Metelen', 'Mettingen', 'Neuenkirchen',
+                        'Nordwalde', 'Ochtrup', 'Recke', 'Rheine', 'Saerbeck', 'Steinfurt', 'Tecklenburg',
+                        'Westerkappeln', 'Wettringen'],
+    'Kreis Warendorf': ['Ahlen', 'Beckum', 'Beelen', 'Drensteinfurt', 'Ennigerloh', 'Everswinkel', 'Oelde',
+                        'Ostbevern', 'Sassenberg', 'Sendenhorst', 'Telgte', 'Wadersloh', 'Warendorf'],
+}
+
+WEITERE = 'Weitere Orte'
+
+# Reihenfolge in der Navigation
+REGIONEN = GROSSSTAEDTE + list(KREISE) + [WEITERE]
+
+_ORT = re.compile(r"\w+")  # "Münster-Hiltrup", "Münster (Westf.)" -> "münster"
+_REGION_NACH_ORT = {ort.casefold(): kreis for kreis, orte in KREISE.items() for ort in orte}
+_REGION_NACH_ORT.update({stadt.casefold(): stadt for stadt in GROSSSTAEDTE})
+_UMLAUTE = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+
+
+def region(stadt: str) -> str:
+    """Region eines Orts (siehe Moduldoku)."""
+    treffer = _ORT.search(stadt)
+    return _REGION_NACH_ORT.get(treffer.group().casefold(), WEITERE) if treffer else WEITERE
+
+
+def kuerzel(name: str) -> str:
+    """Dateinamen-Teil einer Region: 'Münster' -> 'muenster', 'Kreis Borken' -> 'kreis-borken'."""
+    return '-'.join(_ORT.findall(name.lower().translate(_UMLAUTE)))
+
+
+def teile_auf(veranstaltungen: list) -> dict[str, list]:
+    """Events nach Region in einem Durchlauf; alle Regionen in REGIONEN-Reihenfolge, auch leere."""
+    gruppen: dict[str, list] = {name: [] for name in REGIONEN}
+    for v in veranstaltungen:
+        gruppen[region(v.stadt)].append(v)
+    return gruppen
@@ -1,24 +1,61 @@
 """API-Client für Veranstaltungen aus dem Münsterland (muensterland.com + Digital Hub + Halle Münsterland)."""
 
+import os
 import re
 import json
-import requests
-from dataclasses import dataclass
-from datetime import datetime
+import signal
+import time
+import hashlib
+import importlib
+import threading
+import multiprocessing
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from html import unescape
-from bs4 import BeautifulSoup
 
 
-API_URL = "https://www.muensterland.com/dpms/"
+class _SpaeterImport:
+    """Platzhalter für ein Modul, das erst beim ersten Attributzugriff importiert wird.
+
+    requests und bs4 kosten zusammen gut 100 ms Startzeit. Wer nur rendert oder
+    dedupliziert (Tests, manifest.py, Render-Prozesse), soll sie nicht bezahlen.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attribut: str):
+        return getattr(importlib.import_module(self._name), attribut)
+
+
+requests = _SpaeterImport('requests')
+bs4 = _SpaeterImport('bs4')
+
+
+def BeautifulSoup(markup: str, features: str):
+    """bs4.BeautifulSoup — bs4 wird erst beim ersten Parsen importiert."""
+    return bs4.BeautifulSoup(markup, features)
+
+
+def _basis_url(name: str, standard: str) -> str:
+    """Basis-URL einer Quelle; per Umgebungsvariable VERANSTALTUNGEN_<NAME> überschreibbar
+    (z.B. für den lokalen Mock-Server in benchmarks/mock_server.py)."""
+    return os.environ.get(f'VERANSTALTUNGEN_{name}', standard)
+
+
+API_URL = _basis_url('API_URL', "https://www.muensterland.com/dpms/")
 PAGE_SIZE = 100
 
 # Digital Hub API
-DIGITALHUB_API_URL = "https://www.digitalhub.ms/api/events"
+DIGITALHUB_API_URL = _basis_url('DIGITALHUB_API_URL', "https://www.digitalhub.ms/api/events")
 DIGITALHUB_API_KEY = "089d362b33ef053d7fcd241d823d27d1"  # Öffentlicher Demo-Key
 
 # Halle Münsterland
-HALLE_MUENSTERLAND_URL = "https://www.mcc-halle-muensterland.de/de/gaeste/veranstaltungen/"
+HALLE_MUENSTERLAND_URL = _basis_url('HALLE_MUENSTERLAND_URL', "https://www.mcc-halle-muensterland.de/de/gaeste/veranstaltungen/")
 
 # regioactive — Städte mit City-ID und URL-Slug
 REGIOACTIVE_STAEDTE = [
@@ -41,30 +78,320 @@ REGIOACTIVE_STAEDTE = [
     (15317, 'coesfeld',   'Coesfeld'),
     (14494, 'billerbeck', 'Billerbeck'),
 ]
-REGIOACTIVE_URL_TEMPLATE = "https://www.regioactive.de/events/{city_id}/{slug}/veranstaltungen-party-konzerte/monat/{jahr}-{monat:02d}"
+REGIOACTIVE_PARALLEL = 4  # gleichzeitige Städte-Abrufe
+REGIOACTIVE_RATE = 2.0    # Requests pro Sekunde an regioactive.de (Token-Bucket)
+REGIOACTIVE_BURST = 4
+REGIOACTIVE_URL_TEMPLATE = _basis_url(
+    'REGIOACTIVE_URL_TEMPLATE',
+    "https://www.regioactive.de/events/{city_id}/{slug}/veranstaltungen-party-konzerte/monat/{jahr}-{monat:02d}")
 
 # Theater Münster
-THEATER_MS_URL = "https://neu.theater-muenster.com/spielplan"
+THEATER_MS_URL = _basis_url('THEATER_MS_URL', "https://neu.theater-muenster.com/spielplan")
 
 # LWL-Museum für Kunst und Kultur
-LWL_MUSEUM_URL = "https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/"
+LWL_MUSEUM_URL = _basis_url('LWL_MUSEUM_URL', "https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/")
+
+# Drosselung pro Host (Token-Bucket): (Requests pro Sekunde, Burst). Der Burst ist
+# zugleich die höchste Zahl gleichzeitig startender Requests an den Host.
+# 429-Antworten halbieren die Rate eines Hosts, Erfolge heben sie wieder an.
+HOST_LIMITS = {
+    'www.muensterland.com':           (4.0, 4),
+    'www.digitalhub.ms':              (2.0, 2),
+    'www.mcc-halle-muensterland.de':  (2.0, 2),
+    'neu.theater-muenster.com':       (3.0, 3),
+    'www.lwl-museum-kunst-kultur.de': (4.0, 4),
+    'www.regioactive.de':             (REGIOACTIVE_RATE, REGIOACTIVE_BURST),
+}
+HOST_LIMIT_STANDARD = (2.0, 2)
+RETRY_AFTER_MAX = 60  # Sekunden; längere Retry-After-Werte werden gekappt
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 }
 
 
+# Aufzeichnung/Wiedergabe aller HTTP-Antworten (app.py --record DIR / --replay DIR)
+_AUFNAHME_VERZEICHNIS: str | None = None
+_WIEDERGABE_VERZEICHNIS: str | None = None
+
+
+def aktiviere_aufnahme(verzeichnis: str) -> None:
+    """Speichert ab jetzt jede Antwort aus _request_gezaehlt als JSON-Datei in verzeichnis."""
+    global _AUFNAHME_VERZEICHNIS
+    os.makedirs(verzeichnis, exist_ok=True)
+    _AUFNAHME_VERZEICHNIS = verzeichnis
+
+
+def aktiviere_wiedergabe(verzeichnis: str) -> None:
+    """Beantwortet ab jetzt alle Requests aus verzeichnis statt aus dem Netz."""
+    global _WIEDERGABE_VERZEICHNIS
+    if not os.path.isdir(verzeichnis):
+        raise FileNotFoundError(f"Aufnahme-Verzeichnis nicht gefunden: {verzeichnis}")
+    _WIEDERGABE_VERZEICHNIS = verzeichnis
+
+
+def _aufnahme_dateiname(method: str, url: str, params=None, data=None) -> str:
+    """Stabiler Dateiname für einen Request (Methode, URL, Query- und Formular-Parameter)."""
+    teile = {'method': method.upper(), 'url': url, 'params': params or {}, 'data': data or {}}
+    roh = json.dumps(teile, sort_keys=True, ensure_ascii=False)
+    schluessel = hashlib.sha256(roh.encode('utf-8')).hexdigest()[:20]
+    host = re.sub(r'[^\w.-]', '_', url.split('//', 1)[-1].split('/', 1)[0])
+    return f"{method.lower()}_{host}_{schluessel}.json"
+
+
+def _speichere_aufnahme(method: str, url: str, kwargs: dict, response) -> None:
+    pfad = os.path.join(_AUFNAHME_VERZEICHNIS,
+                        _aufnahme_dateiname(method, url, kwargs.get('params'), kwargs.get('data')))
+    eintrag = {
+        'method': method.upper(),
+        'url': url,
+        'params': kwargs.get('params') or {},
+        'data': kwargs.get('data') or {},
+        'status': response.status_code,
+        'content_type': response.headers.get('Content-Type', ''),
+        'body': response.text,
+    }
+    with open(pfad, 'w', encoding='utf-8') as f:
+        json.dump(eintrag, f, ensure_ascii=False, indent=1)
+
+
+def _lade_aufnahme(method: str, url: str, kwargs: dict):
+    """Baut eine requests.Response aus der gespeicherten Aufnahme."""
+    pfad = os.path.join(_WIEDERGABE_VERZEICHNIS,
+                        _aufnahme_dateiname(method, url, kwargs.get('params'), kwargs.get('data')))
+    if not os.path.exists(pfad):
+        raise requests.ConnectionError(f"Keine Aufnahme für {method.upper()} {url}")
+    with open(pfad, encoding='utf-8') as f:
+        eintrag = json.load(f)
+
+    response = requests.Response()
+    response.status_code = eintrag['status']
+    response._content = eintrag['body'].encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = eintrag['url']
+    if eintrag.get('content_type'):
+        response.headers['Content-Type'] = eintrag['content_type']
+    return response
+
+
+# Warme HTTP-Sitzungen pro Host (app.py --daemon): Verbindungen bleiben zwischen
+# Requests und Durchgängen offen, statt für jeden Request neu aufgebaut zu werden
+_SITZUNGEN: dict[str, 'requests.Session'] | None = None
+_SITZUNGEN_LOCK = threading.Lock()
+
+
+def aktiviere_sitzungen() -> None:
+    """Schickt ab jetzt alle Requests über eine dauerhafte requests.Session pro Host."""
+    global _SITZUNGEN
+    with _SITZUNGEN_LOCK:
+        if _SITZUNGEN is None:
+            _SITZUNGEN = {}
+
+
+def schliesse_sitzungen() -> None:
+    """Schließt alle offenen Verbindungen; danach wieder ein Request pro Verbindung."""
+    global _SITZUNGEN
+    with _SITZUNGEN_LOCK:
+        for sitzung in (_SITZUNGEN or {}).values():
+            sitzung.close()
+        _SITZUNGEN = None
+
+
+def _sitzung_fuer(url: str) -> 'requests.Session | None':
+    """Die Session für den Host der URL (None, wenn Sitzungen nicht aktiv sind).
+
+    Der Verbindungs-Pool fasst so viele Verbindungen, wie der Host gleichzeitig
+    Requests bekommt (Burst aus HOST_LIMITS).
+    """
+    with _SITZUNGEN_LOCK:
+        if _SITZUNGEN is None:
+            return None
+        host = urlsplit(url).hostname or ''
+        if host not in _SITZUNGEN:
+            sitzung = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=HOST_LIMITS.get(host, HOST_LIMIT_STANDARD)[1])
+            sitzung.mount('http://', adapter)
+            sitzung.mount('https://', adapter)
+            _SITZUNGEN[host] = sitzung
+        return _SITZUNGEN[host]
+
+
+def _sende(method: str, url: str, **kwargs):
+    """Ein einzelner Request — live, aufgezeichnet oder aus der Aufnahme."""
+    if _WIEDERGABE_VERZEICHNIS:
+        return _lade_aufnahme(method, url, kwargs)
+    sitzung = _sitzung_fuer(url)
+    if sitzung:
+        response = sitzung.request(method, url, **kwargs)
+    else:
+        response = requests.request(method, url, **kwargs)
+    if _AUFNAHME_VERZEICHNIS:
+        _speichere_aufnahme(method, url, kwargs, response)
+    return response
+
+
+class TokenBucket:
+    """Token-Bucket: im Mittel `rate` Requests pro Sekunde, kurzzeitig bis zu `burst` am Stück.
+
+    bremse() reagiert auf 429/Retry-After: bis zum Ablauf wartet jeder Request,
+    danach läuft der Bucket mit halbierter Rate weiter. erfolg() hebt die Rate
+    schrittweise wieder bis zur konfigurierten Höchstrate an.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._zeit = time.monotonic()
+        self._gesperrt_bis = 0.0
+        self._lock = threading.Lock()
+
+    def nimm(self) -> None:
+        """Blockiert, bis ein Token frei ist, und verbraucht es."""
+        while True:
+            with self._lock:
+                jetzt = time.monotonic()
+                if jetzt < self._gesperrt_bis:
+                    warten = self._gesperrt_bis - jetzt
+                else:
+                    self._tokens = min(self.burst, self._tokens + (jetzt - self._zeit) * self.rate)
+                    self._zeit = jetzt
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    warten = (1 - self._tokens) / self.rate
+            time.sleep(warten)
+
+    def bremse(self, sekunden: float) -> None:
+        """Server hat gedrosselt (429): Pause für alle Requests, danach halbe Rate."""
+        with self._lock:
+            jetzt = time.monotonic()
+            self._gesperrt_bis = max(self._gesperrt_bis, jetzt + sekunden)
+            self.rate = max(self.max_rate / 4, self.rate / 2)
+            self._tokens = 1.0  # nach Ablauf darf genau ein Request sofort los
+            self._zeit = self._gesperrt_bis
+
+    def erfolg(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_DROSSELN: dict[str, TokenBucket] = {}
+_DROSSELN_LOCK = threading.Lock()
+
+
+def _drossel_fuer(url: str) -> TokenBucket:
+    """Der gemeinsame Token-Bucket für den Host der URL (nach HOST_LIMITS)."""
+    host = urlsplit(url).hostname or ''
+    with _DROSSELN_LOCK:
+        if host not in _DROSSELN:
+            _DROSSELN[host] = TokenBucket(*HOST_LIMITS.get(host, HOST_LIMIT_STANDARD))
+        return _DROSSELN[host]
+
+
+def _retry_after(fehler: Exception) -> float | None:
+    """Wartezeit aus einer 429-Antwort (Retry-After in Sekunden oder als HTTP-Datum)."""
+    antwort = getattr(fehler, 'response', None)
+    if antwort is None or antwort.status_code != 429:
+        return None
+    wert = antwort.headers.get('Retry-After', '').strip()
+    if not wert:
+        return 5.0
+    try:
+        sekunden = float(wert)
+    except ValueError:
+        try:
+            sekunden = (parsedate_to_datetime(wert) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return 5.0
+    return min(max(sekunden, 0.0), RETRY_AFTER_MAX)
+
+
+class QuelleBlockiert(Exception):
+    """Die Quelle verweigert den Zugriff (403 oder Cloudflare-Challenge) — weitere Abrufe sind sinnlos."""
+
+
+_CHALLENGE_MUSTER = re.compile(
+    r"<title>\s*(Just a moment|Attention Required! \| Cloudflare)|cf_chl_opt|id=\"challenge-form\"",
+    re.IGNORECASE,
+)
+
+
+def _ist_challenge(text: str) -> bool:
+    """True, wenn die Antwort eine Cloudflare-Challenge-Seite statt Inhalt ist."""
+    return bool(_CHALLENGE_MUSTER.search(text[:20000]))
+
+
+def _ist_403(fehler: Exception) -> bool:
+    antwort = getattr(fehler, 'response', None)
+    return antwort is not None and antwort.status_code == 403
+
+
+# Ergebnisse pro Host über den ganzen Prozess (für quellen_status.py)
+_HOST_STATISTIK: dict[str, dict] = {}
+_STATISTIK_LOCK = threading.Lock()
+
+
+def _zaehle(url: str, fehler: str = '') -> None:
+    host = urlsplit(url).hostname or ''
+    with _STATISTIK_LOCK:
+        eintrag = _HOST_STATISTIK.setdefault(host, {'ok': 0, 'fehler': 0, 'letzter_fehler': ''})
+        if fehler:
+            eintrag['fehler'] += 1
+            eintrag['letzter_fehler'] = fehler
+        else:
+            eintrag['ok'] += 1
+
+
+def host_statistik() -> dict[str, dict]:
+    """Momentaufnahme der Request-Ergebnisse pro Host (ok, fehler, letzter_fehler)."""
+    with _STATISTIK_LOCK:
+        return {host: dict(eintrag) for host, eintrag in _HOST_STATISTIK.items()}
+
+
+def _request_gezaehlt(method, url, **kwargs):
+    """_request_mit_retry und Erfolg/Fehler pro Host mitzählen (host_statistik)."""
+    try:
+        response = _request_mit_retry(method, url, **kwargs)
+    except requests.RequestException as e:
+        _zaehle(url, str(e) or type(e).__name__)
+        raise
+    _zaehle(url)
+    return response
+
+
 def _request_mit_retry(method, url, **kwargs):
-    """Führt einen HTTP-Request mit 1x Retry (2s Pause) bei Fehler aus."""
-    import time
+    """Führt einen HTTP-Request mit 1x Retry (2s Pause) bei Fehler aus.
+
+    Jeder Request holt vorher ein Token aus dem Bucket seines Hosts. Bei 429
+    wird statt der 2s-Pause das Retry-After abgewartet, und der Host wird für
+    alle Threads gebremst. 403 wird nicht wiederholt: eine Sperre hebt sich
+    in 2s nicht auf.
+    """
+    drossel = None if _WIEDERGABE_VERZEICHNIS else _drossel_fuer(url)
     try:
-        response = requests.request(method, url, **kwargs)
+        if drossel:
+            drossel.nimm()
+        response = _sende(method, url, **kwargs)
         response.raise_for_status()
+        if drossel:
+            drossel.erfolg()
         return response
-    except requests.RequestException:
-        time.sleep(2)
-        response = requests.request(method, url, **kwargs)
+    except requests.RequestException as e:
+        if _WIEDERGABE_VERZEICHNIS or _ist_403(e):
+            raise  # Aufnahmen ändern sich nicht, Sperren auch nicht — Retry wäre sinnlos
+        wartezeit = _retry_after(e)
+        if wartezeit is not None and drossel:
+            drossel.bremse(wartezeit)
+        else:
+            time.sleep(2)
+        if drossel:
+            drossel.nimm()
+        response = _sende(method, url, **kwargs)
         response.raise_for_status()
+        if drossel:
+            drossel.erfolg()  # auch der gelungene Retry erholt die gebremste Rate
         return response
 
 
@@ -80,12 +407,17 @@ class Veranstaltung:
     beschreibung: str = ''
     quelle: str = 'muensterland'  # 'muensterland' oder 'digitalhub'
     kategorie: str = ''  # z.B. 'Workshop', 'Meetup', 'Pitch'
+    ende: datetime | None = None  # letzter Tag mehrtägiger Events (Ausstellungen), sonst None
+    rubrik: str = ''  # feste Taxonomie, gesetzt von kategorien.ordne_ein() (nicht von den Parsern)
 
     def datum_formatiert(self) -> str:
         """Formatiert das Datum als 'Mo 02.02.2026'."""
         tage = ['Mo', 'Di', 'Mi', 'Do', 'Fr', 'Sa', 'So']
         return f"{tage[self.datum.weekday()]} {self.datum.strftime('%d.%m.%Y')}"
 
+    def ist_mehrtaegig(self) -> bool:
+        return self.ende is not None and self.ende.date() > self.datum.date()
+
     def __lt__(self, other):
         return (self.datum, self.uhrzeit, self.name) < (other.datum, other.uhrzeit, other.name)
 
@@ -98,6 +430,118 @@ def _html_zu_text(html: str) -> str:
     return text.strip()
 
 
+# Parse-Memo: derselbe Antwort-Body ergibt dieselben Events — ohne erneut zu parsen.
+# Viele Seiten (Halle, Theater) liefern zwischen zwei Läufen identisches HTML, aber kein
+# brauchbares ETag. app.py aktiviert das Memo mit .parse_cache/.
+PARSE_CACHE_VERSION = 1  # bei Änderungen an einem Parser erhöhen, alte Einträge werden dann ignoriert
+PARSE_CACHE_TAGE = 30    # so lange nicht mehr getroffene Einträge werden beim Aktivieren gelöscht
+_PARSE_CACHE_VERZEICHNIS: str | None = None
+_DATUMSFELDER = {'datum', 'ende'}
+
+
+def aktiviere_parse_cache(verzeichnis: str) -> None:
+    """Merkt sich ab jetzt die geparsten Events pro Antwort-Body in verzeichnis."""
+    global _PARSE_CACHE_VERZEICHNIS
+    os.makedirs(verzeichnis, exist_ok=True)
+    grenze = time.time() - PARSE_CACHE_TAGE * 86400
+    for name in os.listdir(verzeichnis):
+        pfad = os.path.join(verzeichnis, name)
+        try:
+            if os.path.getmtime(pfad) < grenze:
+                os.remove(pfad)
+        except OSError:
+            pass
+    _PARSE_CACHE_VERZEICHNIS = verzeichnis
+
+
+def als_zeile(v: Veranstaltung) -> tuple:
+    """Kompaktes, JSON-taugliches Tupel einer Veranstaltung (Felder in Definitionsreihenfolge)."""
+    zeile = []
+    for f in fields(Veranstaltung):
+        wert = getattr(v, f.name)
+        zeile.append(wert.isoformat() if f.name in _DATUMSFELDER and wert else wert)
+    return tuple(zeile)
+
+
+def aus_zeile(zeile: list) -> Veranstaltung:
+    """Gegenstück zu als_zeile."""
+    werte = {f.name: datetime.fromisoformat(wert) if f.name in _DATUMSFELDER and wert else wert
+             for f, wert in zip(fields(Veranstaltung), zeile)}
+    return Veranstaltung(**werte)
+
+
+# Parse-Stufe in eigenen Prozessen (app.py --parse-prozesse N): BeautifulSoup ist reines
+# Python und hält die GIL, Threads allein nutzen also nur einen Kern. Die I/O-Threads
+# reichen den Body an den Pool weiter und warten (ohne GIL) auf die Event-Tupel.
+_PARSE_POOL: ProcessPoolExecutor | None = None
+
+
+def aktiviere_parse_prozesse(anzahl: int) -> None:
+    """Parst ab jetzt in anzahl Worker-Prozessen (0 = im aufrufenden Thread)."""
+    global _PARSE_POOL
+    beende_parse_prozesse()
+    if anzahl > 0:
+        # spawn statt fork: beim Start laufen schon Threads (Drosseln, Abruf-Pool)
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=anzahl, mp_context=multiprocessing.get_context('spawn'),
+                                          initializer=ignoriere_sigint)
+
+
+def ignoriere_sigint() -> None:
+    """Initializer für Worker-Prozesse: Strg+C trifft die ganze Prozessgruppe, beenden soll nur der Hauptprozess."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def beende_parse_prozesse() -> None:
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown()
+        _PARSE_POOL = None
+
+
+def _parse_zu_zeilen(parser, body: str, args: tuple) -> list[tuple]:
+    """Läuft im Worker-Prozess: nur kompakte Tupel gehen zurück über die Prozessgrenze."""
+    return [als_zeile(v) for v in parser(body, *args)]
+
+
+def _parse_zeilen(parser, body: str, *args) -> list[tuple]:
+    if _PARSE_POOL is None:
+        return _parse_zu_zeilen(parser, body, args)
+    return _PARSE_POOL.submit(_parse_zu_zeilen, parser, body, args).result()
+
+
+def _geparst(parser, body: str, *args) -> list[Veranstaltung]:
+    """parser(body, *args) — bei aktivem Parse-Memo aus dem Cache, wenn der Body schon bekannt ist.
+
+    Der Schlüssel umfasst Body, Parser, Argumente, Version und die Felder von Veranstaltung.
+    """
+    if not _PARSE_CACHE_VERZEICHNIS:
+        if _PARSE_POOL is None:
+            return parser(body, *args)
+        return [aus_zeile(z) for z in _parse_zeilen(parser, body, *args)]
+
+    kopf = json.dumps([PARSE_CACHE_VERSION, parser.__name__, [f.name for f in fields(Veranstaltung)], args],
+                      default=sorted, ensure_ascii=False)
+    schluessel = hashlib.sha256(f"{kopf}\0{body}".encode('utf-8')).hexdigest()[:24]
+    pfad = os.path.join(_PARSE_CACHE_VERZEICHNIS, f"{parser.__name__}_{schluessel}.json")
+    try:
+        with open(pfad, encoding='utf-8') as f:
+            zeilen = json.load(f)
+        os.utime(pfad)  # zählt für PARSE_CACHE_TAGE als Treffer
+        return [aus_zeile(z) for z in zeilen]
+    except (OSError, ValueError, TypeError):
+        pass  # kein oder kaputter Eintrag: normal parsen
+
+    zeilen = _parse_zeilen(parser, body, *args)
+    tmp = f"{pfad}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(zeilen, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, pfad)
+    except OSError as e:
+        print(f"  Parse-Cache nicht geschrieben: {e}")
+    return [aus_zeile(z) for z in zeilen]
+
+
 def _parse_event(event: dict) -> Veranstaltung | None:
     """Parst ein einzelnes Event aus der API-Antwort."""
     name = event.get('name', '').strip()
@@ -137,24 +581,23 @@ def _parse_event(event: dict) -> Veranstaltung | None:
     # Link: nur external_link verwenden (muensterland.com hat keine Event-Detailseiten)
     link = event.get('external_link') or ''
 
-    # Hinweis für mehrtägige Veranstaltungen
-    bis_hinweis = ''
+    # Mehrtägige Veranstaltungen (Ausstellungen, Märkte): Ende merken.
+    # Ein Tag Versatz ist meist eine Nacht (Party bis 3 Uhr), kein zweiter Veranstaltungstag.
+    ende = None
     end_str = event.get('end_datetime', '')
     if end_str:
         try:
             end_datum = datetime.fromisoformat(end_str).replace(tzinfo=None)
             delta = (end_datum.date() - datum.replace(tzinfo=None).date()).days
             if delta > 1:
-                bis_hinweis = f"Läuft bis {end_datum.strftime('%d.%m.%Y')}"
+                ende = end_datum
         except ValueError:
             pass
 
     # Beschreibung
     beschreibung_html = event.get('description_text', '')
     beschreibung = _html_zu_text(beschreibung_html)
-    if bis_hinweis:
-        beschreibung = bis_hinweis + (' · ' + beschreibung[:200] if beschreibung else '')
-    elif link:
+    if link:
         beschreibung = beschreibung[:300]
 
     return Veranstaltung(
@@ -165,11 +608,15 @@ def _parse_event(event: dict) -> Veranstaltung | None:
         stadt=stadt,
         link=link,
         beschreibung=beschreibung,
+        ende=ende,
     )
 
 
 def hole_veranstaltungen(jahr: int, monat: int) -> list[Veranstaltung]:
-    """Holt alle Veranstaltungen für einen bestimmten Monat."""
+    """Holt alle Veranstaltungen für einen bestimmten Monat.
+
+    Dazu gehören mehrtägige Events, die früher begonnen haben und in den Monat hineinlaufen.
+    """
     letzter_tag = monthrange(jahr, monat)[1]
     von = f"{jahr}-{monat:02d}-01"
     bis = f"{jahr}-{monat:02d}-{letzter_tag}"
@@ -188,7 +635,7 @@ def hole_veranstaltungen(jahr: int, monat: int) -> list[Veranstaltung]:
         }
 
         try:
-            response = _request_mit_retry('POST', API_URL, data=params, headers=HEADERS, timeout=30)
+            response = _request_gezaehlt('POST', API_URL, data=params, headers=HEADERS, timeout=30)
             daten = response.json()
         except (requests.RequestException, ValueError) as e:
             print(f"  Fehler beim Abrufen (Seite {seite}): {e}")
@@ -203,10 +650,9 @@ def hole_veranstaltungen(jahr: int, monat: int) -> list[Veranstaltung]:
             v = _parse_event(event)
             if not v:
                 continue
-            # Nur Events zeigen, die in diesem Monat beginnen (Eröffnungstag)
-            if v.datum < monats_start:
-                continue
-            if v.datum.year == jahr and v.datum.month == monat:
+            beginnt_hier = (v.datum.year, v.datum.month) == (jahr, monat)
+            laeuft_hinein = v.datum < monats_start and v.ende is not None and v.ende >= monats_start
+            if beginnt_hier or laeuft_hinein:
                 veranstaltungen.append(v)
 
         # Wenn weniger als PAGE_SIZE zurückkommen, war es die letzte Seite
@@ -221,26 +667,37 @@ def hole_veranstaltungen(jahr: int, monat: int) -> list[Veranstaltung]:
 
 def hole_digitalhub_events(jahr: int, monat: int) -> list[Veranstaltung]:
     """Holt Digital Hub Events für einen bestimmten Monat."""
+    return hole_digitalhub_zeitraum([(jahr, monat)])[(jahr, monat)]
+
+
+def hole_digitalhub_zeitraum(monate: list[tuple[int, int]]) -> dict[tuple[int, int], list[Veranstaltung]]:
+    """Holt Digital Hub Events für mehrere Monate mit einem API-Aufruf.
+
+    Die API liefert immer alle kommenden Events; sie werden auf die Monate verteilt.
+    """
+    ergebnis: dict[tuple[int, int], list[Veranstaltung]] = {m: [] for m in monate}
     params = {
         'api_token': DIGITALHUB_API_KEY
     }
 
     try:
-        response = _request_mit_retry('GET', DIGITALHUB_API_URL, params=params, headers=HEADERS, timeout=30)
-        daten = response.json()
+        response = _request_gezaehlt('GET', DIGITALHUB_API_URL, params=params, headers=HEADERS, timeout=30)
+        veranstaltungen = _geparst(_parse_digitalhub, response.text, sorted(ergebnis))
     except (requests.RequestException, ValueError) as e:
         print(f"  Digital Hub API-Fehler: {e}")
-        return []
+        return ergebnis
+
+    for v in veranstaltungen:
+        ergebnis[(v.datum.year, v.datum.month)].append(v)
+    return ergebnis
 
-    # Events sind im "data"-Array
-    events = daten.get('data', [])
-    if not events:
-        return []
 
+def _parse_digitalhub(body: str, monate: list[tuple[int, int]]) -> list[Veranstaltung]:
+    """Parst die Digital-Hub-API-Antwort (nur Events in den gegebenen Monaten)."""
+    # Events sind im "data"-Array
+    events = json.loads(body).get('data', [])
+    monate = set(map(tuple, monate))
     veranstaltungen = []
-    monats_start = datetime(jahr, monat, 1)
-    letzter_tag = monthrange(jahr, monat)[1]
-    monats_ende = datetime(jahr, monat, letzter_tag, 23, 59, 59)
 
     for event in events:
         # Datum parsen
@@ -253,8 +710,8 @@ def hole_digitalhub_events(jahr: int, monat: int) -> list[Veranstaltung]:
         except ValueError:
             continue
 
-        # Nur Events im gewünschten Monat
-        if datum < monats_start or datum > monats_ende:
+        # Nur Events in den gewünschten Monaten
+        if (datum.year, datum.month) not in monate:
             continue
 
         # Uhrzeit
@@ -311,13 +768,30 @@ def hole_digitalhub_events(jahr: int, monat: int) -> list[Veranstaltung]:
 
 def hole_halle_muensterland_events(jahr: int, monat: int) -> list[Veranstaltung]:
     """Holt Events von der Halle Münsterland für einen bestimmten Monat."""
+    return hole_halle_muensterland_zeitraum([(jahr, monat)])[(jahr, monat)]
+
+
+def hole_halle_muensterland_zeitraum(monate: list[tuple[int, int]]) -> dict[tuple[int, int], list[Veranstaltung]]:
+    """Holt Events der Halle Münsterland für mehrere Monate aus einem Seitenabruf.
+
+    Die Veranstaltungsseite listet alle kommenden Termine; sie werden auf die Monate verteilt.
+    """
+    ergebnis: dict[tuple[int, int], list[Veranstaltung]] = {m: [] for m in monate}
     try:
-        response = _request_mit_retry('GET', HALLE_MUENSTERLAND_URL, headers=HEADERS, timeout=30)
+        response = _request_gezaehlt('GET', HALLE_MUENSTERLAND_URL, headers=HEADERS, timeout=30)
     except requests.RequestException as e:
         print(f"  Halle Münsterland Fehler: {e}")
-        return []
+        return ergebnis
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    for v in _geparst(_parse_halle_muensterland, response.text, sorted(ergebnis)):
+        ergebnis[(v.datum.year, v.datum.month)].append(v)
+    return ergebnis
+
+
+def _parse_halle_muensterland(body: str, monate: list[tuple[int, int]]) -> list[Veranstaltung]:
+    """Parst die Event-Cards der Halle-Münsterland-Seite (nur Events in den gegebenen Monaten)."""
+    soup = BeautifulSoup(body, 'html.parser')
+    monate = set(map(tuple, monate))
     veranstaltungen = []
 
     # Alle Event-Cards finden
@@ -338,8 +812,8 @@ def hole_halle_muensterland_events(jahr: int, monat: int) -> list[Veranstaltung]
         except ValueError:
             continue
 
-        # Nur Events im gewünschten Monat
-        if event_jahr != jahr or event_monat != monat:
+        # Nur Events in den gewünschten Monaten
+        if (event_jahr, event_monat) not in monate:
             continue
 
         # Tag aus data-date extrahieren (Format: MM-DD-YY)
@@ -397,15 +871,28 @@ def hole_halle_muensterland_events(jahr: int, monat: int) -> list[Veranstaltung]
 
 def _hole_regioactive_stadt(city_id: int, slug: str, stadt_name: str,
                              jahr: int, monat: int) -> list[Veranstaltung]:
-    """Holt Events von regioactive.de für eine Stadt via JSON-LD."""
+    """Holt Events von regioactive.de für eine Stadt via JSON-LD.
+
+    Wirft QuelleBlockiert bei 403 oder Cloudflare-Challenge.
+    """
     url = REGIOACTIVE_URL_TEMPLATE.format(city_id=city_id, slug=slug, jahr=jahr, monat=monat)
     try:
-        response = _request_mit_retry('GET', url, headers=HEADERS, timeout=30)
+        response = _request_gezaehlt('GET', url, headers=HEADERS, timeout=30)
     except requests.RequestException as e:
+        if _ist_403(e):
+            raise QuelleBlockiert(f"regioactive {stadt_name}: 403") from e
         print(f"  regioactive {stadt_name} Fehler: {e}")
         return []
+    if _ist_challenge(response.text):
+        _zaehle(url, 'Cloudflare-Challenge')
+        raise QuelleBlockiert(f"regioactive {stadt_name}: Cloudflare-Challenge")
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return _geparst(_parse_regioactive, response.text, stadt_name, jahr, monat)
+
+
+def _parse_regioactive(body: str, stadt_name: str, jahr: int, monat: int) -> list[Veranstaltung]:
+    """Parst die JSON-LD-Events einer regioactive-Stadtseite (nur Events im Monat)."""
+    soup = BeautifulSoup(body, 'html.parser')
     veranstaltungen = []
 
     for script in soup.find_all('script', type='application/ld+json'):
@@ -465,23 +952,45 @@ def _hole_regioactive_stadt(city_id: int, slug: str, stadt_name: str,
 
 
 def hole_regioactive_ms(jahr: int, monat: int) -> list[Veranstaltung]:
-    """Holt Events von regioactive.de für Münster + Kreis-Borken-Städte."""
-    veranstaltungen = []
-    for city_id, slug, stadt_name in REGIOACTIVE_STAEDTE:
-        veranstaltungen.extend(_hole_regioactive_stadt(city_id, slug, stadt_name, jahr, monat))
-    return veranstaltungen
+    """Holt Events von regioactive.de für Münster + Münsterland-Städte.
+
+    Die Städte laufen parallel (REGIOACTIVE_PARALLEL), gedrosselt über den
+    Token-Bucket des Hosts (HOST_LIMITS). Die erste Sperre (403/Challenge) bricht alle noch
+    nicht gestarteten Städte ab.
+    """
+    blockiert = threading.Event()
+
+    def hole_stadt(stadt: tuple[int, str, str]) -> list[Veranstaltung]:
+        if blockiert.is_set():
+            return []
+        try:
+            return _hole_regioactive_stadt(*stadt, jahr, monat)
+        except QuelleBlockiert as e:
+            if not blockiert.is_set():
+                blockiert.set()
+                print(f"  regioactive blockiert ({e}) — restliche Städte übersprungen")
+            return []
+
+    with ThreadPoolExecutor(max_workers=REGIOACTIVE_PARALLEL) as pool:
+        ergebnisse = list(pool.map(hole_stadt, REGIOACTIVE_STAEDTE))
+    return [v for stadt_events in ergebnisse for v in stadt_events]
 
 
 def hole_theater_muenster(jahr: int, monat: int) -> list[Veranstaltung]:
     """Holt den Spielplan des Theater Münster via HTML-Scraping."""
     url = f"{THEATER_MS_URL}?date={jahr:04d}-{monat:02d}"
     try:
-        response = _request_mit_retry('GET', url, headers=HEADERS, timeout=30)
+        response = _request_gezaehlt('GET', url, headers=HEADERS, timeout=30)
     except requests.RequestException as e:
         print(f"  Theater Münster Fehler: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    return _geparst(_parse_theater_muenster, response.text, jahr, monat)
+
+
+def _parse_theater_muenster(body: str, jahr: int, monat: int) -> list[Veranstaltung]:
+    """Parst die tm-performance-Blöcke einer Spielplan-Seite."""
+    soup = BeautifulSoup(body, 'html.parser')
     veranstaltungen = []
 
     for perf in soup.find_all('div', class_='tm-performance'):
@@ -547,95 +1056,142 @@ def hole_theater_muenster(jahr: int, monat: int) -> list[Veranstaltung]:
     return veranstaltungen
 
 
-def hole_lwl_museum(jahr: int, monat: int) -> list[Veranstaltung]:
-    """Holt Veranstaltungen vom LWL-Museum für Kunst und Kultur via HTML-Scraping."""
-    letzter_tag = monthrange(jahr, monat)[1]
-    von = f"01.{monat:02d}.{jahr}"
-    bis = f"{letzter_tag:02d}.{monat:02d}.{jahr}"
+LWL_MAX_SEITEN = 10  # Sicherheitsgrenze für die Pagination
+LWL_PARALLEL = 4  # gleichzeitige Seitenabrufe, sobald die Seitenzahl bekannt ist
 
-    veranstaltungen = []
-    MAX_SEITEN = 10
 
-    for seite in range(1, MAX_SEITEN + 1):
-        url = f"{LWL_MUSEUM_URL}?vom={von}&bis={bis}&p={seite}"
-        try:
-            response = _request_mit_retry('GET', url, headers=HEADERS, timeout=30)
-        except requests.RequestException as e:
-            print(f"  LWL Museum Fehler (Seite {seite}): {e}")
-            break
+def _lwl_seitenzahl(soup: 'bs4.BeautifulSoup') -> int:
+    """Gesamtzahl der Seiten laut ul.pagination (höchste verlinkte Seitennummer, mind. 1)."""
+    pagination = soup.find('ul', class_='pagination')
+    if not pagination:
+        return 1
+    seiten = [1]
+    for li in pagination.find_all('li'):
+        text = li.get_text(strip=True)
+        if text.isdigit():
+            seiten.append(int(text))
+        a = li.find('a', href=True)
+        m = re.search(r'[?&]p=(\d+)', a['href']) if a else None
+        if m:
+            seiten.append(int(m.group(1)))
+    return max(seiten)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        event_elems = soup.find_all('div', class_='event-element')
-        if not event_elems:
-            break
 
-        for elem in event_elems:
-            # Datum: "Dienstag, 24.2.2026" → datetime
-            date_p = elem.find('p', class_='event-date')
-            if not date_p:
-                continue
-            date_text = date_p.get_text(strip=True)
-            date_part = date_text.split(',', 1)[1].strip() if ',' in date_text else date_text
-            try:
-                parts = [p.strip() for p in date_part.split('.')]
-                datum = datetime(int(parts[2]), int(parts[1]), int(parts[0]))
-            except (ValueError, IndexError):
-                continue
+def _lwl_seitenzahl_aus_text(body: str) -> int:
+    """Seitenzahl ohne die ganze Seite zu parsen: nur der ul.pagination-Block."""
+    block = re.search(r'<ul[^>]*class="[^"]*\bpagination\b.*?</ul>', body, re.S)
+    return _lwl_seitenzahl(BeautifulSoup(block.group(0), 'html.parser')) if block else 1
 
-            if datum.year != jahr or datum.month != monat:
-                continue
 
-            # Uhrzeit: "10.30 - 12.30 Uhr" → "10:30 - 12:30 Uhr"
-            time_p = elem.find('p', class_='event-time')
-            uhrzeit_raw = time_p.get_text(strip=True) if time_p else 'siehe Website'
-            uhrzeit = re.sub(r'(\d{1,2})\.(\d{2})', r'\1:\2', uhrzeit_raw)
+def _hole_lwl_seite(von: str, bis: str, seite: int) -> str:
+    url = f"{LWL_MUSEUM_URL}?vom={von}&bis={bis}&p={seite}"
+    response = _request_gezaehlt('GET', url, headers=HEADERS, timeout=30)
+    return response.text
 
-            # Titel: <h4 class="event-title"><span id="event-title-XXXXX">
-            title_h4 = elem.find('h4', class_='event-title')
-            if not title_h4:
-                continue
-            title_span = title_h4.find('span', id=re.compile(r'^event-title-'))
-            if not title_span:
-                continue
-            name = title_span.get_text(strip=True)
-            event_id = title_span.get('id', '').replace('event-title-', '')
-            link = f"https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/?id={event_id}" if event_id else ''
 
-            if not name:
-                continue
+def _parse_lwl_seite(body: str, monate: list[tuple[int, int]]) -> list[Veranstaltung]:
+    return _parse_lwl_events(BeautifulSoup(body, 'html.parser'), set(map(tuple, monate)))
 
-            # Beschreibung
-            desc_p = elem.find('p', class_='event-description')
-            beschreibung = desc_p.get_text(strip=True) if desc_p else ''
 
-            # Kategorie (Zielgruppe)
-            type_p = elem.find('p', class_='event-type')
-            kategorie = type_p.get_text(strip=True) if type_p else ''
+def _parse_lwl_events(soup: 'bs4.BeautifulSoup', monate: set[tuple[int, int]]) -> list[Veranstaltung]:
+    """Parst die event-element-Blöcke einer LWL-Terminseite (nur Events in den gegebenen Monaten)."""
+    veranstaltungen = []
+    for elem in soup.find_all('div', class_='event-element'):
+        # Datum: "Dienstag, 24.2.2026" → datetime
+        date_p = elem.find('p', class_='event-date')
+        if not date_p:
+            continue
+        date_text = date_p.get_text(strip=True)
+        date_part = date_text.split(',', 1)[1].strip() if ',' in date_text else date_text
+        try:
+            parts = [p.strip() for p in date_part.split('.')]
+            datum = datetime(int(parts[2]), int(parts[1]), int(parts[0]))
+        except (ValueError, IndexError):
+            continue
 
-            veranstaltungen.append(Veranstaltung(
-                name=name[:150],
-                datum=datum,
-                uhrzeit=uhrzeit,
-                ort='LWL-Museum für Kunst und Kultur',
-                stadt='Münster',
-                link=link,
-                beschreibung=beschreibung[:200],
-                quelle='lwl_museum',
-                kategorie=kategorie,
-            ))
+        if (datum.year, datum.month) not in monate:
+            continue
 
-        # Gibt es eine nächste Seite?
-        pagination = soup.find('ul', class_='pagination')
-        if not pagination:
-            break
-        # Suche nach aktivem Element und ob danach noch eines folgt
-        items = pagination.find_all('li')
-        aktiv_idx = next((i for i, li in enumerate(items) if 'active' in li.get('class', [])), None)
-        if aktiv_idx is None or aktiv_idx >= len(items) - 2:  # letztes li ist meist "›"
-            break
-        # Prüfe ob "next"-Link tatsächlich eine Seite verlinkt
-        next_li = items[aktiv_idx + 1] if aktiv_idx + 1 < len(items) else None
-        if not next_li or not next_li.find('a', href=True):
-            break
+        # Uhrzeit: "10.30 - 12.30 Uhr" → "10:30 - 12:30 Uhr"
+        time_p = elem.find('p', class_='event-time')
+        uhrzeit_raw = time_p.get_text(strip=True) if time_p else 'siehe Website'
+        uhrzeit = re.sub(r'(\d{1,2})\.(\d{2})', r'\1:\2', uhrzeit_raw)
+
+        # Titel: <h4 class="event-title"><span id="event-title-XXXXX">
+        title_h4 = elem.find('h4', class_='event-title')
+        if not title_h4:
+            continue
+        title_span = title_h4.find('span', id=re.compile(r'^event-title-'))
+        if not title_span:
+            continue
+        name = title_span.get_text(strip=True)
+        event_id = title_span.get('id', '').replace('event-title-', '')
+        link = f"https://www.lwl-museum-kunst-kultur.de/de/touren-workshops/termine-und-veranstaltungen/?id={event_id}" if event_id else ''
+
+        if not name:
+            continue
+
+        # Beschreibung
+        desc_p = elem.find('p', class_='event-description')
+        beschreibung = desc_p.get_text(strip=True) if desc_p else ''
 
+        # Kategorie (Zielgruppe)
+        type_p = elem.find('p', class_='event-type')
+        kategorie = type_p.get_text(strip=True) if type_p else ''
+
+        veranstaltungen.append(Veranstaltung(
+            name=name[:150],
+            datum=datum,
+            uhrzeit=uhrzeit,
+            ort='LWL-Museum für Kunst und Kultur',
+            stadt='Münster',
+            link=link,
+            beschreibung=beschreibung[:200],
+            quelle='lwl_museum',
+            kategorie=kategorie,
+        ))
     return veranstaltungen
+
+
+def hole_lwl_museum(jahr: int, monat: int) -> list[Veranstaltung]:
+    """Holt Veranstaltungen vom LWL-Museum für Kunst und Kultur via HTML-Scraping."""
+    return hole_lwl_museum_zeitraum([(jahr, monat)])[(jahr, monat)]
+
+
+def hole_lwl_museum_zeitraum(monate: list[tuple[int, int]]) -> dict[tuple[int, int], list[Veranstaltung]]:
+    """Holt LWL-Veranstaltungen für mehrere aufeinanderfolgende Monate in einem Durchlauf.
+
+    Ein vom/bis-Zeitraum über alle Monate statt einer Pagination pro Monat;
+    die Events werden anhand ihres event-date auf die Monate verteilt. Die
+    erste Seite liefert über ul.pagination die Seitenzahl, die restlichen
+    Seiten (höchstens LWL_MAX_SEITEN pro Monat) werden parallel abgerufen.
+    """
+    ergebnis: dict[tuple[int, int], list[Veranstaltung]] = {m: [] for m in monate}
+    if not monate:
+        return ergebnis
+    erster_jahr, erster_monat = min(monate)
+    letzter_jahr, letzter_monat = max(monate)
+    von = f"01.{erster_monat:02d}.{erster_jahr}"
+    bis = f"{monthrange(letzter_jahr, letzter_monat)[1]:02d}.{letzter_monat:02d}.{letzter_jahr}"
+
+    try:
+        erste_seite = _hole_lwl_seite(von, bis, 1)
+    except requests.RequestException as e:
+        print(f"  LWL Museum Fehler (Seite 1): {e}")
+        return ergebnis
+
+    seiten_bodies = [erste_seite]
+    seiten = min(_lwl_seitenzahl_aus_text(erste_seite), LWL_MAX_SEITEN * len(monate))
+    if seiten > 1:
+        with ThreadPoolExecutor(max_workers=min(LWL_PARALLEL, seiten - 1)) as pool:
+            abrufe = {seite: pool.submit(_hole_lwl_seite, von, bis, seite) for seite in range(2, seiten + 1)}
+        for seite, abruf in abrufe.items():
+            try:
+                seiten_bodies.append(abruf.result())
+            except requests.RequestException as e:
+                print(f"  LWL Museum Fehler (Seite {seite}): {e}")
+
+    for body in seiten_bodies:
+        for v in _geparst(_parse_lwl_seite, body, sorted(ergebnis)):
+            ergebnis[(v.datum.year, v.datum.month)].append(v)
+    return ergebnis
@@ -0,0 +1,128 @@
+"""Service Worker für das Dashboard (sw.js): sofortige Wiederholungsbesuche und offline.
+
+app.py schreibt sw.js nach jedem Lauf. Vorab gecacht werden index.html,
+manifest.json und die Monatsseiten im Fenster Vormonat/aktueller/nächster Monat,
+soweit sie im Manifest stehen — mit --shell auch dashboard.html und die
+Monatsdaten (daten/*.json) dieser Monate. Diese Dateien laufen über
+stale-while-revalidate: sofort aus dem Cache, im Hintergrund aktualisiert.
+
+Regionsseiten und -daten (regionen.py) werden nicht vorab geladen, sondern
+erst beim ersten Besuch gecacht — jeder lädt nur seine Region, und nur für
+Monate im Fenster. Alles andere (iCal-Feeds, Monate außerhalb des Fensters)
+geht am Cache vorbei ans Netz; der Cache bleibt so auf das Fenster begrenzt.
+
+Monatsseiten, die update.sh gelöscht hat, fehlen im Manifest; der Service
+Worker wirft sie beim Aktivieren und bei jedem frischen manifest.json aus dem
+Cache. Die Cache-Version ist ein Hash über die vorab gecachten Dateien und
+deren Inhalts-Hash — ändert sich nichts, bleibt sw.js byte-gleich und der
+Browser installiert nichts neu.
+"""
+
+import hashlib
+import json
+
+
+SW_DATEI = 'sw.js'
+CACHE_PRAEFIX = 'veranstaltungen-'
+
+# Im <body> jeder Monatsseite
+REGISTRIERUNG_HTML = '''<script>
+        if ('serviceWorker' in navigator) {
+            // manifest.json über den Service Worker holen: aktualisiert den Cache und räumt ihn auf
+            navigator.serviceWorker.register('sw.js').then(() => fetch('manifest.json')).catch(() => {});
+        }
+    </script>'''
+
+
+def precache_dateien(manifest: dict, fenster: list[str]) -> list[str]:
+    """Dateien, die bei der Installation geladen werden (nur vorhandene Monate aus dem Fenster)."""
+    dateien = ['./', 'index.html', 'manifest.json']
+    if manifest.get('shell'):
+        dateien.append(manifest['shell'])
+    for d in fenster:
+        if d in manifest['monate']:
+            dateien.append(d)
+            if 'daten' in manifest['monate'][d]:
+                dateien.append(manifest['monate'][d]['daten'])
+    return dateien
+
+
+def generiere_service_worker(manifest: dict, fenster: list[str]) -> str:
+    """Erzeugt sw.js; fenster sind die Dateinamen der Monate rund um heute."""
+    dateien = precache_dateien(manifest, fenster)
+    version_roh = json.dumps([[d, manifest['monate'].get(d, {}).get('sha256', '')] for d in dateien])
+    version = hashlib.sha256(version_roh.encode('utf-8')).hexdigest()[:12]
+
+    return f'''// Generiert von app.py — nicht von Hand bearbeiten.
+const CACHE = '{CACHE_PRAEFIX}{version}';
+const PRECACHE = {json.dumps(dateien)};
+const MONATSSEITE = /^veranstaltungen_\\d{{4}}_\\d{{2}}(_[a-z-]+)?\\.(html|json)$/;
+const IM_FENSTER = new Set(PRECACHE.map(d => new URL(d, self.location).pathname));
+
+// Vorab gecachte Dateien und die Regionsseiten/-daten ihrer Monate; sonst nichts
+function gehoertInsFenster(url) {{
+    if (IM_FENSTER.has(url.pathname)) {{
+        return true;
+    }}
+    const datei = url.pathname.split('/').pop();
+    return MONATSSEITE.test(datei)
+        && IM_FENSTER.has(new URL(datei.replace(/(_[a-z-]+)?\\.(html|json)$/, '.html'), self.location).pathname);
+}}
+
+self.addEventListener('install', event => {{
+    event.waitUntil(
+        caches.open(CACHE).then(cache => cache.addAll(PRECACHE)).then(() => self.skipWaiting())
+    );
+}});
+
+// Monatsseiten, -daten und Regionsseiten, deren Monat nicht mehr im Manifest steht (von update.sh gelöscht), entfernen
+async function raeumeAuf(manifest) {{
+    const cache = await caches.open(CACHE);
+    for (const anfrage of await cache.keys()) {{
+        const datei = new URL(anfrage.url).pathname.split('/').pop();
+        if (MONATSSEITE.test(datei) && !(datei.replace(/(_[a-z-]+)?\\.(html|json)$/, '.html') in manifest.monate)) {{
+            await cache.delete(anfrage);
+        }}
+    }}
+}}
+
+self.addEventListener('activate', event => {{
+    event.waitUntil((async () => {{
+        const alte = (await caches.keys()).filter(k => k.startsWith('{CACHE_PRAEFIX}') && k !== CACHE);
+        await Promise.all(alte.map(k => caches.delete(k)));
+        const manifest = await caches.match('manifest.json');
+        if (manifest) {{
+            await raeumeAuf(await manifest.json());
+        }}
+        await self.clients.claim();
+    }})());
+}});
+
+async function staleWhileRevalidate(event) {{
+    const cache = await caches.open(CACHE);
+    const gecacht = await cache.match(event.request);
+    const netz = fetch(event.request).then(async antwort => {{
+        if (antwort.ok) {{
+            const kopie = antwort.clone();
+            await cache.put(event.request, antwort.clone());
+            if (new URL(event.request.url).pathname.endsWith('/manifest.json')) {{
+                await raeumeAuf(await kopie.json());
+            }}
+        }}
+        return antwort;
+    }});
+    if (gecacht) {{
+        event.waitUntil(netz.catch(() => {{}}));
+        return gecacht;
+    }}
+    return netz;
+}}
+
+self.addEventListener('fetch', event => {{
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin || !gehoertInsFenster(url)) {{
+        return;
+    }}
+    event.respondWith(staleWhileRevalidate(event));
+}});
+'''
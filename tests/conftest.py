@@ -0,0 +1,20 @@
+"""Gemeinsame Test-Helfer."""
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import Veranstaltung
+
+
+def veranstaltung(name: str = 'Konzert', tag: int = 1, stadt: str = 'Münster', *, monat: int = 10,
+                  jahr: int = 2026, zeit: tuple[int, int] = (0, 0), **felder) -> Veranstaltung:
+    """Test-Event mit Vorgaben für alle Pflichtfelder; felder überschreiben alles, auch datum.
+
+    Dateien mit eigenen Vorgaben binden sie per functools.partial, z.B. partial(veranstaltung, monat=7).
+    """
+    werte = dict(name=name, datum=datetime(jahr, monat, tag, *zeit), uhrzeit='19:00 Uhr', ort='Ort', stadt=stadt,
+                 link='')
+    werte.update(felder)
+    return Veranstaltung(**werte)
@@ -0,0 +1,50 @@
+"""Tests für Event-Fingerabdrücke und den Vergleich zweier Läufe."""
+import sys
+import os
+from dataclasses import replace
+from functools import partial
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import fingerabdruck, event_hash, kanonischer_link
+from aenderungen import vergleiche, kurzfassung, bericht_eintrag
+from conftest import veranstaltung
+
+_v = partial(veranstaltung, name='Jazz im Hof', tag=4, monat=7, zeit=(20, 0), uhrzeit='20:00 Uhr', ort='Hof',
+             link='https://www.example.org/jazz/')
+
+
+def test_kanonischer_link():
+    assert kanonischer_link('http://WWW.Example.org/jazz/?utm_source=x&b=2&a=1#top') == 'https://example.org/jazz?a=1&b=2'
+    assert kanonischer_link('') == ''
+
+
+def test_fingerabdruck_stabil_gegen_kosmetik():
+    v = _v()
+    assert fingerabdruck(v) == fingerabdruck(_v(name='  JAZZ im Hof! ', datum=datetime(2026, 7, 4, 19, 0),
+                                                link='http://example.org/jazz?utm_medium=mail'))
+    assert fingerabdruck(v) != fingerabdruck(_v(datum=datetime(2026, 7, 5, 20, 0)))
+    assert fingerabdruck(v) != fingerabdruck(_v(quelle='regioactive'))
+
+
+def test_event_hash_erkennt_inhaltsaenderung():
+    v = _v()
+    assert event_hash(v) == event_hash(_v())
+    assert event_hash(v) != event_hash(replace(v, uhrzeit='21:00 Uhr'))
+
+
+def test_vergleiche_neu_entfallen_geaendert():
+    def abdruecke(*events):
+        return {fingerabdruck(v): [event_hash(v), v.name, v.datum.strftime('%Y-%m-%d')] for v in events}
+
+    bleibt, verlegt, weg, dazu = _v(), _v(name='Lesung'), _v(name='Flohmarkt'), _v(name='Radtour')
+    alt = abdruecke(bleibt, verlegt, weg)
+    neu = abdruecke(bleibt, replace(verlegt, uhrzeit='18:00 Uhr'), dazu)
+    diff = vergleiche(alt, neu)
+    assert diff == {'neu': [fingerabdruck(dazu)], 'entfallen': [fingerabdruck(weg)],
+                    'geaendert': [fingerabdruck(verlegt)]}
+
+    eintrag = bericht_eintrag(alt, neu, diff)
+    assert kurzfassung(eintrag) == '+1 neu, -1 entfallen, ~1 geändert'
+    assert eintrag['beispiele']['entfallen'] == ['2026-07-04 Flohmarkt']
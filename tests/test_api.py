@@ -0,0 +1,113 @@
+"""Tests für die JSON-Abfrage-API (app.py --serve)."""
+import sys
+import os
+import gzip
+import json
+import urllib.request
+import urllib.error
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import EventIndex, UngueltigeAbfrage, beantworte, starte_server
+from app import fingerabdruck
+from conftest import veranstaltung as _v
+
+
+@pytest.fixture
+def index():
+    return EventIndex([
+        _v('Jazz im Hawerkamp', 12),
+        _v('Jazzfrühstück', 3, stadt='Rheine'),
+        _v('Lesung', 5, beschreibung='Ein Abend mit Jazz und Lyrik', quelle='theater'),
+        _v('Meetup KI', 20, quelle='digitalhub', kategorie='Meetup'),
+        _v('Orgelkonzert', 31, stadt='Telgte'),
+    ], fingerabdruck)
+
+
+def _namen(index, **parameter):
+    return [e['name'] for e in beantworte(index, '/events', parameter)['events']]
+
+
+def test_ohne_filter_alles_in_datumsreihenfolge(index):
+    assert _namen(index) == ['Jazzfrühstück', 'Lesung', 'Jazz im Hawerkamp', 'Meetup KI', 'Orgelkonzert']
+
+
+def test_filter_werden_geschnitten(index):
+    assert _namen(index, stadt='münster', q='jazz') == ['Lesung', 'Jazz im Hawerkamp']
+    assert _namen(index, q='jazz', von='2026-10-04', bis='2026-10-12') == ['Lesung', 'Jazz im Hawerkamp']
+    assert _namen(index, stadt='Rheine,Telgte') == ['Jazzfrühstück', 'Orgelkonzert']
+    assert _namen(index, kategorie='Meetup', quelle='digitalhub') == ['Meetup KI']
+    assert _namen(index, stadt='Ahaus') == []
+
+
+def test_volltext_trifft_wortanfaenge(index):
+    assert _namen(index, q='jazzf') == ['Jazzfrühstück']
+    assert _namen(index, q='hawer') == ['Jazz im Hawerkamp']
+
+
+def test_pagination(index):
+    erste = beantworte(index, '/events', {'limit': '2'})
+    assert (erste['gesamt'], len(erste['events'])) == (5, 2)
+    assert erste['weiter'] == '/events?limit=2&offset=2'
+    letzte = beantworte(index, '/events', {'limit': '2', 'offset': '4'})
+    assert ([e['name'] for e in letzte['events']], letzte['weiter']) == (['Orgelkonzert'], None)
+
+
+@pytest.mark.parametrize('parameter', [{'von': '10/2026'}, {'limit': 'viele'}, {'offset': '-1'},
+                                       {'limit': '0'}, {'ort': 'x'}])
+def test_ungueltige_parameter(index, parameter):
+    with pytest.raises(UngueltigeAbfrage):
+        beantworte(index, '/events', parameter)
+
+
+def test_am_findet_auch_laufende_events():
+    ausstellung = _v('Ausstellung', 1, monat=9, uhrzeit='ganztägig', ende=datetime(2026, 10, 10))
+    index = EventIndex([ausstellung, _v('Lesung', 5), _v('Konzert', 12)], fingerabdruck)
+    assert _namen(index, am='2026-10-05') == ['Ausstellung', 'Lesung']
+    assert _namen(index, am='2026-10-12') == ['Konzert']
+
+
+def test_von_bis_enthaelt_vorher_begonnene_laufende_events():
+    ausstellung = _v('Ausstellung', 1, monat=9, uhrzeit='ganztägig', ende=datetime(2026, 10, 10))
+    vorbei = _v('Sommerschau', 1, monat=8, uhrzeit='ganztägig', ende=datetime(2026, 9, 30))
+    index = EventIndex([ausstellung, vorbei, _v('Lesung', 5), _v('Konzert', 12)], fingerabdruck)
+    assert _namen(index, von='2026-10-01', bis='2026-10-31') == ['Ausstellung', 'Lesung', 'Konzert']
+    assert _namen(index, von='2026-10-11') == ['Konzert']
+    assert _namen(index, von='2026-10-01', q='ausstellung') == ['Ausstellung']
+    assert beantworte(index, '/events', {'am': '2026-10-05'})['events'][0]['ende'] == '2026-10-10'
+
+
+def test_facetten(index):
+    facetten = beantworte(index, '/facetten', {})
+    assert facetten['staedte'] == {'Münster': 3, 'Rheine': 1, 'Telgte': 1}
+    assert (facetten['von'], facetten['bis'], facetten['anzahl']) == ('2026-10-03', '2026-10-31', 5)
+
+
+def test_server_etag_und_gzip(index):
+    server = starte_server(index, port=0)
+    basis = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        url = basis + '/events?stadt=M%C3%BCnster&limit=500'
+        with urllib.request.urlopen(urllib.request.Request(url, headers={'Accept-Encoding': 'gzip'})) as antwort:
+            tag = antwort.headers['ETag']
+            body = antwort.read()
+            if antwort.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+        assert json.loads(body)['gesamt'] == 3
+
+        with pytest.raises(urllib.error.HTTPError) as fehler:
+            urllib.request.urlopen(urllib.request.Request(url, headers={'If-None-Match': tag}))
+        assert fehler.value.code == 304
+
+        server.index = EventIndex([_v('Neu', 1)], fingerabdruck)  # neuer Datenstand, neues ETag
+        with urllib.request.urlopen(urllib.request.Request(url, headers={'If-None-Match': tag})) as antwort:
+            assert antwort.status == 200 and antwort.headers['ETag'] != tag
+
+        with pytest.raises(urllib.error.HTTPError) as fehler:
+            urllib.request.urlopen(basis + '/gibtsnicht')
+        assert fehler.value.code == 404
+    finally:
+        server.shutdown()
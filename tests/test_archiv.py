@@ -0,0 +1,72 @@
+"""Tests für das Spaltenarchiv (archiv.py) und app.py stats."""
+import sys
+from functools import partial
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import archiv
+from archiv import bericht, bloecke, haenge_an, lies_kopf, lies_spalten, statistik
+from conftest import veranstaltung
+
+_v = partial(veranstaltung, zeit=(19, 30), uhrzeit='19:30 Uhr', rubrik='Konzert')
+
+
+def test_block_speichert_spalten_typisiert_und_kodiert(tmp_path):
+    events = [_v('Konzert', 3), _v('Lesung', 5, stadt='Rheine', rubrik='Vortrag & Lesung'), _v('Jazz', 5)]
+    pfad = haenge_an(str(tmp_path), 2026, 10, datetime(2026, 10, 1, 6), events, 'h1')
+    assert pfad.endswith(os.path.join('2026_10', '20261001T060000.spalten'))
+    kopf = lies_kopf(pfad)
+    assert (kopf['anzahl'], kopf['lauf'], kopf['spalten']['stadt']['typ']) == (3, '2026-10-01T06:00:00', 'H')
+
+    spalten = lies_spalten(pfad, ['stadt', 'tag', 'wochentag', 'minute'])
+    assert spalten['stadt'].woerterbuch == ['Münster', 'Rheine']
+    assert list(spalten['stadt'].werte) == [0, 1, 0]
+    assert spalten['stadt'].zaehle() == {'Münster': 2, 'Rheine': 1}
+    assert datetime.fromordinal(spalten['tag'].werte[1]).date() == datetime(2026, 10, 5).date()
+    assert list(spalten['wochentag'].werte) == [5, 0, 0]  # Sa, Mo, Mo
+    assert set(spalten['minute'].werte) == {19 * 60 + 30}
+
+
+def test_unveraenderter_monat_bekommt_keinen_neuen_block(tmp_path):
+    events = [_v('Konzert', 3)]
+    assert haenge_an(str(tmp_path), 2026, 10, datetime(2026, 10, 1, 6), events, 'h1')
+    assert haenge_an(str(tmp_path), 2026, 10, datetime(2026, 10, 2, 6), events, 'h1') is None
+    assert haenge_an(str(tmp_path), 2026, 10, datetime(2026, 10, 3, 6), events + [_v('Lesung', 4)], 'h2')
+    assert len(bloecke(str(tmp_path))) == 2
+
+
+def test_statistik_letzter_stand_und_abdeckung(tmp_path):
+    archiv_dir = str(tmp_path)
+    haenge_an(archiv_dir, 2026, 10, datetime(2026, 10, 1, 6), [_v('A', 3), _v('B', 4, quelle='digitalhub')], 'h1')
+    haenge_an(archiv_dir, 2026, 11, datetime(2026, 10, 1, 6), [_v('C', 7, monat=11)], 'h2')
+    # Am 2.11. ist der Oktober vorbei; nur der November zählt noch als kommend
+    haenge_an(archiv_dir, 2026, 11, datetime(2026, 11, 2, 6),
+              [_v('C', 7, monat=11), _v('D', 8, monat=11, stadt='Telgte', rubrik='Sport')], 'h3')
+
+    stat = statistik(archiv_dir)
+    assert stat['bloecke'] == 3
+    assert stat['monate']['2026-10']['quellen'] == {'muensterland': 1, 'digitalhub': 1}
+    assert stat['monate']['2026-11']['staedte'] == {'Münster': 1, 'Telgte': 1}
+    assert stat['monate']['2026-11']['wochentage']['Sa'] == 1
+    assert stat['monate']['2026-11']['rubriken'] == {'Konzert': 1, 'Sport': 1}
+    assert stat['abdeckung'] == {'2026-10-01': {'digitalhub': 1, 'muensterland': 2},
+                                 '2026-11-02': {'muensterland': 2}}
+    text = bericht(stat)
+    assert 'Telgte' in text and '2026-11-02' in text
+
+
+def test_statistik_entpackt_nur_benoetigte_spalten(tmp_path, monkeypatch):
+    haenge_an(str(tmp_path), 2026, 10, datetime(2026, 10, 1, 6), [_v('Konzert', 3)], 'h1')
+    gelesen = []
+    original = archiv.lies_spalten
+    monkeypatch.setattr(archiv, 'lies_spalten', lambda pfad, namen: gelesen.extend(namen) or original(pfad, namen))
+    statistik(str(tmp_path))
+    assert 'beschreibung' not in gelesen and 'name' not in gelesen
+
+
+def test_leeres_archiv(tmp_path):
+    stat = statistik(str(tmp_path / 'fehlt'))
+    assert stat['bloecke'] == 0
+    assert 'leer' in bericht(stat)
@@ -0,0 +1,66 @@
+"""Tests für Aufzeichnung/Wiedergabe von HTTP-Antworten in scraper.py."""
+import sys
+import os
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+THEATER_HTML = '''
+<div class="tm-performance">
+  <div class="tm-performance__dayNumber">12</div>
+  <div class="tm-performance__performanceTime">19.30 Uhr</div>
+  <div class="tm-performance__location">Großes Haus</div>
+  <div class="tm-performance__productionName"><a href="/stueck/faust">Faust</a></div>
+</div>
+'''
+
+
+def _fake_response(text, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode('utf-8')
+    response.encoding = 'utf-8'
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _modus_zuruecksetzen(monkeypatch):
+    monkeypatch.setattr(scraper, '_AUFNAHME_VERZEICHNIS', None)
+    monkeypatch.setattr(scraper, '_WIEDERGABE_VERZEICHNIS', None)
+
+
+def test_aufnahme_und_wiedergabe(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper.requests, 'request', lambda *a, **kw: _fake_response(THEATER_HTML))
+    scraper.aktiviere_aufnahme(str(tmp_path))
+    live = scraper.hole_theater_muenster(2026, 7)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def kein_netz(*a, **kw):
+        raise AssertionError("Netzwerkzugriff im Wiedergabe-Modus")
+
+    monkeypatch.setattr(scraper, '_AUFNAHME_VERZEICHNIS', None)
+    monkeypatch.setattr(scraper.requests, 'request', kein_netz)
+    scraper.aktiviere_wiedergabe(str(tmp_path))
+    offline = scraper.hole_theater_muenster(2026, 7)
+
+    assert offline == live
+    assert offline[0].name == 'Faust'
+    assert offline[0].uhrzeit == '19:30 Uhr'
+
+
+def test_wiedergabe_ohne_aufnahme_ist_verbindungsfehler(tmp_path):
+    scraper.aktiviere_wiedergabe(str(tmp_path))
+    with pytest.raises(requests.ConnectionError):
+        scraper._request_gezaehlt('GET', 'https://example.com/fehlt')
+
+
+def test_dateiname_haengt_von_parametern_ab():
+    a = scraper._aufnahme_dateiname('POST', scraper.API_URL, data={'page[number]': '1'})
+    b = scraper._aufnahme_dateiname('POST', scraper.API_URL, data={'page[number]': '2'})
+    assert a != b
+    assert a.startswith('post_www.muensterland.com_')
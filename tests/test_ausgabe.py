@@ -0,0 +1,154 @@
+"""Tests für das Schreiben der Ausgabedateien (atomar, Monats-Rendering)."""
+import json
+import sys
+from functools import partial
+import os
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+from app import schreibe_atomar, rendere_monat
+from atomar import AtomareDatei
+from conftest import veranstaltung
+
+_v = partial(veranstaltung, monat=7)
+
+
+def test_schreibe_atomar_ersetzt_und_hinterlaesst_nichts(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    pfad.write_text('alt', encoding='utf-8')
+    schreibe_atomar(str(pfad), 'neu')
+    assert pfad.read_text(encoding='utf-8') == 'neu'
+    assert [p.name for p in tmp_path.iterdir()] == ['veranstaltungen_2026_07.html']
+
+
+def test_schreibe_atomar_fehler_laesst_alte_datei_stehen(tmp_path, monkeypatch):
+    pfad = tmp_path / 'index.html'
+    pfad.write_text('alt', encoding='utf-8')
+
+    def kaputt(*args):
+        raise OSError('Platte voll')
+
+    monkeypatch.setattr(app.os, 'replace', kaputt)
+    with pytest.raises(OSError):
+        schreibe_atomar(str(pfad), 'neu')
+    assert pfad.read_text(encoding='utf-8') == 'alt'
+    assert [p.name for p in tmp_path.iterdir()] == ['index.html']  # keine Temp-Datei bleibt liegen
+
+
+def test_atomare_datei_streamt_bytes_und_verwirft_bei_fehler(tmp_path):
+    pfad = tmp_path / 'block.spalten'
+    with AtomareDatei(str(pfad)) as datei:
+        datei.schreibe(b'kopf\n')
+        datei.schreibe(b'daten')
+    assert pfad.read_bytes() == b'kopf\ndaten'
+    with pytest.raises(ValueError):
+        with AtomareDatei(str(pfad)) as datei:
+            datei.schreibe(b'halb')
+            raise ValueError('Spalte kaputt')
+    assert pfad.read_bytes() == b'kopf\ndaten'
+    assert [p.name for p in tmp_path.iterdir()] == ['block.spalten']
+
+
+def test_rendere_monat_schreibt_seite_und_meldet(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    events = [_v('Konzert', 3), _v('Konzert', 3), _v('Lesung', 5, 'Rheine')]
+    zeilen, eintrag, _ = rendere_monat(events, 2026, 7, [(2026, 7)], str(pfad))
+    assert zeilen == ['  => Gesamt: 2 Veranstaltungen in 2 Orten (1 Duplikate entfernt)']
+    assert '<span id="termine-count">2</span>' in pfad.read_text(encoding='utf-8')
+    assert (eintrag['veranstaltungen'], eintrag['orte'], eintrag['quellen']) == (2, 2, {'muensterland': 2})
+
+
+def test_inhalts_hash_unabhaengig_von_reihenfolge():
+    a, b = _v('Konzert', 3), _v('Lesung', 5)
+    assert app.inhalts_hash([a, b]) == app.inhalts_hash([b, a])
+    assert app.inhalts_hash([a]) != app.inhalts_hash([a, b])
+
+
+def test_rendere_monat_markiert_neue_events(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    konzert, lesung = _v('Konzert', 3), _v('Lesung', 5)
+    _, _, abdruecke = rendere_monat([konzert], 2026, 7, [(2026, 7)], str(pfad), vorher=None)
+    assert 'badge-neu">neu' not in pfad.read_text(encoding='utf-8')
+
+    rendere_monat([konzert, lesung], 2026, 7, [(2026, 7)], str(pfad), vorher=set(abdruecke))
+    html = pfad.read_text(encoding='utf-8')
+    assert html.count('badge-neu">neu') == 1
+    assert html.index('Lesung') < html.index('badge-neu">neu')
+
+
+def test_rendere_monat_schreibt_monatsdaten_fuer_shell(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    daten_pfad = tmp_path / 'veranstaltungen_2026_07.json'
+    events = [_v('Lesung <b>', 5, 'Rheine'), _v('Konzert', 3)]
+    _, eintrag, _ = rendere_monat(events, 2026, 7, [(2026, 7)], str(pfad), daten_pfad=str(daten_pfad))
+    daten = json.loads(daten_pfad.read_text(encoding='utf-8'))
+    termine = [dict(zip(daten['felder'], zeile)) for zeile in daten['termine']]
+    assert [t['name'] for t in termine] == ['Konzert', 'Lesung <b>']  # roh, escaped wird im Client
+    assert (termine[1]['datum'], termine[1]['stadt'], termine[1]['neu']) == ('2026-07-05', 'Rheine', 0)
+    assert (termine[0]['rubrik'], termine[1]['rubrik']) == ('Konzert', 'Vortrag & Lesung')
+    assert eintrag['daten'] == 'daten/veranstaltungen_2026_07.json'
+
+
+def test_shell_kennt_verfuegbare_monate():
+    shell = app.generiere_shell([(2026, 7), (2026, 8)], (2026, 8))
+    assert 'const MONATE = ["2026-07", "2026-08"];' in shell
+    assert 'const START = "2026-08";' in shell
+    assert 'function filterTermine()' in shell
+
+
+def test_rendere_monat_mit_rubrik_filter(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    rendere_monat([_v('Lesung', 5), _v('Jazzkonzert', 3)], 2026, 7, [(2026, 7)], str(pfad))
+    html = pfad.read_text(encoding='utf-8')
+    assert 'id="rubrik-filter"' in html
+    assert 'data-rubrik="Vortrag &amp; Lesung"' in html
+    # Taxonomie-Reihenfolge, nicht alphabetisch
+    assert html.index('<option value="Konzert">') < html.index('<option value="Vortrag &amp; Lesung">')
+
+
+def test_mehrtaegige_events_einmal_im_abschnitt_laufend(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    ausstellung = _v('Sommerausstellung', 20, monat=6, uhrzeit='ganztägig', ende=datetime(2026, 7, 4))
+    daten_pfad = tmp_path / 'veranstaltungen_2026_07.json'
+    _, eintrag, _ = rendere_monat([ausstellung, _v('Konzert', 3), _v('Lesung', 8)], 2026, 7, [(2026, 7)], str(pfad),
+                                  daten_pfad=str(daten_pfad))
+    assert (eintrag['veranstaltungen'], eintrag['beginnen']) == (3, 2)  # manifest.py anzahl zählt sie im Juni
+    html = pfad.read_text(encoding='utf-8')
+    assert html.count('Sommerausstellung') == 1
+    assert 'data-von="2026-06-20" data-bis="2026-07-04"' in html
+    assert 'id="datum-2026-06-20"' not in html
+    # am 3. läuft sie noch, am 8. nicht mehr
+    assert "zeigeLaufend('2026-07-03'" in html
+    assert "zeigeLaufend('2026-07-08'" not in html
+    # Tage, an denen nur sie läuft: Kopf mit "+ 1 laufend" und Link im Kalender
+    assert 'id="datum-2026-07-01" data-nur-laufend="2026-07-01"' in html
+    assert "zeigeLaufend('2026-07-04', 'Sa 04.07.2026')\">+ 1 laufend</a>" in html
+    assert '<a href="#datum-2026-07-02" class="kal-link">' in html
+    assert 'id="datum-2026-07-05"' not in html
+    termine = json.loads(daten_pfad.read_text(encoding='utf-8'))['termine']
+    assert [zeile[-1] for zeile in termine] == ['2026-07-04', '', '']
+
+
+def test_rendere_monat_schreibt_regionsseiten(tmp_path):
+    pfad = tmp_path / 'veranstaltungen_2026_07.html'
+    daten_pfad = tmp_path / 'daten' / 'veranstaltungen_2026_07.json'
+    daten_pfad.parent.mkdir()
+    events = [_v('Domkonzert', 3), _v('Stadtfest', 4, 'Gronau'), _v('Lesung', 5, 'Telgte')]
+    _, eintrag, _ = rendere_monat(events, 2026, 7, [(2026, 7), (2026, 8)], str(pfad), daten_pfad=str(daten_pfad))
+
+    muenster = (tmp_path / 'veranstaltungen_2026_07_muenster.html').read_text(encoding='utf-8')
+    assert 'Domkonzert' in muenster and 'Stadtfest' not in muenster
+    assert 'href="veranstaltungen_2026_08_muenster.html"' in muenster  # Navigation bleibt in der Region
+    borken = (tmp_path / 'veranstaltungen_2026_07_kreis-borken.html').read_text(encoding='utf-8')
+    assert 'Stadtfest' in borken and 'Domkonzert' not in borken
+    # Jede Region bekommt ihre Seite, auch ohne Events in diesem Monat
+    assert (tmp_path / 'veranstaltungen_2026_07_bocholt.html').exists()
+    assert 'daten/veranstaltungen_2026_07_kreis-warendorf.json' in eintrag['regionen']
+    warendorf = json.loads((tmp_path / 'daten' / 'veranstaltungen_2026_07_kreis-warendorf.json').read_text(
+        encoding='utf-8'))
+    assert [zeile[2] for zeile in warendorf['termine']] == ['Lesung']
+    assert 'class="region-link aktiv">Kreis Borken</a>' in borken
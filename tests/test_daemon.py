@@ -0,0 +1,84 @@
+"""Tests für den Dauerbetrieb (app.py --daemon): nur geänderte Monate, warme Sitzungen."""
+import sys
+import os
+import threading
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+import scraper
+from quellen import Abruf
+from conftest import veranstaltung
+
+_v = partial(veranstaltung, monat=7)
+
+
+def _abruf(events):
+    return Abruf(events={'muensterland': {(2026, 7): events}}, dauer={'muensterland': 0.1},
+                 anzahl={'muensterland': len(events)})
+
+
+def test_erzeuge_schreibt_nur_geaenderte_monate(tmp_path, monkeypatch):
+    monate = [(2026, 7), (2026, 8)]
+    abrufe = [_abruf([_v('Konzert', 3)]), _abruf([_v('Konzert', 3)]), _abruf([_v('Konzert', 3), _v('Lesung', 5)])]
+    monkeypatch.setattr(app, 'hole_alle_quellen', lambda m, modi: abrufe.pop(0))
+    monkeypatch.setattr(app, 'RENDER_PROZESSE_MAX', 1)
+    letzte = {}
+
+    assert app.erzeuge(monate, str(tmp_path), letzte=letzte) == ['veranstaltungen_2026_07.html',
+                                                                  'veranstaltungen_2026_08.html']
+    assert app.erzeuge(monate, str(tmp_path), letzte=letzte) == []
+    assert app.erzeuge(monate, str(tmp_path), letzte=letzte) == ['veranstaltungen_2026_07.html']
+    assert 'Lesung' in (tmp_path / 'veranstaltungen_2026_07.html').read_text(encoding='utf-8')
+
+
+def test_verschobenes_fenster_aktualisiert_navigation(tmp_path, monkeypatch):
+    # Jeder Durchgang ruft neu ab: frische Objekte mit denselben August-Events
+    abrufe = [Abruf(events={'muensterland': {(2026, 8): [_v('Konzert', 3, monat=8)]}},
+                    dauer={'muensterland': 0.1}, anzahl={'muensterland': 1}) for _ in range(2)]
+    monkeypatch.setattr(app, 'hole_alle_quellen', lambda m, modi: abrufe.pop(0))
+    monkeypatch.setattr(app, 'RENDER_PROZESSE_MAX', 1)
+    letzte = {}
+
+    app.erzeuge([(2026, 7), (2026, 8)], str(tmp_path), letzte=letzte)
+    assert 'href="#" class="nav-btn disabled">Sep' in (tmp_path / 'veranstaltungen_2026_08.html').read_text(
+        encoding='utf-8')
+    # Gleiche August-Events, aber September ist jetzt im Fenster: August bekommt den Link
+    assert 'veranstaltungen_2026_08.html' in app.erzeuge([(2026, 8), (2026, 9)], str(tmp_path), letzte=letzte)
+    seite = (tmp_path / 'veranstaltungen_2026_08.html').read_text(encoding='utf-8')
+    assert 'href="veranstaltungen_2026_09.html" class="nav-btn">Sep' in seite
+
+
+def test_daemon_uebersteht_fehler_im_durchgang(monkeypatch, capsys):
+    stopp = threading.Event()
+    durchgaenge = []
+
+    def erzeuge(*args):
+        durchgaenge.append(args)
+        if len(durchgaenge) == 1:
+            raise AttributeError("'NoneType' object has no attribute 'text'")  # z.B. aus einem Parser
+        stopp.set()
+        return []
+
+    monkeypatch.setattr(app, '_stopp_bei_signal', lambda: stopp)
+    monkeypatch.setattr(app, 'erzeuge', erzeuge)
+    monkeypatch.setattr(app, 'RENDER_PROZESSE_MAX', 1)
+    app.daemon((2026, 7), 1, '.', False, 0, 0)
+
+    assert len(durchgaenge) == 2
+    ausgabe = capsys.readouterr().out
+    assert 'Durchgang abgebrochen' in ausgabe and 'AttributeError' in ausgabe
+    assert 'Daemon beendet.' in ausgabe
+
+
+def test_sitzung_pro_host_nur_wenn_aktiv():
+    assert scraper._sitzung_fuer('https://www.lwl-museum-kunst-kultur.de/a') is None
+    scraper.aktiviere_sitzungen()
+    try:
+        erste = scraper._sitzung_fuer('https://www.lwl-museum-kunst-kultur.de/a')
+        assert scraper._sitzung_fuer('https://www.lwl-museum-kunst-kultur.de/b?seite=2') is erste
+        assert scraper._sitzung_fuer('https://www.digitalhub.ms/api/events') is not erste
+    finally:
+        scraper.schliesse_sitzungen()
+    assert scraper._sitzung_fuer('https://www.lwl-museum-kunst-kultur.de/a') is None
@@ -0,0 +1,74 @@
+"""Tests für die Drosselung pro Host (Token-Bucket in _request_mit_retry)."""
+import sys
+import os
+import time
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+def _response(status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = b'ok'
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture(autouse=True)
+def _eigene_drosseln(monkeypatch):
+    monkeypatch.setattr(scraper, '_DROSSELN', {})
+
+
+def test_token_bucket_drosselt_nach_burst():
+    bucket = scraper.TokenBucket(rate=50, burst=2)
+    start = time.monotonic()
+    for _ in range(7):
+        bucket.nimm()
+    # 2 sofort aus dem Burst, 5 weitere mit 50/s → mindestens 0.1 s
+    assert time.monotonic() - start >= 0.09
+
+
+def test_bremse_halbiert_rate_und_erfolg_erholt():
+    bucket = scraper.TokenBucket(rate=8, burst=1)
+    bucket.bremse(0)
+    assert bucket.rate == 4
+    for _ in range(20):
+        bucket.erfolg()
+    assert bucket.rate == 8
+
+
+def test_ein_bucket_pro_host(monkeypatch):
+    monkeypatch.setattr(scraper, 'HOST_LIMITS', {'a.example': (7.0, 3)})
+    a1 = scraper._drossel_fuer('https://a.example/x')
+    a2 = scraper._drossel_fuer('https://a.example/y?p=2')
+    b = scraper._drossel_fuer('https://b.example/')
+    assert a1 is a2
+    assert a1 is not b
+    assert (a1.max_rate, a1.burst) == (7.0, 3)
+    assert (b.max_rate, b.burst) == scraper.HOST_LIMIT_STANDARD
+
+
+def test_429_wartet_retry_after_statt_pause(monkeypatch):
+    antworten = [_response(429, {'Retry-After': '0.05'}), _response(200)]
+    monkeypatch.setattr(scraper.requests, 'request', lambda *a, **kw: antworten.pop(0))
+    pausen = []
+    echtes_sleep = time.sleep
+    monkeypatch.setattr(scraper.time, 'sleep', lambda s: (pausen.append(s), echtes_sleep(s)))
+
+    response = scraper._request_gezaehlt('GET', 'https://c.example/')
+
+    assert response.status_code == 200
+    assert 2 not in pausen
+    max_rate = scraper.HOST_LIMIT_STANDARD[0]
+    # halbiert durch die Bremse, dann ein Schritt Erholung durch den gelungenen Retry
+    assert scraper._drossel_fuer('https://c.example/').rate == pytest.approx(max_rate / 2 + max_rate / 10)
+
+
+def test_retry_after_wird_gekappt():
+    fehler = requests.HTTPError(response=_response(429, {'Retry-After': '86400'}))
+    assert scraper._retry_after(fehler) == scraper.RETRY_AFTER_MAX
@@ -0,0 +1,126 @@
+"""Tests für die iCal-Feeds (ical.py) und ihre Erzeugung im Render-Durchgang."""
+import sys
+from functools import partial
+import os
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+from ical import falte, feeds_fuer, schreibe_feeds, schreibe_teile, vevent, zeiten
+from conftest import veranstaltung
+
+_v = partial(veranstaltung, zeit=(19, 30), uhrzeit='19:30 Uhr', ort='Halle', link='https://example.org/e')
+
+
+def _titel():
+    return {'alle': 'Alle', 'region-muenster': 'Münster', 'region-kreis-steinfurt': 'Steinfurt',
+            'quelle-muensterland': 'ML', 'quelle-theater': 'Theater'}
+
+
+def _stempel(v):
+    return '20260901T120000Z'
+
+
+def _uids(pfad):
+    return [z[4:] for z in pfad.read_bytes().decode('utf-8').split('\r\n') if z.startswith('UID:')]
+
+
+def test_zeilen_werden_nach_75_oktetten_gefaltet_ohne_zeichen_zu_teilen():
+    roh = falte('DESCRIPTION:' + 'ü' * 80)
+    zeilen = roh.split(b'\r\n')[:-1]
+    assert all(len(z) <= 75 for z in zeilen)
+    assert all(z.startswith(b' ') for z in zeilen[1:])
+    assert b''.join(z[1:] if i else z for i, z in enumerate(zeilen)).decode('utf-8') == 'DESCRIPTION:' + 'ü' * 80
+
+
+def test_zeiten_und_escaping():
+    assert zeiten(_v('A', 3)) == (';TZID=Europe/Berlin:20261003T193000', None)
+    assert zeiten(_v('A', 3, zeit=(0, 0), uhrzeit='18.00 - 21.30 Uhr')) == (
+        ';TZID=Europe/Berlin:20261003T180000', ';TZID=Europe/Berlin:20261003T213000')
+    assert zeiten(_v('A', 3, zeit=(0, 0), uhrzeit='ganztägig')) == (';VALUE=DATE:20261003', ';VALUE=DATE:20261004')
+    assert zeiten(_v('A', 30, zeit=(0, 0), ende=datetime(2026, 11, 2))) == (';VALUE=DATE:20261030',
+                                                                           ';VALUE=DATE:20261103')
+    zeilen = vevent(_v('Rock, Pop; Jazz', 3), 'abc', '20260901T120000Z')
+    assert 'UID:abc@ms-veranstaltungen.reporter.ruhr' in zeilen
+    assert zeilen[2:4] == ['DTSTAMP:20260901T120000Z', 'LAST-MODIFIED:20260901T120000Z']
+    assert 'SUMMARY:Rock\\, Pop\\; Jazz' in zeilen
+    assert 'LOCATION:Halle\\, Münster' in zeilen
+
+
+def test_feeds_ganzes_gebiet_region_und_quelle():
+    assert feeds_fuer(_v('A', 3, stadt='Greven', quelle='theater')) == ('alle', 'region-kreis-steinfurt',
+                                                                       'quelle-theater')
+
+
+def test_feeds_aus_teilstuecken_nur_bei_geaendertem_inhalt(tmp_path):
+    verzeichnis = str(tmp_path)
+    laufend = _v('Ausstellung', 30, zeit=(0, 0), uhrzeit='ganztägig', ende=datetime(2026, 11, 2))
+    schreibe_teile(verzeichnis, 2026, 10, [_v('Konzert', 3), laufend], lambda v: v.name, _stempel)
+    schreibe_teile(verzeichnis, 2026, 11, [laufend, _v('Lesung', 5, stadt='Greven', quelle='theater', monat=11)],
+                   lambda v: v.name, _stempel)
+
+    geschrieben = schreibe_feeds(verzeichnis, [(2026, 10), (2026, 11)], _titel())
+    assert sorted(geschrieben) == sorted(f'kalender/{f}.ics' for f in _titel())
+    alle = tmp_path / 'alle.ics'
+    assert _uids(alle) == [f'{n}@ms-veranstaltungen.reporter.ruhr' for n in ('Konzert', 'Ausstellung', 'Lesung')]
+    assert _uids(tmp_path / 'region-kreis-steinfurt.ics') == ['Lesung@ms-veranstaltungen.reporter.ruhr']
+    assert _uids(tmp_path / 'quelle-muensterland.ics') == [f'{n}@ms-veranstaltungen.reporter.ruhr'
+                                                           for n in ('Konzert', 'Ausstellung')]
+    assert alle.read_bytes().startswith(b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\n')
+    assert alle.read_bytes().endswith(b'END:VCALENDAR\r\n')
+
+    # Gleicher Stand: keine Datei wird ersetzt, auch nicht die Teilstücke
+    mtime = os.stat(alle).st_mtime_ns
+    assert schreibe_teile(verzeichnis, 2026, 10, [_v('Konzert', 3), laufend], lambda v: v.name, _stempel) == 0
+    assert schreibe_feeds(verzeichnis, [(2026, 10), (2026, 11)], _titel()) == []
+    assert os.stat(alle).st_mtime_ns == mtime
+
+    # Lesung fällt weg: ihre Teilstücke verschwinden, nur die betroffenen Feeds ändern sich
+    schreibe_teile(verzeichnis, 2026, 11, [laufend], lambda v: v.name, _stempel)
+    assert sorted(schreibe_feeds(verzeichnis, [(2026, 10), (2026, 11)], _titel())) == [
+        'kalender/alle.ics', 'kalender/quelle-theater.ics', 'kalender/region-kreis-steinfurt.ics']
+    assert _uids(tmp_path / 'region-kreis-steinfurt.ics') == []
+    assert not [d for d in os.listdir(tmp_path) if d.endswith('.tmp')]
+
+
+def test_rendere_monat_schreibt_teilstuecke_und_abo_link(tmp_path):
+    kalender = str(tmp_path / 'kalender')
+    zeilen, _, abdruecke = app.rendere_monat([_v('Konzert', 3), _v('Lesung', 5, stadt='Greven')], 2026, 10,
+                                             [(2026, 10)], str(tmp_path / 'veranstaltungen_2026_10.html'),
+                                             kalender_verzeichnis=kalender)
+    assert '  -> 4 Kalender-Teilstück(e) aktualisiert' in zeilen
+    schreibe_feeds(kalender, [(2026, 10)], app.kalender_titel())
+    assert sorted(u.split('@')[0] for u in _uids(tmp_path / 'kalender' / 'alle.ics')) == sorted(abdruecke)
+    assert os.path.exists(tmp_path / 'kalender' / 'region-weitere-orte.ics')  # leer, aber abonnierbar
+    seite = (tmp_path / 'veranstaltungen_2026_10_muenster.html').read_text(encoding='utf-8')
+    assert 'href="kalender/region-muenster.ics"' in seite
+
+
+def _stempel_in(pfad):
+    return {z for z in pfad.read_bytes().decode('utf-8').split('\r\n') if z.startswith('DTSTAMP:')}
+
+
+def test_dtstamp_bleibt_bis_sich_das_event_aendert(tmp_path):
+    kalender = str(tmp_path / 'kalender')
+    teil = tmp_path / 'kalender' / '.teile' / '2026_10' / 'alle.ics'
+
+    def lauf(events, frueher, stunde):
+        _, _, abdruecke = app.rendere_monat(events, 2026, 10, [(2026, 10)],
+                                            str(tmp_path / 'veranstaltungen_2026_10.html'),
+                                            lauf=datetime(2026, 9, 1, stunde, tzinfo=timezone.utc),
+                                            kalender_verzeichnis=kalender, frueher=frueher)
+        return abdruecke
+
+    erster = lauf([_v('Konzert', 3)], None, 8)
+    assert _stempel_in(teil) == {'DTSTAMP:20260901T080000Z'}
+
+    # Späterer Lauf, gleicher Inhalt: Stempel und Teilstück bleiben
+    mtime = os.stat(teil).st_mtime_ns
+    zweiter = lauf([_v('Konzert', 3)], erster, 9)
+    assert zweiter == erster
+    assert os.stat(teil).st_mtime_ns == mtime
+
+    # Neue Beschreibung: neuer event_hash, neuer Stempel
+    lauf([_v('Konzert', 3, beschreibung='Mit Vorband')], zweiter, 10)
+    assert _stempel_in(teil) == {'DTSTAMP:20260901T100000Z'}
@@ -0,0 +1,46 @@
+"""Tests für den Intervall-Index (mehrtägige Veranstaltungen)."""
+import sys
+import os
+import random
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intervall_index import IntervallIndex
+
+
+def _tag(n):
+    return date(2026, 10, 1) + timedelta(days=n)
+
+
+def test_am_wie_durchsuchen_aller_intervalle():
+    zufall = random.Random(7)
+    eintraege = []
+    for nr in range(300):
+        von = _tag(zufall.randrange(-40, 60))
+        eintraege.append((von, von + timedelta(days=zufall.choice([0, 1, 3, 10, 90])), nr))
+    index = IntervallIndex(eintraege)
+    assert len(index) == 300
+    for n in range(-50, 160):
+        erwartet = [nr for von, bis, nr in sorted(eintraege, key=lambda e: (e[0], e[2])) if von <= _tag(n) <= bis]
+        assert index.am(_tag(n)) == erwartet
+
+
+def test_grenzen_gehoeren_dazu():
+    index = IntervallIndex([(_tag(0), _tag(4), 'Ausstellung'), (_tag(4), _tag(4), 'Konzert')])
+    assert index.am(_tag(0)) == ['Ausstellung']
+    assert index.am(_tag(4)) == ['Ausstellung', 'Konzert']
+    assert index.am(_tag(5)) == []
+    assert IntervallIndex([]).am(_tag(0)) == []
+
+
+def test_zaehle_pro_tag_schneidet_auf_den_zeitraum_zu():
+    index = IntervallIndex([(_tag(-10), _tag(2), 'a'), (_tag(1), _tag(40), 'b'), (_tag(50), _tag(60), 'c')])
+    assert index.zaehle_pro_tag(_tag(0), _tag(4)) == {_tag(0): 1, _tag(1): 2, _tag(2): 2, _tag(3): 1, _tag(4): 1}
+
+
+def test_ende_vor_beginn():
+    with pytest.raises(ValueError):
+        IntervallIndex([(_tag(3), _tag(1), 'kaputt')])
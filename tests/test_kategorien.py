@@ -0,0 +1,71 @@
+"""Tests für die Rubrik-Einordnung (kategorien.py)."""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kategorien
+from kategorien import SONSTIGES, RUBRIKEN, ordne_ein, reihenfolge, rubrik
+from quellen import REGISTER
+from conftest import veranstaltung
+
+
+def test_stichwoerter_auch_mitten_im_wort():
+    assert rubrik('', 'Orgelkonzert im Dom', '') == 'Konzert'
+    assert rubrik('', 'Kinderführung durch die Altstadt', '') == 'Führung & Tour'
+    assert rubrik('', 'Startup-Pitch Night', '') == 'Netzwerk & Business'
+
+
+def test_kategorie_wiegt_mehr_als_beschreibung():
+    # Beschreibung nennt zweimal Musik (2), Kategorie einmal Workshop (3)
+    assert rubrik('Workshop', 'Abend im Hafen', 'Musik und noch mehr Musik') == 'Workshop & Kurs'
+    # Gleichstand: die weiter oben stehende Rubrik gewinnt
+    assert rubrik('', 'Lesung mit Musik', '') == 'Konzert'
+
+
+def test_gross_klein_und_scharfes_s():
+    assert rubrik('', 'STRASSENFEST am Hafen', '') == 'Markt & Fest'
+    # casefold verlängert ß -> ss im Namen; die Gewichtung der Beschreibung verschiebt sich nicht
+    assert rubrik('', 'Großes Straßenfest', 'Vortrag') == 'Markt & Fest'
+
+
+def test_keine_kurzen_mehrdeutigen_treffer():
+    assert rubrik('', 'Kooperationsbörse', '') == SONSTIGES
+
+
+def test_manche_stichwoerter_nur_am_wortanfang():
+    assert rubrik('', 'Mitgliederversammlung', '') == SONSTIGES
+    assert rubrik('', 'Bürgerversammlung im Rathaus', '') == SONSTIGES
+    assert rubrik('', 'Transportmesse', '') == SONSTIGES
+    assert rubrik('', 'Diskurs über Stadtplanung', '') == SONSTIGES
+    assert rubrik('', 'Filmpremiere im Schloss', '') == 'Film'
+    # am Wortanfang zählen sie weiter
+    assert rubrik('', 'Sammlung Sahle', '') == 'Ausstellung & Museum'
+    assert rubrik('', 'Sport im Park', '') == 'Sport'
+    assert rubrik('', 'Kurs: Aquarellmalerei', '') == 'Workshop & Kurs'
+    assert rubrik('', 'Premiere: Faust', '') == 'Bühne'
+
+
+def test_standard_der_quelle_ohne_treffer():
+    assert rubrik('', 'Faust', '', 'theater_muenster') == 'Bühne'
+    assert rubrik('', 'Faust', '', 'muensterland') == SONSTIGES
+    # Stichwort schlägt den Standard der Quelle
+    assert rubrik('', 'Museumsfest für Kinder', 'Familie', 'lwl_museum') == 'Kinder & Familie'
+
+
+def test_standardrubriken_im_register_gibt_es():
+    assert {q.rubrik for q in REGISTER if q.rubrik} <= {name for name, _ in RUBRIKEN}
+
+
+def test_ein_automat_fuer_alle_stichwoerter():
+    muster = kategorien._AUTOMAT.pattern
+    # gemeinsame Anfänge stehen nur einmal drin
+    assert 'on(?:ferenz|zert)' in muster
+    assert all(kategorien._AUTOMAT.fullmatch(wort.casefold()) for _, woerter in RUBRIKEN for wort in woerter)
+
+
+def test_ordne_ein_und_reihenfolge():
+    events = [veranstaltung(n) for n in ('Yoga im Park', 'Flohmarkt')]
+    ordne_ein(events)
+    assert [v.rubrik for v in events] == ['Sport', 'Markt & Fest']
+    assert reihenfolge({SONSTIGES, 'Sport', 'Konzert'}) == ['Konzert', 'Sport', SONSTIGES]
@@ -0,0 +1,86 @@
+"""Tests für den LWL-Museum-Scraper (Pagination, paralleler Seitenabruf)."""
+import sys
+import os
+import re
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+from bs4 import BeautifulSoup
+
+
+def _lwl_seite(seite, seiten, tag):
+    punkte = ''.join(
+        f'<li class="active"><span>{p}</span></li>' if p == seite else f'<li><a href="?p={p}">{p}</a></li>'
+        for p in range(1, seiten + 1)
+    )
+    return f'''
+    <div class="event-element">
+      <p class="event-date">Freitag, {tag}.7.2026</p>
+      <p class="event-time">10.30 - 12.30 Uhr</p>
+      <h4 class="event-title"><span id="event-title-{seite}">Führung Seite {seite}</span></h4>
+    </div>
+    <div class="event-element">
+      <p class="event-date">Samstag, 1.8.2026</p>
+      <h4 class="event-title"><span id="event-title-9{seite}">Nächster Monat</span></h4>
+    </div>
+    <ul class="pagination">{punkte}<li><a href="?p={min(seite + 1, seiten)}">›</a></li></ul>
+    '''
+
+
+def _fake_abruf(seiten, abgerufen):
+    def request(method, url, **kwargs):
+        seite = int(re.search(r'[?&]p=(\d+)', url).group(1))
+        abgerufen.append(seite)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = _lwl_seite(seite, seiten, tag=seite).encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+    return request
+
+
+def test_seitenzahl_aus_pagination():
+    soup = BeautifulSoup(_lwl_seite(1, 7, 3), 'html.parser')
+    assert scraper._lwl_seitenzahl(soup) == 7
+
+
+def test_seitenzahl_ohne_pagination():
+    assert scraper._lwl_seitenzahl(BeautifulSoup('<div></div>', 'html.parser')) == 1
+
+
+def test_alle_seiten_in_reihenfolge(monkeypatch):
+    abgerufen = []
+    monkeypatch.setattr(scraper, '_request_gezaehlt', _fake_abruf(5, abgerufen))
+    events = scraper.hole_lwl_museum(2026, 7)
+    assert sorted(abgerufen) == [1, 2, 3, 4, 5]
+    assert [v.name for v in events] == [f'Führung Seite {s}' for s in range(1, 6)]
+    assert events[0].uhrzeit == '10:30 - 12:30 Uhr'
+
+
+def test_max_seiten_bleibt_obergrenze(monkeypatch):
+    abgerufen = []
+    monkeypatch.setattr(scraper, '_request_gezaehlt', _fake_abruf(25, abgerufen))
+    scraper.hole_lwl_museum(2026, 7)
+    assert sorted(abgerufen) == list(range(1, scraper.LWL_MAX_SEITEN + 1))
+
+
+def test_zeitraum_ein_durchlauf_verteilt_auf_monate(monkeypatch):
+    abgerufen = []
+    urls = []
+    fake = _fake_abruf(3, abgerufen)
+
+    def request(method, url, **kwargs):
+        urls.append(url)
+        return fake(method, url, **kwargs)
+
+    monkeypatch.setattr(scraper, '_request_gezaehlt', request)
+    ergebnis = scraper.hole_lwl_museum_zeitraum([(2026, 7), (2026, 8)])
+
+    assert sorted(abgerufen) == [1, 2, 3]
+    assert all('vom=01.07.2026&bis=31.08.2026' in url for url in urls)
+    assert len(ergebnis[(2026, 7)]) == 3
+    assert len(ergebnis[(2026, 8)]) == 3
+    assert {v.datum.month for v in ergebnis[(2026, 8)]} == {8}
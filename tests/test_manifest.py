@@ -0,0 +1,60 @@
+"""Tests für manifest.json (Inhaltsverzeichnis der Monatsseiten)."""
+import sys
+import os
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manifest import lade_manifest, speichere_manifest, trage_ein, bereinige, anzahl, veraltet
+
+
+def _eintrag(jahr, monat, n):
+    return {'jahr': jahr, 'monat': monat, 'veranstaltungen': n, 'orte': 1, 'quellen': {},
+            'sha256': '', 'generiert': ''}
+
+
+def test_rundreise_und_anzahl(tmp_path):
+    pfad = str(tmp_path / 'manifest.json')
+    manifest = lade_manifest(pfad)
+    trage_ein(manifest, 'veranstaltungen_2026_07.html', _eintrag(2026, 7, 10))
+    trage_ein(manifest, 'veranstaltungen_2026_08.html', _eintrag(2026, 8, 5))
+    speichere_manifest(pfad, manifest)
+    assert anzahl(lade_manifest(pfad)) == 15
+
+
+def test_anzahl_zaehlt_mehrtaegige_nur_im_startmonat():
+    manifest = lade_manifest('/gibt/es/nicht')
+    # Eine Ausstellung Juli–August steht auf beiden Seiten, beginnt aber nur im Juli
+    trage_ein(manifest, 'veranstaltungen_2026_07.html', {**_eintrag(2026, 7, 10), 'beginnen': 10})
+    trage_ein(manifest, 'veranstaltungen_2026_08.html', {**_eintrag(2026, 8, 5), 'beginnen': 4})
+    assert anzahl(manifest) == 14
+
+
+def test_kaputtes_manifest_beginnt_leer(tmp_path):
+    pfad = tmp_path / 'manifest.json'
+    pfad.write_text('{kaputt', encoding='utf-8')
+    assert lade_manifest(str(pfad))['monate'] == {}
+
+
+def test_veraltet_behaelt_vormonat():
+    manifest = lade_manifest('/gibt/es/nicht')
+    for monat in (11, 12):
+        trage_ein(manifest, f'veranstaltungen_2025_{monat}.html', _eintrag(2025, monat, 1))
+    trage_ein(manifest, 'veranstaltungen_2026_01.html', _eintrag(2026, 1, 1))
+    assert veraltet(manifest, datetime(2026, 1, 15)) == ['veranstaltungen_2025_11.html']
+
+    manifest['monate']['veranstaltungen_2025_11.html']['daten'] = 'daten/veranstaltungen_2025_11.json'
+    assert veraltet(manifest, datetime(2026, 1, 15)) == ['veranstaltungen_2025_11.html',
+                                                         'daten/veranstaltungen_2025_11.json']
+
+    manifest['monate']['veranstaltungen_2025_11.html']['regionen'] = ['veranstaltungen_2025_11_muenster.html']
+    assert veraltet(manifest, datetime(2026, 1, 15))[-1] == 'veranstaltungen_2025_11_muenster.html'
+
+
+def test_bereinige_entfernt_fehlende_dateien(tmp_path):
+    (tmp_path / 'veranstaltungen_2026_08.html').write_text('x', encoding='utf-8')
+    manifest = lade_manifest(str(tmp_path / 'manifest.json'))
+    trage_ein(manifest, 'veranstaltungen_2026_07.html', _eintrag(2026, 7, 1))
+    trage_ein(manifest, 'veranstaltungen_2026_08.html', _eintrag(2026, 8, 1))
+    assert bereinige(manifest, str(tmp_path)) == ['veranstaltungen_2026_07.html']
+    assert list(manifest['monate']) == ['veranstaltungen_2026_08.html']
@@ -0,0 +1,36 @@
+"""Tests für den Münsterland-Abruf (DPMS-API): mehrtägige Events."""
+import sys
+import os
+import json
+from datetime import datetime
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+def _event(name, start, ende=''):
+    return {'name': name, 'start_datetime': start, 'end_datetime': ende,
+            'poi': {'name': 'Museum', 'address': {'city': 'Münster'}}, 'description_text': 'Text'}
+
+
+def test_ende_nur_bei_mehreren_tagen():
+    ausstellung = scraper._parse_event(_event('Ausstellung', '2026-09-01T10:00:00+02:00', '2026-11-30T18:00:00+01:00'))
+    party = scraper._parse_event(_event('Party', '2026-10-03T22:00:00+02:00', '2026-10-04T03:00:00+02:00'))
+    assert ausstellung.ende == datetime(2026, 11, 30, 18, 0)
+    assert ausstellung.ist_mehrtaegig() and ausstellung.beschreibung == 'Text'
+    assert party.ende is None and not party.ist_mehrtaegig()
+
+
+def test_monat_enthaelt_hineinlaufende_events(monkeypatch):
+    antwort = requests.Response()
+    antwort.status_code = 200
+    antwort._content = json.dumps({'data': [
+        _event('Ausstellung', '2026-09-01T10:00:00+02:00', '2026-11-30T18:00:00+01:00'),
+        _event('Vorbei', '2026-09-01T10:00:00+02:00', '2026-09-20T18:00:00+02:00'),
+        _event('Konzert', '2026-10-03T20:00:00+02:00'),
+    ]}).encode('utf-8')
+    monkeypatch.setattr(scraper, '_request_gezaehlt', lambda *args, **kwargs: antwort)
+    assert [v.name for v in scraper.hole_veranstaltungen(2026, 10)] == ['Ausstellung', 'Konzert']
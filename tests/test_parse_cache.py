@@ -0,0 +1,119 @@
+"""Tests für das Parse-Memo (Cache der geparsten Events pro Antwort-Body)."""
+import sys
+import os
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+from scraper import Veranstaltung
+
+
+@pytest.fixture
+def parse_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, '_PARSE_CACHE_VERZEICHNIS', None)
+    scraper.aktiviere_parse_cache(str(tmp_path))
+    return tmp_path
+
+
+def _zaehlender_parser(aufrufe):
+    def parser(body, jahr, monat):
+        aufrufe.append(body)
+        return [Veranstaltung(name=body, datum=datetime(jahr, monat, 3, 19, 30), uhrzeit='19:30 Uhr',
+                              ort='Bühne', stadt='Münster', link='', quelle='theater_muenster')]
+    return parser
+
+
+def test_gleicher_body_wird_nicht_neu_geparst(parse_cache):
+    aufrufe = []
+    parser = _zaehlender_parser(aufrufe)
+    erstes = scraper._geparst(parser, '<html>A</html>', 2026, 7)
+    zweites = scraper._geparst(parser, '<html>A</html>', 2026, 7)
+    assert aufrufe == ['<html>A</html>']
+    assert zweites == erstes
+    assert zweites[0] is not erstes[0]
+
+
+def test_anderer_body_oder_andere_argumente_parsen_neu(parse_cache):
+    aufrufe = []
+    parser = _zaehlender_parser(aufrufe)
+    scraper._geparst(parser, '<html>A</html>', 2026, 7)
+    scraper._geparst(parser, '<html>B</html>', 2026, 7)
+    scraper._geparst(parser, '<html>A</html>', 2026, 8)
+    assert len(aufrufe) == 3
+
+
+def test_ohne_aktivierung_kein_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(scraper, '_PARSE_CACHE_VERZEICHNIS', None)
+    aufrufe = []
+    parser = _zaehlender_parser(aufrufe)
+    scraper._geparst(parser, 'x', 2026, 7)
+    scraper._geparst(parser, 'x', 2026, 7)
+    assert len(aufrufe) == 2
+
+
+def test_kaputter_eintrag_wird_neu_geparst(parse_cache):
+    aufrufe = []
+    parser = _zaehlender_parser(aufrufe)
+    scraper._geparst(parser, 'x', 2026, 7)
+    for datei in parse_cache.iterdir():
+        datei.write_text('{kaputt', encoding='utf-8')
+    assert scraper._geparst(parser, 'x', 2026, 7)[0].name == 'x'
+    assert len(aufrufe) == 2
+
+
+def test_alte_eintraege_werden_beim_aktivieren_geloescht(tmp_path, monkeypatch):
+    alt = tmp_path / 'alt.json'
+    alt.write_text('[]', encoding='utf-8')
+    vor_langer_zeit = datetime(2020, 1, 1).timestamp()
+    os.utime(alt, (vor_langer_zeit, vor_langer_zeit))
+    monkeypatch.setattr(scraper, '_PARSE_CACHE_VERZEICHNIS', None)
+    scraper.aktiviere_parse_cache(str(tmp_path))
+    assert not alt.exists()
+
+
+def test_zeile_rundreise():
+    v = Veranstaltung(name='Konzert', datum=datetime(2026, 7, 4, 20, 0), uhrzeit='20:00 Uhr', ort='Halle',
+                      stadt='Münster', link='https://example.org', beschreibung='…', quelle='halle_muensterland',
+                      kategorie='Konzert/Show')
+    assert scraper.aus_zeile(scraper.als_zeile(v)) == v
+
+
+def test_theater_zweiter_abruf_aus_cache(parse_cache, monkeypatch):
+    html = '''<div class="tm-performance">
+      <div class="tm-performance__dayNumber">12</div>
+      <div class="tm-performance__performanceTime">19.30 Uhr</div>
+      <div class="tm-performance__productionName"><a href="/stueck">Faust</a></div>
+    </div>'''
+
+    def request(method, url, **kwargs):
+        response = scraper.requests.Response()
+        response.status_code = 200
+        response._content = html.encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+    monkeypatch.setattr(scraper, '_request_gezaehlt', request)
+    erstes = scraper.hole_theater_muenster(2026, 7)
+    monkeypatch.setattr(scraper, 'BeautifulSoup', None)  # ein zweites Parsen würde scheitern
+    zweites = scraper.hole_theater_muenster(2026, 7)
+    assert [v.name for v in zweites] == ['Faust']
+    assert zweites == erstes
+
+
+def test_parse_in_worker_prozess_liefert_gleiche_events(monkeypatch):
+    monkeypatch.setattr(scraper, '_PARSE_CACHE_VERZEICHNIS', None)
+    html = '''<div class="tm-performance">
+      <div class="tm-performance__dayNumber">12</div>
+      <div class="tm-performance__productionName"><a href="/stueck">Faust</a></div>
+    </div>'''
+    im_thread = scraper._geparst(scraper._parse_theater_muenster, html, 2026, 7)
+    scraper.aktiviere_parse_prozesse(1)
+    try:
+        im_prozess = scraper._geparst(scraper._parse_theater_muenster, html, 2026, 7)
+    finally:
+        scraper.beende_parse_prozesse()
+    assert im_prozess == im_thread
+    assert scraper._PARSE_POOL is None
@@ -0,0 +1,86 @@
+"""Tests für das Quellen-Register und den Abruf-Planer."""
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quellen
+from quellen import Quelle, MONAT, ZEITRAUM, hole_alle_quellen
+from quellen_status import VOLL, PROBE, AUS
+from conftest import veranstaltung
+
+MONATE = [(2026, 7), (2026, 8), (2026, 9)]
+
+
+def _register(aufrufe):
+    sperre = threading.Lock()
+
+    def monats_quelle(schluessel):
+        def hole(jahr, monat):
+            with sperre:
+                aufrufe.append((schluessel, (jahr, monat)))
+            return [veranstaltung(f'{schluessel} {monat}', jahr=jahr, monat=monat, quelle=schluessel)]
+        return hole
+
+    def zeitraum_quelle(monate):
+        with sperre:
+            aufrufe.append(('zeitraum', tuple(monate)))
+        return {(j, m): [veranstaltung(f'zeitraum {m}', jahr=j, monat=m, quelle='zeitraum')] for j, m in monate}
+
+    def probe(jahr, monat):
+        with sperre:
+            aufrufe.append(('probe', (jahr, monat)))
+        return []
+
+    return [
+        Quelle('a', 'A', 'badge-a', '', 'A', monats_quelle('a'), umfang=MONAT),
+        Quelle('zeitraum', 'Z', 'badge-z', '', 'Z', zeitraum_quelle, umfang=ZEITRAUM, paginiert=True, kosten=3),
+        Quelle('b', 'B', 'badge-b', '', 'B', monats_quelle('b'), umfang=MONAT, probe=probe),
+    ]
+
+
+def test_zeitraum_quelle_einmal_fuer_alle_monate(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(quellen, 'REGISTER', _register(aufrufe))
+    abruf = hole_alle_quellen(MONATE, {})
+
+    assert [a for a in aufrufe if a[0] == 'zeitraum'] == [('zeitraum', tuple(MONATE))]
+    assert sorted(a[1] for a in aufrufe if a[0] == 'a') == MONATE
+    assert abruf.anzahl == {'a': 3, 'zeitraum': 3, 'b': 3}
+    assert [e.name for e in abruf.events['zeitraum'][(2026, 8)]] == ['zeitraum 8']
+
+
+def test_fuer_monat_in_registerreihenfolge(monkeypatch):
+    monkeypatch.setattr(quellen, 'REGISTER', _register([]))
+    abruf = hole_alle_quellen(MONATE, {})
+    assert [q.schluessel for q, _ in abruf.fuer_monat(2026, 9)] == ['a', 'zeitraum', 'b']
+    assert [e.name for _, events in abruf.fuer_monat(2026, 9) for e in events] == ['a 9', 'zeitraum 9', 'b 9']
+
+
+def test_probe_nur_erster_monat_mit_probefunktion(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(quellen, 'REGISTER', _register(aufrufe))
+    abruf = hole_alle_quellen(MONATE, {'a': AUS, 'zeitraum': PROBE, 'b': PROBE})
+
+    assert not any(a[0] == 'a' for a in aufrufe)
+    assert ('zeitraum', ((2026, 7),)) in aufrufe
+    assert [a for a in aufrufe if a[0] in ('b', 'probe')] == [('probe', (2026, 7))]
+    assert 'a' not in abruf.events
+    assert abruf.anzahl['b'] == 0
+
+
+def test_paginierte_quellen_starten_zuerst(monkeypatch):
+    aufrufe = []
+    monkeypatch.setattr(quellen, 'REGISTER', _register(aufrufe))
+    monkeypatch.setattr(quellen, 'QUELLEN_PARALLEL', 1)
+    hole_alle_quellen(MONATE, {'b': VOLL})
+    assert aufrufe[0][0] == 'zeitraum'
+
+
+def test_register_schluessel_eindeutig_und_vollstaendig():
+    schluessel = [q.schluessel for q in quellen.REGISTER]
+    assert len(schluessel) == len(set(schluessel))
+    for q in quellen.REGISTER:
+        assert q.umfang in (MONAT, ZEITRAUM)
+        assert q.host and q.badge.startswith('badge-')
@@ -0,0 +1,56 @@
+"""Tests für die Quellen-Gesundheit (Pausieren und Wiederprüfen)."""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quellen_status import (
+    QuellenStatus, VOLL, PROBE, AUS, FEHLER_BIS_PAUSE, PROBE_INTERVALL,
+)
+
+
+def _status(tmp_path):
+    return QuellenStatus(str(tmp_path / 'status.json'))
+
+
+def test_neue_quelle_laeuft_voll(tmp_path):
+    assert _status(tmp_path).plane('regioactive') == VOLL
+
+
+def test_pause_nach_fehlschlaegen_und_probe(tmp_path):
+    status = _status(tmp_path)
+    for _ in range(FEHLER_BIS_PAUSE):
+        assert status.plane('regioactive') == VOLL
+        status.melde('regioactive', False, 0.5, '403 Forbidden')
+
+    modi = [status.plane('regioactive') for _ in range(PROBE_INTERVALL)]
+    assert modi == [AUS] * (PROBE_INTERVALL - 1) + [PROBE]
+
+    status.melde('regioactive', True, 0.3)
+    assert status.plane('regioactive') == VOLL
+
+
+def test_fehlgeschlagene_probe_bleibt_pausiert(tmp_path):
+    status = _status(tmp_path)
+    for _ in range(FEHLER_BIS_PAUSE):
+        status.plane('lwl_museum')
+        status.melde('lwl_museum', False, 1.0, 'Timeout')
+    for _ in range(PROBE_INTERVALL):
+        modus = status.plane('lwl_museum')
+    assert modus == PROBE
+    status.melde('lwl_museum', False, 1.0, 'Timeout')
+    assert status.plane('lwl_museum') == AUS
+
+
+def test_persistenz_und_kennzahlen(tmp_path):
+    status = _status(tmp_path)
+    for dauer in (1.0, 2.0, 3.0):
+        status.melde('theater_muenster', True, dauer)
+    status.melde('theater_muenster', False, 9.0, '500 Server Error')
+    status.speichere()
+
+    eintrag = _status(tmp_path).daten['theater_muenster']
+    assert eintrag['erfolgsquote'] == 0.75
+    assert eintrag['latenz_p50'] == 2.0
+    assert eintrag['letzter_fehler'] == '500 Server Error'
+    assert eintrag['fehler_in_folge'] == 1
@@ -0,0 +1,60 @@
+"""Tests für den parallelen regioactive-Abruf mit schneller 403-Erkennung."""
+import sys
+import os
+import json
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+
+def _response(text, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = text.encode('utf-8')
+    response.encoding = 'utf-8'
+    return response
+
+
+def _jsonld(name):
+    daten = {'@type': 'Event', 'name': name, 'startDate': '2026-07-10T20:00:00+02:00',
+             'location': {'name': 'Club'}, 'url': 'https://example.org/e'}
+    return f'<script type="application/ld+json">{json.dumps(daten)}</script>'
+
+
+@pytest.fixture(autouse=True)
+def _ohne_drossel_und_pause(monkeypatch):
+    monkeypatch.setattr(scraper, 'HOST_LIMITS', {})
+    monkeypatch.setattr(scraper, 'HOST_LIMIT_STANDARD', (1000, 1000))
+    monkeypatch.setattr(scraper, '_DROSSELN', {})
+    monkeypatch.setattr(scraper.time, 'sleep', lambda s: pytest.fail('Retry-Pause bei 403'))
+
+
+def test_alle_staedte(monkeypatch):
+    monkeypatch.setattr(scraper.requests, 'request', lambda m, url, **kw: _response(_jsonld(url.split('/')[-4])))
+    events = scraper.hole_regioactive_ms(2026, 7)
+    assert len(events) == len(scraper.REGIOACTIVE_STAEDTE)
+    assert {v.stadt for v in events} == {s for _, _, s in scraper.REGIOACTIVE_STAEDTE}
+
+
+def test_403_bricht_restliche_staedte_ab(monkeypatch):
+    aufrufe = []
+
+    def request(method, url, **kwargs):
+        aufrufe.append(url)
+        return _response('Forbidden', status=403)
+
+    monkeypatch.setattr(scraper.requests, 'request', request)
+    assert scraper.hole_regioactive_ms(2026, 7) == []
+    assert len(aufrufe) <= scraper.REGIOACTIVE_PARALLEL
+
+
+def test_challenge_seite_gilt_als_blockiert(monkeypatch):
+    challenge = '<html><head><title>Just a moment...</title></head><body></body></html>'
+    monkeypatch.setattr(scraper.requests, 'request', lambda m, url, **kw: _response(challenge))
+    with pytest.raises(scraper.QuelleBlockiert):
+        scraper._hole_regioactive_stadt(21196, 'muenster', 'Münster', 2026, 7)
+
@@ -0,0 +1,34 @@
+"""Tests für die Aufteilung nach Regionen (regionen.py)."""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from regionen import REGIONEN, WEITERE, kuerzel, region, teile_auf
+from conftest import veranstaltung
+
+
+def test_grossstaedte_eigene_region_sonst_kreis():
+    assert region('Münster') == 'Münster'
+    assert region('Münster-Hiltrup') == 'Münster'
+    assert region('Rheine') == 'Rheine'  # liegt im Kreis Steinfurt, hat aber eine eigene Seite
+    assert region('Gronau') == 'Kreis Borken'
+    assert region('TELGTE') == 'Kreis Warendorf'
+    assert region('Osnabrück') == WEITERE
+    assert region('') == WEITERE
+
+
+def test_kuerzel_fuer_dateinamen():
+    assert kuerzel('Münster') == 'muenster'
+    assert kuerzel('Ibbenbüren') == 'ibbenbueren'
+    assert kuerzel('Kreis Borken') == 'kreis-borken'
+    assert kuerzel(WEITERE) == 'weitere-orte'
+    assert len({kuerzel(r) for r in REGIONEN}) == len(REGIONEN)
+
+
+def test_teile_auf_alle_regionen_in_reihenfolge():
+    events = [veranstaltung(n, 1, s) for n, s in [('A', 'Coesfeld'), ('B', 'Münster'), ('C', 'Dülmen')]]
+    gruppen = teile_auf(events)
+    assert list(gruppen) == REGIONEN
+    assert [v.name for v in gruppen['Kreis Coesfeld']] == ['A', 'C']
+    assert gruppen['Bocholt'] == []
@@ -0,0 +1,138 @@
+"""Tests für den generierten Service Worker (sw.js)."""
+import sys
+import os
+import json
+import shutil
+import subprocess
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service_worker import generiere_service_worker, precache_dateien
+
+
+def _manifest(*dateien):
+    return {'version': 1, 'generiert': '', 'monate': {d: {'sha256': d[-12:]} for d in dateien}}
+
+
+FENSTER = ['veranstaltungen_2026_09.html', 'veranstaltungen_2026_10.html', 'veranstaltungen_2026_11.html']
+
+
+def test_precache_nur_vorhandene_monate_aus_dem_fenster():
+    manifest = _manifest('veranstaltungen_2026_08.html', 'veranstaltungen_2026_10.html')
+    assert precache_dateien(manifest, FENSTER) == ['./', 'index.html', 'manifest.json',
+                                                   'veranstaltungen_2026_10.html']
+
+
+def test_precache_mit_shell_und_monatsdaten():
+    manifest = _manifest('veranstaltungen_2026_10.html')
+    manifest['shell'] = 'dashboard.html'
+    manifest['monate']['veranstaltungen_2026_10.html']['daten'] = 'daten/veranstaltungen_2026_10.json'
+    assert precache_dateien(manifest, FENSTER) == ['./', 'index.html', 'manifest.json', 'dashboard.html',
+                                                   'veranstaltungen_2026_10.html',
+                                                   'daten/veranstaltungen_2026_10.json']
+
+
+def test_version_stabil_solange_inhalt_gleich():
+    manifest = _manifest('veranstaltungen_2026_10.html')
+    assert generiere_service_worker(manifest, FENSTER) == generiere_service_worker(manifest, FENSTER)
+    manifest['monate']['veranstaltungen_2026_10.html']['sha256'] = 'anders'
+    assert generiere_service_worker(manifest, FENSTER) != generiere_service_worker(_manifest(
+        'veranstaltungen_2026_10.html'), FENSTER)
+
+
+# Minimale Service-Worker-Umgebung für node: Cache-API, fetch und Events
+_HARNESS = r'''
+const vm = require('vm');
+const fs = require('fs');
+const basis = 'https://ms.example';
+const netz = JSON.parse(process.argv[3]);
+const speicher = new Map();
+const cache = {
+    addAll: async urls => { for (const u of urls) speicher.set(new URL(u, basis + '/').href, netz[u]); },
+    match: async r => speicher.get(typeof r === 'string' ? new URL(r, basis + '/').href : r.url),
+    put: async (r, antwort) => { speicher.set(r.url, antwort.text); },
+    keys: async () => [...speicher.keys()].map(url => ({url})),
+    delete: async r => speicher.delete(r.url),
+};
+const antwort = text => ({ok: true, text, clone() { return antwort(text); }, json: async () => JSON.parse(text)});
+const handler = {};
+const warten = [];
+const self = {
+    location: new URL(basis + '/'),
+    addEventListener: (typ, fn) => { handler[typ] = fn; },
+    skipWaiting: async () => {},
+    clients: {claim: async () => {}},
+};
+const umgebung = {
+    self, URL, console,
+    caches: {
+        open: async () => cache, keys: async () => ['veranstaltungen-alt'], delete: async () => true,
+        match: async r => { const t = await cache.match(r); return t && antwort(t); },
+    },
+    fetch: async r => {
+        const datei = new URL(r.url).pathname.slice(1);
+        return antwort(datei.endsWith('.json') ? netz[datei] : netz[datei] + ' (frisch)');
+    },
+};
+vm.runInNewContext(fs.readFileSync(process.argv[2], 'utf8'), umgebung);
+const ereignis = extra => Object.assign({waitUntil: p => warten.push(p)}, extra);
+const abruf = async datei => {
+    let ergebnis;
+    handler.fetch(ereignis({request: {url: basis + '/' + datei, method: 'GET'}, respondWith: p => { ergebnis = p; }}));
+    if (!ergebnis) return null;  // am Service Worker vorbei ans Netz
+    const a = await ergebnis;
+    await Promise.all(warten);
+    return typeof a === 'string' ? a : a.text;
+};
+(async () => {
+    handler.install(ereignis({}));
+    await Promise.all(warten);
+    const vorab = [...speicher.keys()].map(u => u.replace(basis + '/', '')).sort();
+    handler.activate(ereignis({}));
+    await Promise.all(warten);
+    const nachAktivieren = [...speicher.keys()].map(u => u.replace(basis + '/', '')).sort();
+    const erste = await abruf('veranstaltungen_2026_10.html');
+    const zweite = await abruf('veranstaltungen_2026_10.html');
+    const vorbei = [];
+    for (const datei of ['veranstaltungen_2026_10_muenster.html', 'veranstaltungen_2026_12.html', 'kalender/alle.ics']) {
+        if (await abruf(datei) === null) vorbei.push(datei);
+    }
+    const nachAbrufen = [...speicher.keys()].map(u => u.replace(basis + '/', '')).sort();
+    netz['manifest.json'] = JSON.stringify({monate: {'veranstaltungen_2026_10.html': {}}});
+    await abruf('manifest.json');
+    const nachManifest = [...speicher.keys()].map(u => u.replace(basis + '/', '')).sort();
+    console.log(JSON.stringify({vorab, nachAktivieren, erste, zweite, vorbei, nachAbrufen, nachManifest}));
+})();
+'''
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='node nicht installiert')
+def test_service_worker_verhalten_in_node(tmp_path):
+    manifest = _manifest('veranstaltungen_2026_09.html', 'veranstaltungen_2026_10.html')
+    sw = tmp_path / 'sw.js'
+    sw.write_text(generiere_service_worker(manifest, FENSTER), encoding='utf-8')
+    harness = tmp_path / 'harness.js'
+    harness.write_text(_HARNESS, encoding='utf-8')
+    netz = {'./': 'index', 'index.html': 'index', 'manifest.json': json.dumps(manifest),
+            'veranstaltungen_2026_09.html': 'september', 'veranstaltungen_2026_10.html': 'oktober',
+            'veranstaltungen_2026_10_muenster.html': 'oktober münster', 'veranstaltungen_2026_12.html': 'dezember',
+            'kalender/alle.ics': 'ics'}
+
+    ausgabe = subprocess.run(['node', str(harness), str(sw), json.dumps(netz)],
+                             capture_output=True, text=True, check=True, timeout=30).stdout
+    ergebnis = json.loads(ausgabe)
+
+    assert ergebnis['vorab'] == ['', 'index.html', 'manifest.json',
+                                 'veranstaltungen_2026_09.html', 'veranstaltungen_2026_10.html']
+    # stale-while-revalidate: erst die gecachte, danach die im Hintergrund aktualisierte Fassung
+    assert ergebnis['erste'] == 'oktober'
+    assert ergebnis['zweite'] == 'oktober (frisch)'
+    # Regionsseite eines Monats im Fenster wird gecacht; Monate außerhalb und Feeds gehen ans Netz
+    assert ergebnis['vorbei'] == ['veranstaltungen_2026_12.html', 'kalender/alle.ics']
+    assert 'veranstaltungen_2026_10_muenster.html' in ergebnis['nachAbrufen']
+    assert not {'veranstaltungen_2026_12.html', 'kalender/alle.ics'} & set(ergebnis['nachAbrufen'])
+    # September fehlt im neuen Manifest (von update.sh gelöscht) und fliegt aus dem Cache
+    assert 'veranstaltungen_2026_09.html' in ergebnis['nachAktivieren']
+    assert 'veranstaltungen_2026_09.html' not in ergebnis['nachManifest']
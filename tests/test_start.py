@@ -0,0 +1,31 @@
+"""Startpfad: Rendern und Deduplizieren ohne Netz- und Parser-Bibliotheken."""
+import sys
+import os
+import subprocess
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import scraper
+
+
+def _geladen_nach(code: str) -> set[str]:
+    pruefung = f"{code}; import sys; print(' '.join(sorted(m for m in ('requests', 'bs4') if m in sys.modules)))"
+    ausgabe = subprocess.run([sys.executable, '-c', pruefung], cwd=REPO_DIR, capture_output=True, text=True,
+                             check=True).stdout
+    return set(ausgabe.split())
+
+
+@pytest.mark.parametrize('modul', ['app', 'scraper', 'quellen'])
+def test_import_laedt_weder_requests_noch_bs4(modul):
+    assert _geladen_nach(f'import {modul}') == set()
+
+
+def test_erst_das_parsen_laedt_bs4():
+    assert _geladen_nach('import scraper; scraper._parse_theater_muenster("<html></html>", 2026, 7)') == {'bs4'}
+
+
+def test_platzhalter_reicht_attribute_durch():
+    assert scraper.requests.RequestException is __import__('requests').RequestException
@@ -4,65 +4,39 @@
 cd "$(dirname "$0")"
 LOGFILE="$(pwd)/launchd.log"
 DATUM=$(date +%Y-%m-%d)
+PYTHON=/Library/Frameworks/Python.framework/Versions/3.14/bin/python3
 
 echo "=========================================="
 echo "Aktualisierung gestartet: $(date)"
 echo "=========================================="
 
-# Alte Event-Anzahl aus bestehenden HTML-Dateien auslesen
-ALTE_ANZAHL=0
-for html in veranstaltungen_*.html; do
-    if [ -f "$html" ]; then
-        # Extrahiere "<span id="termine-count">XXX</span>" aus HTML
-        ANZAHL=$(grep -o '<span id="termine-count">[0-9]*</span>' "$html" | grep -o '[0-9]*' | head -1)
-        ALTE_ANZAHL=$((ALTE_ANZAHL + ANZAHL))
-    fi
-done
+# Alte Event-Anzahl aus manifest.json (app.py pflegt Anzahl, Orte und Hash pro Monatsdatei)
+ALTE_ANZAHL=$($PYTHON manifest.py anzahl)
 
 # Veranstaltungen abrufen
-OUTPUT=$(/Library/Frameworks/Python.framework/Versions/3.14/bin/python3 app.py --no-browser 2>&1)
+OUTPUT=$($PYTHON app.py --no-browser 2>&1)
 echo "$OUTPUT"
 
 # Prüfe auf Fehler (Timeouts, Connection-Errors)
 FEHLER_COUNT=$(echo "$OUTPUT" | grep -c "Fehler beim Abrufen")
 
-# Neue Event-Anzahl aus Output extrahieren (z.B. "→ 467 Veranstaltungen")
-NEUE_ANZAHL=0
-while IFS= read -r line; do
-    ANZAHL=$(echo "$line" | grep -o '[0-9]* Veranstaltungen' | grep -o '[0-9]*' | head -1)
-    if [ -n "$ANZAHL" ]; then
-        NEUE_ANZAHL=$((NEUE_ANZAHL + ANZAHL))
-    fi
-done <<< "$OUTPUT"
-
-# Differenz berechnen
-DIFF=$((NEUE_ANZAHL - ALTE_ANZAHL))
-
 # Alte Monatsdateien aufräumen (Puffer: Vormonat bleibt, alles davor wird gelöscht)
-CUTOFF_JAHR=$(date +%Y)
-CUTOFF_MONAT=$(date +%-m)
-if [ "$CUTOFF_MONAT" -eq 1 ]; then
-    CUTOFF_JAHR=$((CUTOFF_JAHR - 1))
-    CUTOFF_MONAT=12
-else
-    CUTOFF_MONAT=$((CUTOFF_MONAT - 1))
-fi
-CUTOFF=$(printf "%04d_%02d" "$CUTOFF_JAHR" "$CUTOFF_MONAT")
 GELOESCHT=()
-for html in veranstaltungen_*.html; do
-    [ -f "$html" ] || continue
-    DATEI_KEY=$(echo "$html" | grep -o '[0-9]\{4\}_[0-9]\{2\}')
-    if [[ "$DATEI_KEY" < "$CUTOFF" ]]; then
-        echo "Lösche veraltete Datei: $html (älter als Vormonat)"
-        git rm "$html" 2>/dev/null && GELOESCHT+=("$html")
-    fi
+for datei in $($PYTHON manifest.py veraltet); do
+    echo "Lösche veraltete Datei: $datei (älter als Vormonat)"
+    git rm "$datei" 2>/dev/null && GELOESCHT+=("$datei")
 done
+[ ${#GELOESCHT[@]} -gt 0 ] && $PYTHON manifest.py entferne "${GELOESCHT[@]}"
+
+# Neue Event-Anzahl und Differenz aus dem aktualisierten Manifest
+NEUE_ANZAHL=$($PYTHON manifest.py anzahl)
+DIFF=$((NEUE_ANZAHL - ALTE_ANZAHL))
 
 # Zu GitHub pushen (nur wenn Änderungen vorhanden)
 PUSH_STATUS=""
 HAT_AENDERUNGEN=false
-git diff --quiet veranstaltungen_*.html 2>/dev/null || HAT_AENDERUNGEN=true
-[ -n "$(git ls-files -o --exclude-standard veranstaltungen_*.html 2>/dev/null)" ] && HAT_AENDERUNGEN=true
+git diff --quiet veranstaltungen_*.html manifest.json sw.js dashboard.html daten kalender 2>/dev/null || HAT_AENDERUNGEN=true
+[ -n "$(git ls-files -o --exclude-standard veranstaltungen_*.html manifest.json sw.js dashboard.html daten kalender 2>/dev/null)" ] && HAT_AENDERUNGEN=true
 git diff --cached --quiet 2>/dev/null || HAT_AENDERUNGEN=true
 
 if [ "$HAT_AENDERUNGEN" = false ]; then
@@ -70,7 +44,9 @@ if [ "$HAT_AENDERUNGEN" = false ]; then
     PUSH_STATUS="Keine Änderungen"
 else
     echo "Änderungen gefunden - pushe zu GitHub..."
-    git add veranstaltungen_*.html index.html 2>/dev/null
+    git add veranstaltungen_*.html index.html manifest.json sw.js 2>/dev/null
+    git add dashboard.html daten 2>/dev/null  # Shell, falls von Hand mit app.py --shell erzeugt
+    git add kalender 2>/dev/null  # iCal-Feeds (Teilstücke in kalender/.teile sind ignoriert)
     COMMIT_MSG="Veranstaltungen aktualisiert $DATUM"
     [ ${#GELOESCHT[@]} -gt 0 ] && COMMIT_MSG="$COMMIT_MSG (${#GELOESCHT[@]} alte Datei(en) gelöscht)"
     git commit -m "$COMMIT_MSG" 2>&1
@@ -94,11 +70,11 @@ if [ $FEHLER_COUNT -gt 0 ]; then
     SOUND="Basso"
 elif [ $DIFF -gt 0 ]; then
     TITEL="✅ Veranstaltungen aktualisiert"
-    TEXT="$NEUE_ANZAHL Events (+${DIFF} neu)"
+    TEXT="$NEUE_ANZAHL Events (+${DIFF})"
     SOUND="Glass"
 elif [ $DIFF -lt 0 ]; then
     TITEL="✅ Veranstaltungen aktualisiert"
-    TEXT="$NEUE_ANZAHL Events (${DIFF} weniger)"
+    TEXT="$NEUE_ANZAHL Events (${DIFF})"
     SOUND="Glass"
 else
     TITEL="✅ Veranstaltungen aktualisiert"
@@ -106,6 +82,9 @@ else
     SOUND="Glass"
 fi
 
+# Neu/entfallen/geändert seit dem letzten Lauf (Fingerabdrücke, siehe aenderungen.py)
+TEXT="$TEXT | $($PYTHON aenderungen.py kurz)"
+
 # Push-Status anhängen
 if [ -n "$PUSH_STATUS" ]; then
     TEXT="$TEXT | $PUSH_STATUS"